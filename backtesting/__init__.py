@@ -6,6 +6,9 @@ This module provides backtesting and validation frameworks for the ATLAS trading
 Modules:
     backtest_engine: VectorBT Pro wrapper for strategy backtesting
     walk_forward: Walk-forward analysis for out-of-sample validation
+    monte_carlo: Trade-bootstrap Monte Carlo for robustness testing
+    purged_cv: Combinatorial purged cross-validation
+    workers: Shared process-pool and strategy-copy helpers for the engines
     report_generator: Performance reporting and visualization
 
 Validation Methodology:
@@ -15,8 +18,18 @@ Validation Methodology:
     - Transaction cost analysis for high-frequency strategies
 """
 
+from .backtest_engine import BacktestEngine, BacktestJob, ResultCache
+from .walk_forward import WalkForwardValidator, WALK_FORWARD_CONFIG
+from .monte_carlo import MonteCarloSimulator
+from .purged_cv import CombinatorialPurgedCV
+
 __all__ = [
     'BacktestEngine',
+    'BacktestJob',
+    'ResultCache',
     'WalkForwardValidator',
+    'WALK_FORWARD_CONFIG',
+    'MonteCarloSimulator',
+    'CombinatorialPurgedCV',
     'ReportGenerator',
 ]
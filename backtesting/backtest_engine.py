@@ -9,8 +9,299 @@ Key Features:
     - Transaction cost modeling (fees + slippage)
     - Multi-timeframe data handling
 
-Implementation Status: Placeholder - to be implemented in Phase 1.5
+Job Scheduling:
+    - Batches of (strategy config, symbol, date range) jobs in one call
+    - Identical jobs are deduplicated and run once
+    - Unique jobs run across a local process pool
+    - Results are stored in a content-addressed cache (key = hash of the job
+      definition), so re-running an unchanged job is a file read
+
+Cache Keys:
+    Strategy class, config JSON (after applying symbol/date range), initial
+    capital and the engine's data_version. Market data is not hashed (fetching
+    it is what the cache avoids); bump data_version after data corrections.
+
+Usage:
+    >>> engine = BacktestEngine(cache_dir='.cache/backtests', max_workers=8)
+    >>> jobs = [
+    ...     BacktestJob(strategy_cls=ORBStrategy, config=ORBConfig(name="ORB"),
+    ...                 symbol=s, start_date="2024-01-01", end_date="2024-06-30")
+    ...     for s in ['NVDA', 'PLTR', 'HOOD']
+    ... ]
+    >>> results = engine.run(jobs)
+    >>> results[['symbol', 'total_return', 'sharpe_ratio', 'cached']]
+
+Reference: docs/SYSTEM_ARCHITECTURE/3_CORE_COMPONENTS_RISK_MANAGEMENT_AND_BACKTESTING_REQUIREMENTS.md
 """
 
-# TODO: Implement BacktestEngine (Phase 1.5)
-# See docs/SYSTEM_ARCHITECTURE/3_CORE_COMPONENTS_RISK_MANAGEMENT_AND_BACKTESTING_REQUIREMENTS.md
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Union
+
+import pandas as pd
+from pydantic import BaseModel, ConfigDict
+
+
+class BacktestJob(BaseModel):
+    """
+    One backtest: strategy class + config, optionally for a symbol/date range.
+
+    symbol, start_date and end_date are written into the config when it has
+    those fields (e.g., ORBConfig). They are always part of the job key and
+    are passed to custom data loaders.
+
+    Attributes:
+        strategy_cls: BaseStrategy subclass
+        config: Pydantic config for strategy_cls
+        symbol: Optional symbol override
+        start_date: Optional start date override (YYYY-MM-DD)
+        end_date: Optional end date override (YYYY-MM-DD)
+        initial_capital: Starting capital
+    """
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    strategy_cls: type
+    config: Any
+    symbol: Optional[str] = None
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    initial_capital: float = 10000.0
+
+    def resolved_config(self):
+        """Config with symbol/date overrides applied (validated)."""
+        fields = type(self.config).model_fields
+        updates = {
+            name: value
+            for name, value in (('symbol', self.symbol),
+                                ('start_date', self.start_date),
+                                ('end_date', self.end_date))
+            if value is not None and name in fields
+        }
+        if not updates:
+            return self.config
+        return type(self.config).model_validate({**self.config.model_dump(), **updates})
+
+    def key(self, data_version: str = '') -> str:
+        """Content address of this job (hex digest)."""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{self.strategy_cls.__module__}.{self.strategy_cls.__qualname__}".encode())
+        h.update(self.resolved_config().model_dump_json().encode())
+        h.update(repr((self.symbol, self.start_date, self.end_date,
+                       float(self.initial_capital), data_version)).encode())
+        return h.hexdigest()
+
+
+class ResultCache:
+    """
+    Content-addressed on-disk store for backtest result records.
+
+    One pickle file per key, written atomically (temp file + rename) so
+    concurrent engines sharing a directory never read partial results.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        """
+        Initialize result cache.
+
+        Args:
+            cache_dir: Directory for result files (created if missing)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the stored record for key, or None."""
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def put(self, key: str, record: Dict) -> None:
+        """Store a record under key."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(record, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def clear(self) -> None:
+        """Delete all stored results."""
+        for path in self.cache_dir.glob('*.pkl'):
+            path.unlink()
+
+    def __contains__(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.cache_dir.glob('*.pkl'))
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pkl"
+
+
+def load_strategy_data(strategy, job: BacktestJob) -> pd.DataFrame:
+    """
+    Default data loader: the strategy's own fetch_data().
+
+    Strategies returning (intraday, daily) tuples (ORB) keep the daily bars
+    on the instance; the first element is backtested.
+    """
+    if not hasattr(strategy, 'fetch_data'):
+        raise ValueError(
+            f"{type(strategy).__name__} has no fetch_data(); pass data_loader to BacktestEngine"
+        )
+    data = strategy.fetch_data()
+    return data[0] if isinstance(data, tuple) else data
+
+
+def _execute_job(job: BacktestJob, data_loader: Callable) -> Dict:
+    """
+    Process-pool worker: build strategy, load data, run backtest_metrics().
+
+    Errors are returned in the record so one job never stops the batch.
+    """
+    start = time.perf_counter()
+    record: Dict = {'error': None}
+
+    try:
+        strategy = job.strategy_cls(job.resolved_config())
+        data = data_loader(strategy, job)
+        if len(data) == 0:
+            raise ValueError("no data for job")
+        record.update(strategy.backtest_metrics(data, initial_capital=job.initial_capital))
+        record['bars'] = len(data)
+    except Exception as e:
+        record['error'] = f"{e}\n{traceback.format_exc()}"
+
+    record['elapsed'] = time.perf_counter() - start
+    return record
+
+
+class BacktestEngine:
+    """
+    Batch backtest scheduler with deduplication and a result cache.
+
+    Attributes:
+        cache: ResultCache (None = no persistence)
+        max_workers: Process pool size (None = CPU count, 1 = in-process)
+        data_loader: Callable (strategy, job) -> OHLCV DataFrame
+        data_version: Extra cache key component (bump to invalidate results)
+        executed: Jobs actually run by the last run() call
+        cache_hits: Jobs served from the cache by the last run() call
+
+    Example:
+        >>> engine = BacktestEngine(cache_dir='.cache/backtests')
+        >>> results = engine.run(jobs)          # runs every unique job
+        >>> results = engine.run(jobs)          # instant: all cached
+        >>> engine.cache_hits == results['key'].nunique()
+        True
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_workers: Optional[int] = None,
+        data_loader: Callable = load_strategy_data,
+        data_version: str = ''
+    ):
+        """
+        Initialize backtest engine.
+
+        Args:
+            cache_dir: Directory for the result cache (None disables it)
+            max_workers: Process pool size (None = CPU count, 1 = in-process)
+            data_loader: Callable (strategy, job) -> DataFrame; must be
+                picklable (module-level) when running in a process pool
+            data_version: String mixed into every job key
+        """
+        self.cache = ResultCache(cache_dir) if cache_dir is not None else None
+        self.max_workers = max_workers
+        self.data_loader = data_loader
+        self.data_version = data_version
+        self.executed = 0
+        self.cache_hits = 0
+
+    def run(self, jobs: Sequence[BacktestJob], use_cache: bool = True) -> pd.DataFrame:
+        """
+        Run a batch of jobs (deduplicated, cached, parallel).
+
+        Args:
+            jobs: BacktestJob instances (duplicates allowed)
+            use_cache: Read cached results (new results are always stored)
+
+        Returns:
+            DataFrame with one row per input job (input order): strategy,
+            symbol, start_date, end_date, initial_capital, key, cached,
+            error, elapsed and all backtest_metrics() keys.
+            Failed jobs have error set and are not cached.
+        """
+        keys = [job.key(self.data_version) for job in jobs]
+
+        # 1. Deduplicate
+        unique: Dict[str, BacktestJob] = {}
+        for key, job in zip(keys, jobs):
+            unique.setdefault(key, job)
+
+        # 2. Cache lookups
+        records: Dict[str, Dict] = {}
+        if self.cache is not None and use_cache:
+            for key in unique:
+                cached = self.cache.get(key)
+                if cached is not None:
+                    records[key] = dict(cached, cached=True)
+        self.cache_hits = len(records)
+
+        # 3. Run the rest
+        pending = [key for key in unique if key not in records]
+        self.executed = len(pending)
+
+        print(f"BacktestEngine: {len(jobs)} jobs, {len(unique)} unique, "
+              f"{self.cache_hits} cached, {len(pending)} to run")
+
+        if pending:
+            pending_jobs = [unique[key] for key in pending]
+            if self.max_workers == 1 or len(pending) == 1:
+                outputs = [_execute_job(job, self.data_loader) for job in pending_jobs]
+            else:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                    outputs = list(executor.map(
+                        _execute_job, pending_jobs, [self.data_loader] * len(pending_jobs)
+                    ))
+
+            for key, record in zip(pending, outputs):
+                if record['error'] is None and self.cache is not None:
+                    self.cache.put(key, record)
+                records[key] = dict(record, cached=False)
+
+                if record['error'] is not None:
+                    job = unique[key]
+                    print(f"[ERROR] {job.strategy_cls.__name__} {job.symbol or ''}: "
+                          f"{record['error'].splitlines()[0]}")
+
+        # 4. Fan results back out to every input job
+        rows = []
+        for key, job in zip(keys, jobs):
+            rows.append({
+                'strategy': job.strategy_cls.__name__,
+                'symbol': job.symbol,
+                'start_date': job.start_date,
+                'end_date': job.end_date,
+                'initial_capital': job.initial_capital,
+                'key': key,
+                **records[key],
+            })
+
+        return pd.DataFrame(rows)
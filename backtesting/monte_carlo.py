@@ -0,0 +1,306 @@
+"""
+Monte Carlo Trade Bootstrap - Robustness Testing
+
+Resamples a strategy's trade sequence into many alternative equity paths to
+answer "how bad could it have been with the same edge?":
+
+- Drawdown distribution (max drawdown per path)
+- Sharpe distribution (per-trade Sharpe, optionally annualized)
+- Ruin probability (equity falls to a loss limit at any point)
+- Equity paths for RiskManager.evaluate_equity_paths() (circuit-breaker
+  ladder stress test)
+
+Resampling (one compiled kernel, no per-path Python):
+- block_size=1: i.i.d. bootstrap of trades
+- block_size>1: circular block bootstrap (keeps streaks / serial
+  correlation of up to block_size consecutive trades)
+
+Input is either trade returns on account equity (decimal per trade) or
+R-multiples with a fixed risk fraction (each trade changes equity by
+R x risk_pct, i.e. fixed-fractional ATR sizing).
+
+Usage:
+    >>> mc = MonteCarloSimulator(n_paths=100_000, block_size=5, seed=42)
+    >>> result = mc.run(r_multiples=trades['r_multiple'], risk_pct=0.02)
+    >>> print(result['summary'])
+    >>> print(f"Ruin probability: {result['ruin_probability']:.2%}")
+    >>> stress = mc.stress_test_circuit_breakers(RiskManager(), r_multiples=r)
+    >>> print(stress['circuit_breakers']['crossing_probability'])
+
+Reference: docs/SYSTEM_ARCHITECTURE/3_CORE_COMPONENTS_RISK_MANAGEMENT_AND_BACKTESTING_REQUIREMENTS.md
+"""
+
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from numba import njit
+
+
+# Percentiles reported in the summary table
+SUMMARY_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+@njit(cache=True)
+def bootstrap_paths_nb(
+    step_returns: np.ndarray,
+    n_paths: int,
+    n_steps: int,
+    block_size: int,
+    ruin_equity: float,
+    seed: int,
+    store_paths: bool
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Resample trades into equity paths and reduce each path in the same pass.
+
+    Equity starts at 1.0 and compounds: equity *= 1 + step_return.
+
+    Args:
+        step_returns: Per-trade equity returns (decimal, no NaN)
+        n_paths: Number of simulated paths
+        n_steps: Trades per path
+        block_size: Consecutive trades per block (1 = i.i.d.)
+        ruin_equity: Path is ruined if equity <= this level (fraction of start)
+        seed: RNG seed (numba RNG)
+        store_paths: Also return the (n_steps + 1, n_paths) equity matrix
+
+    Returns:
+        (paths, final_equity, max_drawdown, mean_return, std_return, ruined);
+        paths has shape (0, 0) when store_paths is False
+    """
+    np.random.seed(seed)
+    n_trades = step_returns.shape[0]
+
+    if store_paths:
+        paths = np.empty((n_steps + 1, n_paths))
+    else:
+        paths = np.empty((0, 0))
+    final_equity = np.empty(n_paths)
+    max_drawdown = np.empty(n_paths)
+    mean_return = np.empty(n_paths)
+    std_return = np.empty(n_paths)
+    ruined = np.zeros(n_paths, dtype=np.bool_)
+
+    for p in range(n_paths):
+        equity = 1.0
+        peak = 1.0
+        mdd = 0.0
+        total = 0.0
+        total_sq = 0.0
+        start = 0
+        if store_paths:
+            paths[0, p] = 1.0
+
+        for i in range(n_steps):
+            offset = i % block_size
+            if offset == 0:
+                start = np.random.randint(0, n_trades)
+            r = step_returns[(start + offset) % n_trades]
+
+            total += r
+            total_sq += r * r
+            equity *= 1.0 + r
+            if equity < 0.0:
+                equity = 0.0
+
+            if equity > peak:
+                peak = equity
+            dd = (peak - equity) / peak
+            if dd > mdd:
+                mdd = dd
+            if equity <= ruin_equity:
+                ruined[p] = True
+            if store_paths:
+                paths[i + 1, p] = equity
+
+        mean = total / n_steps
+        final_equity[p] = equity
+        max_drawdown[p] = mdd
+        mean_return[p] = mean
+        if n_steps > 1:
+            var = (total_sq - n_steps * mean * mean) / (n_steps - 1)
+            std_return[p] = np.sqrt(max(var, 0.0))
+        else:
+            std_return[p] = np.nan
+
+    return paths, final_equity, max_drawdown, mean_return, std_return, ruined
+
+
+class MonteCarloSimulator:
+    """
+    Trade-bootstrap Monte Carlo for drawdown, Sharpe and ruin distributions.
+
+    Attributes:
+        n_paths: Number of simulated paths
+        block_size: Trades per bootstrap block (1 = i.i.d.)
+        ruin_loss: Loss of starting equity that counts as ruin (0.5 = -50%)
+        trades_per_year: Annualization factor for Sharpe (None = per trade)
+        seed: RNG seed (None = random)
+
+    Example:
+        >>> # Trade P&L over account equity before the trade (pf.trades.returns
+        >>> # is relative to position notional, not to the account)
+        >>> trades = pf.trades.records_arr
+        >>> equity_before = pf.value.shift(1).fillna(pf.init_cash).to_numpy()
+        >>> trade_returns = trades['pnl'] / equity_before[trades['entry_idx']]
+        >>> mc = MonteCarloSimulator(n_paths=50_000, trades_per_year=120)
+        >>> result = mc.run(trade_returns=trade_returns)
+        >>> np.percentile(result['max_drawdown'], 95)
+        0.183
+    """
+
+    def __init__(
+        self,
+        n_paths: int = 10000,
+        block_size: int = 1,
+        ruin_loss: float = 0.50,
+        trades_per_year: Optional[float] = None,
+        seed: Optional[int] = None
+    ):
+        """
+        Initialize Monte Carlo simulator.
+
+        Args:
+            n_paths: Number of simulated paths
+            block_size: Trades per bootstrap block (1 = i.i.d. resampling)
+            ruin_loss: Fraction of starting equity lost that counts as ruin
+            trades_per_year: Trades per year for annualized Sharpe
+                (None = per-trade Sharpe)
+            seed: RNG seed for reproducible paths
+
+        Raises:
+            ValueError: If n_paths or block_size < 1, or ruin_loss not in (0, 1]
+        """
+        if n_paths < 1:
+            raise ValueError(f"n_paths must be >= 1, got {n_paths}")
+        if block_size < 1:
+            raise ValueError(f"block_size must be >= 1, got {block_size}")
+        if not 0 < ruin_loss <= 1:
+            raise ValueError(f"ruin_loss must be in (0, 1], got {ruin_loss}")
+
+        self.n_paths = n_paths
+        self.block_size = block_size
+        self.ruin_loss = ruin_loss
+        self.trades_per_year = trades_per_year
+        self.seed = seed
+
+    def run(
+        self,
+        trade_returns: Optional[Union[np.ndarray, pd.Series]] = None,
+        r_multiples: Optional[Union[np.ndarray, pd.Series]] = None,
+        risk_pct: float = 0.02,
+        n_trades: Optional[int] = None,
+        initial_capital: float = 10000.0,
+        return_paths: bool = False
+    ) -> Dict:
+        """
+        Simulate bootstrapped equity paths.
+
+        Exactly one of trade_returns / r_multiples must be given. NaN trades
+        are dropped.
+
+        Args:
+            trade_returns: Per-trade return on account equity (decimal):
+                pnl / equity before the trade, not pf.trades.returns
+            r_multiples: Per-trade R-multiples (pnl / initial risk)
+            risk_pct: Equity risked per trade when using r_multiples
+            n_trades: Trades per path (default: number of input trades)
+            initial_capital: Starting equity for the returned paths
+            return_paths: Include the (n_trades + 1, n_paths) equity matrix
+                (memory: 8 bytes x steps x paths)
+
+        Returns:
+            Dictionary containing:
+            - 'final_return': array (paths,) of total return per path
+            - 'max_drawdown': array (paths,) of max drawdown per path
+            - 'sharpe_ratio': array (paths,) of Sharpe per path
+            - 'ruined': bool array (paths,)
+            - 'ruin_probability': share of ruined paths
+            - 'summary': DataFrame of percentiles per distribution
+            - 'equity_paths': ndarray (only if return_paths)
+
+        Raises:
+            ValueError: If inputs are missing/ambiguous or fewer than 2 trades
+        """
+        step_returns = self._step_returns(trade_returns, r_multiples, risk_pct)
+        n_steps = len(step_returns) if n_trades is None else n_trades
+        if n_steps < 1:
+            raise ValueError(f"n_trades must be >= 1, got {n_steps}")
+
+        seed = self.seed if self.seed is not None else np.random.randint(0, 2**31 - 1)
+
+        paths, final_equity, max_drawdown, mean_ret, std_ret, ruined = bootstrap_paths_nb(
+            step_returns, self.n_paths, n_steps, self.block_size,
+            1.0 - self.ruin_loss, seed, return_paths
+        )
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sharpe = np.where(std_ret > 0, mean_ret / std_ret, np.nan)
+        if self.trades_per_year is not None:
+            sharpe = sharpe * np.sqrt(self.trades_per_year)
+
+        final_return = final_equity - 1.0
+        result = {
+            'final_return': final_return,
+            'max_drawdown': max_drawdown,
+            'sharpe_ratio': sharpe,
+            'ruined': ruined,
+            'ruin_probability': float(ruined.mean()),
+            'summary': pd.DataFrame(
+                {
+                    name: np.nanpercentile(values, SUMMARY_PERCENTILES)
+                    for name, values in (('final_return', final_return),
+                                         ('max_drawdown', max_drawdown),
+                                         ('sharpe_ratio', sharpe))
+                },
+                index=pd.Index([f"p{q}" for q in SUMMARY_PERCENTILES], name='percentile')
+            ),
+        }
+        if return_paths:
+            result['equity_paths'] = paths * initial_capital
+
+        return result
+
+    def stress_test_circuit_breakers(self, risk_manager, **run_kwargs) -> Dict:
+        """
+        Run the bootstrap and evaluate the RiskManager threshold ladder on
+        every simulated path.
+
+        The paths are unmanaged (circuit-breaker size reductions are not fed
+        back into later trades), so crossing probabilities are an upper bound
+        for the managed account.
+
+        Args:
+            risk_manager: RiskManager whose drawdown_thresholds are evaluated
+            **run_kwargs: Passed to run() (return_paths is forced on)
+
+        Returns:
+            run() result plus 'circuit_breakers': the dict returned by
+            RiskManager.evaluate_equity_paths()
+
+        Note:
+            evaluate_equity_paths() returns (time x paths) frames; keep
+            n_paths in the tens of thousands for this call.
+        """
+        result = self.run(**dict(run_kwargs, return_paths=True))
+        result['circuit_breakers'] = risk_manager.evaluate_equity_paths(result['equity_paths'])
+        return result
+
+    @staticmethod
+    def _step_returns(trade_returns, r_multiples, risk_pct) -> np.ndarray:
+        """Validate input and convert to per-trade equity returns."""
+        if (trade_returns is None) == (r_multiples is None):
+            raise ValueError("Provide exactly one of trade_returns or r_multiples")
+
+        if r_multiples is not None:
+            if risk_pct <= 0:
+                raise ValueError(f"risk_pct must be positive, got {risk_pct}")
+            values = np.asarray(r_multiples, dtype=np.float64) * risk_pct
+        else:
+            values = np.asarray(trade_returns, dtype=np.float64)
+
+        values = values[~np.isnan(values)]
+        if len(values) < 2:
+            raise ValueError(f"Need at least 2 trades, got {len(values)}")
+        return np.ascontiguousarray(values)
@@ -0,0 +1,424 @@
+"""
+Combinatorial Purged Cross-Validation (CPCV)
+
+Complements walk-forward analysis with a distribution of out-of-sample
+results instead of a single in-sample/out-of-sample split.
+
+Method (Lopez de Prado, Advances in Financial Machine Learning, ch. 7 & 12):
+    1. Split the bars into N contiguous groups
+    2. Every combination of k groups is one test set (C(N, k) splits);
+       the remaining groups are the training set
+    3. Purge: drop training bars whose labels overlap a test block (bar i's
+       label resolves at label_end[i], e.g., i + holding period)
+    4. Embargo: drop training bars right after each test block
+    5. Each group is tested in C(N-1, k-1) splits, which combine into
+       C(N-1, k-1) full backtest paths
+
+Performance Design:
+    - Folds are stored as contiguous (start, stop) segments and int64 index
+      arrays built from group boundaries (no per-fold masks over the data)
+    - The dataset is shipped once per worker process (pool initializer);
+      every segment is a positional .iloc slice (view), so memory does not
+      grow with the number of combinations
+    - Splits run in a process pool; per worker, backtests of the same
+      (segment, parameters) are memoized, since each test group recurs in
+      many splits
+
+Usage:
+    >>> cv = CombinatorialPurgedCV(n_groups=6, n_test_groups=2, label_horizon=1)
+    >>> results = cv.run(strategy, data_daily,
+    ...                  param_grid={'atr_stop_multiplier': [2.0, 2.5, 3.0]})
+    >>> summary = cv.summarize(results)
+    >>> summary['path_metrics']
+
+Reference: backtesting/walk_forward.py
+"""
+
+import itertools
+import traceback
+from math import comb
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from backtesting.workers import (
+    WORKER_STATE,
+    metric_value,
+    report_errors,
+    run_tasks,
+    strategy_with_params,
+)
+
+
+Segment = Tuple[int, int]
+
+
+def _segment_metrics(params: Dict, segment: Segment, capital: float) -> Dict:
+    """backtest_metrics() on one contiguous segment (memoized per worker)."""
+    memo = WORKER_STATE['memo']
+    key = (tuple(sorted(params.items())), segment, capital)
+    metrics = memo.get(key)
+    if metrics is None:
+        strategy = strategy_with_params(WORKER_STATE['strategy'], params)
+        metrics = strategy.backtest_metrics(
+            WORKER_STATE['data'].iloc[segment[0]:segment[1]], initial_capital=capital
+        )
+        memo[key] = metrics
+    return metrics
+
+
+def _run_split(task: Dict) -> Dict:
+    """
+    Process-pool worker: choose parameters on the train segments, evaluate
+    them on each test group.
+
+    Errors are returned in the record so one split never stops the run.
+    """
+    metric = task['metric']
+    capital = task['initial_capital']
+    record = {'split': task['split'], 'test_groups': task['test_groups'], 'error': None}
+
+    try:
+        # 1. In-sample: mean metric over the purged train segments
+        train_segments = [s for s in task['train'] if s[1] > s[0]]
+        scores = []
+        for params in task['param_sets']:
+            values = [metric_value(_segment_metrics(params, s, capital), metric)
+                      for s in train_segments]
+            scores.append(np.nanmean(values) if not np.isnan(values).all() else np.nan)
+        scores = np.array(scores, dtype=np.float64)
+        best = int(np.nanargmax(scores)) if not np.isnan(scores).all() else 0
+        params = task['param_sets'][best]
+
+        # 2. Out-of-sample: every test group separately
+        group_scores = {}
+        returns, trades = [], 0
+        for group, segment in zip(task['test_groups'], task['test']):
+            metrics = _segment_metrics(params, segment, capital)
+            group_scores[group] = metric_value(metrics, metric)
+            returns.append(metrics.get('total_return', np.nan))
+            trades += int(metrics.get('total_trades', 0))
+
+        record.update({
+            **{f"param_{k}": v for k, v in params.items()},
+            f"train_{metric}": float(scores[best]),
+            f"test_{metric}": float(np.nanmean(list(group_scores.values())))
+            if not np.isnan(list(group_scores.values())).all() else np.nan,
+            'test_return': float(np.nansum(returns)),
+            'test_trades': trades,
+            'group_scores': group_scores,
+        })
+
+    except Exception as e:
+        record['error'] = f"{e}\n{traceback.format_exc()}"
+
+    return record
+
+
+class CombinatorialPurgedCV:
+    """
+    Combinatorial purged, embargoed cross-validation over one dataset.
+
+    Attributes:
+        n_groups: Number of contiguous groups (N)
+        n_test_groups: Groups per test set (k)
+        label_horizon: Bars until a label resolves (purge width) when no
+            label_end array is given
+        embargo_pct: Embargo after each test block as a fraction of all bars
+        metric: Metric used for selection and reporting
+
+    Example:
+        >>> cv = CombinatorialPurgedCV(n_groups=6, n_test_groups=2)
+        >>> cv.n_splits, cv.n_paths
+        (15, 5)
+        >>> for train_idx, test_idx in cv.split(len(data)):
+        ...     model.fit(X[train_idx]); model.score(X[test_idx])
+    """
+
+    def __init__(
+        self,
+        n_groups: int = 6,
+        n_test_groups: int = 2,
+        label_horizon: int = 0,
+        embargo_pct: float = 0.01,
+        metric: str = 'sharpe_ratio',
+        max_workers: Optional[int] = None,
+        cache_entries: int = 64,
+        cache_dir: Optional[str] = None
+    ):
+        """
+        Initialize combinatorial purged CV.
+
+        Args:
+            n_groups: Number of contiguous groups N (>= 2)
+            n_test_groups: Test groups per split k (1 <= k < N)
+            label_horizon: Bars between a bar and its label's resolution
+                (0 = labels resolve on the same bar, nothing purged)
+            embargo_pct: Fraction of all bars embargoed after each test block
+            metric: Metric to select parameters and report (backtest_metrics() key)
+            max_workers: Process pool size (None = CPU count, 1 = in-process)
+            cache_entries: Signal cache size per worker (0 disables caching)
+            cache_dir: Optional persistent signal cache directory
+
+        Raises:
+            ValueError: If the group settings are inconsistent or
+                label_horizon / embargo_pct are negative
+        """
+        if n_groups < 2 or not 1 <= n_test_groups < n_groups:
+            raise ValueError(
+                f"Need n_groups >= 2 and 1 <= n_test_groups < n_groups. "
+                f"Got {n_groups}, {n_test_groups}"
+            )
+        if label_horizon < 0 or embargo_pct < 0:
+            raise ValueError(
+                f"label_horizon and embargo_pct must be non-negative. "
+                f"Got {label_horizon}, {embargo_pct}"
+            )
+
+        self.n_groups = n_groups
+        self.n_test_groups = n_test_groups
+        self.label_horizon = label_horizon
+        self.embargo_pct = embargo_pct
+        self.metric = metric
+        self.max_workers = max_workers
+        self.cache_entries = cache_entries
+        self.cache_dir = cache_dir
+
+    @property
+    def n_splits(self) -> int:
+        """Number of train/test splits, C(N, k)."""
+        return comb(self.n_groups, self.n_test_groups)
+
+    @property
+    def n_paths(self) -> int:
+        """Number of backtest paths, C(N-1, k-1)."""
+        return comb(self.n_groups - 1, self.n_test_groups - 1)
+
+    def group_bounds(self, n_bars: int) -> np.ndarray:
+        """
+        Group boundaries (group g is [bounds[g], bounds[g + 1])).
+
+        Raises:
+            ValueError: If there are fewer bars than groups
+        """
+        if n_bars < self.n_groups:
+            raise ValueError(f"Need at least {self.n_groups} bars, got {n_bars}")
+        return np.linspace(0, n_bars, self.n_groups + 1).astype(np.int64)
+
+    def test_combinations(self) -> np.ndarray:
+        """Test group ids per split, int array (n_splits, k), lexicographic."""
+        return np.array(
+            list(itertools.combinations(range(self.n_groups), self.n_test_groups)),
+            dtype=np.int64
+        )
+
+    def fold_segments(
+        self,
+        n_bars: int,
+        label_end: Optional[np.ndarray] = None
+    ) -> List[Dict]:
+        """
+        Purged and embargoed folds as contiguous (start, stop) segments.
+
+        Args:
+            n_bars: Number of bars in the dataset
+            label_end: Optional bar position at which each bar's label
+                resolves (>= own position). Made non-decreasing before use.
+                Default: position + label_horizon.
+
+        Returns:
+            List (one per split) of dicts with 'test_groups' (tuple),
+            'test' (one segment per test group) and 'train' (merged purged
+            segments)
+        """
+        bounds = self.group_bounds(n_bars)
+        positions = np.arange(n_bars, dtype=np.int64)
+        if label_end is None:
+            label_end = positions + self.label_horizon
+        else:
+            label_end = np.maximum.accumulate(np.maximum(np.asarray(label_end, dtype=np.int64),
+                                                         positions))
+        embargo = int(np.ceil(self.embargo_pct * n_bars))
+
+        folds = []
+        for groups in self.test_combinations():
+            test = [(int(bounds[g]), int(bounds[g + 1])) for g in groups]
+
+            # Merge adjacent test groups into blocks
+            blocks = []
+            for start, stop in test:
+                if blocks and blocks[-1][1] == start:
+                    blocks[-1] = (blocks[-1][0], stop)
+                else:
+                    blocks.append((start, stop))
+
+            # Train = complement of [purge_start, stop + embargo) per block
+            train = []
+            cursor = 0
+            for start, stop in blocks:
+                purge_start = int(np.searchsorted(label_end, start, side='left'))
+                if purge_start > cursor:
+                    train.append((cursor, purge_start))
+                cursor = max(cursor, min(stop + embargo, n_bars))
+            if cursor < n_bars:
+                train.append((cursor, n_bars))
+
+            folds.append({'test_groups': tuple(int(g) for g in groups),
+                          'test': test, 'train': train})
+        return folds
+
+    def split(
+        self,
+        n_bars: int,
+        label_end: Optional[np.ndarray] = None
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Yield (train_idx, test_idx) int64 position arrays (sklearn style).
+
+        Args:
+            n_bars: Number of bars in the dataset
+            label_end: Optional label resolution positions (see fold_segments())
+        """
+        for fold in self.fold_segments(n_bars, label_end):
+            yield _segments_to_index(fold['train']), _segments_to_index(fold['test'])
+
+    def run(
+        self,
+        strategy,
+        data: pd.DataFrame,
+        param_grid: Optional[Dict[str, List]] = None,
+        initial_capital: float = 10000.0,
+        label_end: Optional[np.ndarray] = None
+    ) -> pd.DataFrame:
+        """
+        Run every split against a strategy.
+
+        Per split: each parameter set is backtested on every train segment
+        (mean metric), the best one is backtested on every test group.
+
+        Args:
+            strategy: BaseStrategy instance (parameter sets are applied as
+                config updates on copies of it)
+            data: OHLCV DataFrame (loaded once by the caller)
+            param_grid: Dict of config field -> candidate values (Cartesian
+                product). None/empty = evaluate the current config only.
+            initial_capital: Starting capital for every segment backtest
+            label_end: Optional label resolution positions (see fold_segments())
+
+        Returns:
+            DataFrame with one row per split: split, test_groups, chosen
+            parameters (param_*), train/test metric, test_return (sum over
+            groups), test_trades, group_scores (dict group -> metric) and
+            error (None if the split succeeded)
+
+        Raises:
+            ValueError: If data has fewer bars than groups
+        """
+        folds = self.fold_segments(len(data), label_end)
+
+        param_grid = param_grid or {}
+        keys = list(param_grid)
+        param_sets = [dict(zip(keys, values)) for values in itertools.product(*param_grid.values())]
+
+        tasks = [
+            {
+                'split': i,
+                'test_groups': fold['test_groups'],
+                'test': fold['test'],
+                'train': fold['train'],
+                'param_sets': param_sets,
+                'metric': self.metric,
+                'initial_capital': initial_capital,
+            }
+            for i, fold in enumerate(folds)
+        ]
+
+        print(f"CPCV: {self.n_splits} splits ({self.n_groups} groups, "
+              f"{self.n_test_groups} test), {self.n_paths} paths, "
+              f"{len(param_sets)} parameter sets")
+
+        records = run_tasks(
+            _run_split, tasks, self.max_workers, strategy,
+            cache_entries=self.cache_entries, cache_dir=self.cache_dir,
+            state={'data': data}
+        )
+
+        results = pd.DataFrame(records)
+        report_errors(results, lambda row: f"split {row['split']} {row['test_groups']}")
+
+        return results
+
+    def backtest_paths(self, results: pd.DataFrame) -> pd.DataFrame:
+        """
+        Assemble test group scores into C(N-1, k-1) backtest paths.
+
+        Path p uses, for every group, the p-th split (in split order) in
+        which that group was tested.
+
+        Args:
+            results: Output of run()
+
+        Returns:
+            DataFrame (paths x groups) of the metric; failed splits are NaN
+        """
+        paths = np.full((self.n_paths, self.n_groups), np.nan)
+        seen = np.zeros(self.n_groups, dtype=np.int64)
+
+        for _, row in results.sort_values('split').iterrows():
+            scores = row.get('group_scores')
+            for group in row['test_groups']:
+                if isinstance(scores, dict):
+                    paths[seen[group], group] = scores.get(group, np.nan)
+                seen[group] += 1
+
+        return pd.DataFrame(paths, index=pd.RangeIndex(self.n_paths, name='path'),
+                            columns=pd.RangeIndex(self.n_groups, name='group'))
+
+    def summarize(self, results: pd.DataFrame) -> Dict:
+        """
+        Out-of-sample metric distribution.
+
+        Args:
+            results: Output of run()
+
+        Returns:
+            Dictionary containing:
+            - 'splits': Successful splits
+            - 'mean' / 'std' / 'median': Of the test metric over splits
+            - 'percentiles': Dict (5, 25, 75, 95) -> test metric
+            - 'prob_non_positive': Share of splits with test metric <= 0
+            - 'path_metrics': Series, mean metric per backtest path
+        """
+        valid = results[results['error'].isna()] if 'error' in results else results
+        values = pd.to_numeric(valid[f"test_{self.metric}"], errors='coerce').dropna().to_numpy()
+        path_metrics = self.backtest_paths(results).mean(axis=1)
+
+        if len(values) == 0:
+            summary = {'splits': 0, 'mean': np.nan, 'std': np.nan, 'median': np.nan,
+                       'percentiles': {}, 'prob_non_positive': np.nan}
+        else:
+            summary = {
+                'splits': len(values),
+                'mean': float(values.mean()),
+                'std': float(values.std(ddof=1)) if len(values) > 1 else np.nan,
+                'median': float(np.median(values)),
+                'percentiles': {q: float(np.percentile(values, q)) for q in (5, 25, 75, 95)},
+                'prob_non_positive': float((values <= 0).mean()),
+            }
+        summary['path_metrics'] = path_metrics
+
+        print(f"\nCPCV Summary ({summary['splits']} splits, {self.metric}):")
+        print(f"  Mean: {summary['mean']:.3f}  Std: {summary['std']:.3f}  "
+              f"Median: {summary['median']:.3f}")
+        print(f"  P(<= 0): {summary['prob_non_positive']:.1%}")
+        print(f"  Path means: {np.round(path_metrics.to_numpy(), 3).tolist()}")
+
+        return summary
+
+
+def _segments_to_index(segments: List[Segment]) -> np.ndarray:
+    """Concatenate [start, stop) segments into one int64 position array."""
+    if not segments:
+        return np.empty(0, dtype=np.int64)
+    return np.concatenate([np.arange(start, stop, dtype=np.int64) for start, stop in segments])
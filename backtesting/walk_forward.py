@@ -14,8 +14,369 @@ Acceptance Criteria:
     - Walk-forward efficiency >50% of windows profitable
     - Parameter stability: std dev <20% of mean
 
-Implementation Status: Placeholder - to be implemented in Phase 6
+Performance Design:
+    - Each symbol's bars are loaded once (by the caller) and shipped once
+      per worker process (pool initializer), never per window
+    - Train/test windows are positional .iloc slices of that data (views,
+      no per-window refetch or copy)
+    - Windows x symbols run in a process pool
+    - Signals are memoized per worker with the strategy SignalCache, keyed
+      by window slice + config (optional disk tier survives re-runs)
+
+Usage:
+    >>> validator = WalkForwardValidator(train_days=365, test_days=90, step_days=30)
+    >>> results = validator.run_analysis(
+    ...     strategy=orb_strategy,
+    ...     data={'NVDA': nvda_5min, 'AAPL': aapl_5min},
+    ...     daily_data={'NVDA': nvda_daily, 'AAPL': aapl_daily},
+    ...     param_grid={'atr_stop_multiplier': [2.0, 2.5, 3.0]}
+    ... )
+    >>> summary = validator.summarize(results)
+
+Reference: docs/SYSTEM_ARCHITECTURE/4_WALK_FORWARD_VALIDATION_PERFORMANCE_TARGETS_AND_DEPLOYMENT.md lines 1-122
 """
 
-# TODO: Implement Walk-Forward Validator (Phase 6)
-# See docs/SYSTEM_ARCHITECTURE/4_WALK_FORWARD_VALIDATION_PERFORMANCE_TARGETS_AND_DEPLOYMENT.md lines 1-122
+import itertools
+import traceback
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from backtesting.workers import (
+    WORKER_STATE,
+    check_symbol_state,
+    metric_value,
+    report_errors,
+    run_tasks,
+    strategy_for_symbol,
+    strategy_with_params,
+)
+
+
+WALK_FORWARD_CONFIG = {
+    'train_period': 365,  # 1 year training
+    'test_period': 90,    # 3 months testing
+    'step_forward': 30,   # 1 month step
+    'min_trades': 20,     # Minimum trades per window
+}
+
+# Acceptance thresholds (see module docstring)
+MAX_AVG_DEGRADATION = 0.30
+MIN_EFFICIENCY = 0.50
+MAX_PARAM_CV = 0.20
+
+def _run_window(task: Dict) -> Dict:
+    """
+    Process-pool worker: optimize on the train slice, evaluate on the test slice.
+
+    Errors are returned in the record so one window never stops the analysis.
+    """
+    symbol = task['symbol']
+    train_start, train_end, test_start, test_end = task['positions']
+    metric = task['metric']
+
+    record = {
+        'symbol': symbol,
+        'window': task['window'],
+        'train_start': task['dates'][0],
+        'train_end': task['dates'][1],
+        'test_end': task['dates'][2],
+        'error': None,
+    }
+
+    try:
+        data = WORKER_STATE['data'][symbol]
+        train = data.iloc[train_start:train_end]
+        test = data.iloc[test_start:test_end]
+        capital = task['initial_capital']
+
+        base = strategy_for_symbol(WORKER_STATE['strategy'], symbol, WORKER_STATE['daily_data'])
+
+        # 1. In-sample: every parameter set on the train slice
+        candidates = []
+        for params in task['param_sets']:
+            strategy = strategy_with_params(base, params)
+            metrics = strategy.backtest_metrics(train, initial_capital=capital)
+            candidates.append((params, strategy, metrics))
+
+        scores = np.array([metric_value(m, metric) for _, _, m in candidates])
+        eligible = np.array([m.get('total_trades', 0) >= task['min_trades'] for _, _, m in candidates])
+        pool = np.flatnonzero(eligible) if eligible.any() else np.arange(len(candidates))
+        best = pool[np.nanargmax(scores[pool])] if not np.isnan(scores[pool]).all() else pool[0]
+        params, strategy, train_metrics = candidates[best]
+
+        # 2. Out-of-sample: best parameters on the test slice
+        test_metrics = strategy.backtest_metrics(test, initial_capital=capital)
+
+        train_score = metric_value(train_metrics, metric)
+        test_score = metric_value(test_metrics, metric)
+
+        record.update({
+            **{f"param_{k}": v for k, v in params.items()},
+            f"train_{metric}": train_score,
+            f"test_{metric}": test_score,
+            'degradation': (
+                (train_score - test_score) / abs(train_score)
+                if train_score and np.isfinite(train_score) else np.nan
+            ),
+            'train_return': train_metrics.get('total_return', np.nan),
+            'test_return': test_metrics.get('total_return', np.nan),
+            'train_trades': train_metrics.get('total_trades', 0),
+            'test_trades': test_metrics.get('total_trades', 0),
+            'min_trades_met': bool(eligible[best]),
+        })
+
+    except Exception as e:
+        record['error'] = f"{e}\n{traceback.format_exc()}"
+
+    return record
+
+
+class WalkForwardValidator:
+    """
+    Implements walk-forward analysis.
+
+    Methodology:
+    1. Split data into overlapping windows (calendar days)
+    2. Optimize parameters on training window
+    3. Test on following out-of-sample window
+    4. Roll forward and repeat
+    5. Aggregate results across all windows
+
+    Attributes:
+        train_days: Training window length in calendar days
+        test_days: Testing window length in calendar days
+        step_days: Step between windows in calendar days
+        min_trades: Minimum in-sample trades for a parameter set to be chosen
+        metric: Metric optimized in-sample (key of backtest_metrics())
+
+    Example:
+        >>> validator = WalkForwardValidator(metric='sharpe_ratio', max_workers=8)
+        >>> results = validator.run_analysis(strategy, data_by_symbol,
+        ...                                  param_grid={'volume_multiplier': [1.5, 2.0]},
+        ...                                  daily_data=daily_by_symbol)
+        >>> validator.summarize(results)['passed']
+    """
+
+    def __init__(
+        self,
+        train_days: int = WALK_FORWARD_CONFIG['train_period'],
+        test_days: int = WALK_FORWARD_CONFIG['test_period'],
+        step_days: int = WALK_FORWARD_CONFIG['step_forward'],
+        min_trades: int = WALK_FORWARD_CONFIG['min_trades'],
+        metric: str = 'sharpe_ratio',
+        max_workers: Optional[int] = None,
+        cache_entries: int = 64,
+        cache_dir: Optional[str] = None
+    ):
+        """
+        Initialize walk-forward validator.
+
+        Args:
+            train_days: Training period in calendar days (default 365)
+            test_days: Testing period in calendar days (default 90)
+            step_days: Step forward in calendar days (default 30)
+            min_trades: Minimum trades per training window (default 20)
+            metric: Metric to optimize (default 'sharpe_ratio')
+            max_workers: Process pool size (None = CPU count, 1 = in-process)
+            cache_entries: Signal cache size per worker (0 disables caching)
+            cache_dir: Optional persistent signal cache directory
+
+        Raises:
+            ValueError: If any period is not positive
+        """
+        if min(train_days, test_days, step_days) <= 0:
+            raise ValueError(
+                f"train_days, test_days and step_days must be positive. "
+                f"Got {train_days}, {test_days}, {step_days}"
+            )
+
+        self.train_days = train_days
+        self.test_days = test_days
+        self.step_days = step_days
+        self.min_trades = min_trades
+        self.metric = metric
+        self.max_workers = max_workers
+        self.cache_entries = cache_entries
+        self.cache_dir = cache_dir
+
+    def generate_windows(
+        self,
+        start: pd.Timestamp,
+        end: pd.Timestamp
+    ) -> List[Tuple[pd.Timestamp, pd.Timestamp, pd.Timestamp]]:
+        """
+        Generate overlapping train/test window boundaries.
+
+        Args:
+            start: First timestamp of the data
+            end: Last timestamp of the data
+
+        Returns:
+            List of (train_start, train_end/test_start, test_end) timestamps;
+            train is [train_start, train_end), test is [train_end, test_end)
+        """
+        train = pd.Timedelta(days=self.train_days)
+        test = pd.Timedelta(days=self.test_days)
+        step = pd.Timedelta(days=self.step_days)
+
+        windows = []
+        train_start = start
+        while train_start + train + test <= end + pd.Timedelta(days=1):
+            train_end = train_start + train
+            windows.append((train_start, train_end, train_end + test))
+            train_start += step
+        return windows
+
+    @staticmethod
+    def window_positions(
+        index: pd.DatetimeIndex,
+        window: Tuple[pd.Timestamp, pd.Timestamp, pd.Timestamp]
+    ) -> Tuple[int, int, int, int]:
+        """
+        Positional slice bounds of a window in one symbol's index.
+
+        Args:
+            index: Sorted DatetimeIndex of the symbol's bars
+            window: (train_start, train_end, test_end) from generate_windows()
+
+        Returns:
+            (train_start, train_end, test_start, test_end) positions for .iloc
+        """
+        train_start, train_end, test_end = index.searchsorted(list(window), side='left')
+        return int(train_start), int(train_end), int(train_end), int(test_end)
+
+    def run_analysis(
+        self,
+        strategy,
+        data: Union[pd.DataFrame, Dict[str, pd.DataFrame]],
+        param_grid: Optional[Dict[str, List]] = None,
+        initial_capital: float = 10000.0,
+        daily_data: Optional[Dict[str, pd.DataFrame]] = None
+    ) -> pd.DataFrame:
+        """
+        Run walk-forward analysis over all windows and symbols.
+
+        Args:
+            strategy: BaseStrategy instance (parameter sets are applied as
+                config updates on copies of it)
+            data: OHLCV DataFrame, or dict of symbol -> DataFrame (each loaded
+                once by the caller; windows are slices of it)
+            param_grid: Dict of config field -> candidate values (Cartesian
+                product). None/empty = evaluate the current config only.
+            initial_capital: Starting capital for every window backtest
+            daily_data: Dict of symbol -> daily OHLCV for strategies that
+                read per-symbol daily bars (ORB's data_daily ATR). Set on
+                each symbol's strategy copy; required for such strategies
+                when data has several symbols.
+
+        Returns:
+            DataFrame with one row per (symbol, window): dates, chosen
+            parameters (param_*), train/test metric, degradation, returns,
+            trade counts and error (None if the window succeeded)
+
+        Raises:
+            ValueError: If data is empty or no complete window fits
+            ValueError: If several symbols would share one strategy's daily
+                bars (see backtesting.workers.check_symbol_state())
+        """
+        if isinstance(data, pd.DataFrame):
+            data = {getattr(strategy.config, 'symbol', None) or 'data': data}
+        data = {symbol: df for symbol, df in data.items() if len(df) > 0}
+        if not data:
+            raise ValueError("data is empty")
+        check_symbol_state(strategy, data, daily_data)
+        if daily_data is not None:
+            daily_data = {symbol: daily_data[symbol] for symbol in data}
+
+        param_grid = param_grid or {}
+        keys = list(param_grid)
+        param_sets = [dict(zip(keys, values)) for values in itertools.product(*param_grid.values())]
+
+        # Common calendar so window k means the same dates for every symbol
+        start = min(df.index[0] for df in data.values())
+        end = max(df.index[-1] for df in data.values())
+        windows = self.generate_windows(start, end)
+        if not windows:
+            raise ValueError(
+                f"No complete window: need {self.train_days + self.test_days} days, "
+                f"data spans {(end - start).days} days"
+            )
+
+        tasks = [
+            {
+                'symbol': symbol,
+                'window': k,
+                'dates': window,
+                'positions': self.window_positions(df.index, window),
+                'param_sets': param_sets,
+                'metric': self.metric,
+                'min_trades': self.min_trades,
+                'initial_capital': initial_capital,
+            }
+            for symbol, df in data.items()
+            for k, window in enumerate(windows)
+        ]
+
+        print(f"Walk-forward: {len(windows)} windows x {len(data)} symbols x "
+              f"{len(param_sets)} parameter sets ({len(tasks)} tasks)")
+
+        records = run_tasks(
+            _run_window, tasks, self.max_workers, strategy,
+            cache_entries=self.cache_entries, cache_dir=self.cache_dir,
+            state={'data': data, 'daily_data': daily_data}
+        )
+
+        results = pd.DataFrame(records)
+        report_errors(results, lambda row: f"{row['symbol']} window {row['window']}")
+
+        return results
+
+    def summarize(self, results: pd.DataFrame) -> Dict:
+        """
+        Aggregate walk-forward results and check acceptance criteria.
+
+        Args:
+            results: Output of run_analysis()
+
+        Returns:
+            Dictionary containing:
+            - 'windows': Successful (symbol, window) evaluations
+            - 'avg_degradation': Mean in-sample to out-of-sample degradation
+            - 'efficiency': Fraction of windows with positive test return
+            - 'parameter_stability': Dict param -> std / |mean| of chosen values
+            - 'passed': Dict criterion -> bool
+        """
+        valid = results[results['error'].isna()] if 'error' in results else results
+
+        avg_degradation = float(valid['degradation'].mean()) if len(valid) else np.nan
+        efficiency = float((valid['test_return'] > 0).mean()) if len(valid) else np.nan
+
+        stability = {}
+        for col in [c for c in valid.columns if c.startswith('param_')]:
+            values = pd.to_numeric(valid[col], errors='coerce').dropna()
+            if len(values) and values.mean() != 0:
+                stability[col[len('param_'):]] = float(values.std(ddof=0) / abs(values.mean()))
+
+        passed = {
+            'degradation': bool(avg_degradation < MAX_AVG_DEGRADATION),
+            'efficiency': bool(efficiency > MIN_EFFICIENCY),
+            'parameter_stability': all(cv < MAX_PARAM_CV for cv in stability.values()),
+        }
+
+        print(f"\nWalk-Forward Summary ({len(valid)} windows):")
+        print(f"  Avg degradation:  {avg_degradation:.1%} "
+              f"[{'PASS' if passed['degradation'] else 'FAIL'}] (<{MAX_AVG_DEGRADATION:.0%})")
+        print(f"  WF efficiency:    {efficiency:.1%} "
+              f"[{'PASS' if passed['efficiency'] else 'FAIL'}] (>{MIN_EFFICIENCY:.0%})")
+        for param, cv in stability.items():
+            print(f"  Stability {param}: {cv:.1%} (<{MAX_PARAM_CV:.0%})")
+
+        return {
+            'windows': len(valid),
+            'avg_degradation': avg_degradation,
+            'efficiency': efficiency,
+            'parameter_stability': stability,
+            'passed': passed,
+        }
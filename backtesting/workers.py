@@ -0,0 +1,231 @@
+"""
+Shared Worker Plumbing for Backtest Engines
+
+Process-pool and strategy-copy helpers used by WalkForwardValidator,
+CombinatorialPurgedCV and ParameterOptimizer, so the engines ship data,
+copy strategies, enable signal caches and report per-task errors the same
+way.
+
+Worker State:
+    init_worker() runs once per worker process (pool initializer, or once
+    in-process when max_workers == 1). It stores a private copy of the
+    strategy with its own SignalCache, plus the engine's shared objects
+    (bars, daily bars, ...) in WORKER_STATE, so tasks carry only window /
+    split positions and never the data itself.
+
+Per-Symbol Strategy State:
+    Some strategies keep per-symbol state on the instance (ORB reads its
+    ATR stops from data_daily). One worker copy must not be shared across
+    symbols, so the engines take daily_data={symbol: daily bars} and set it
+    on a per-symbol copy (strategy_for_symbol()). Multi-symbol runs of such
+    strategies without daily_data are rejected (check_symbol_state()).
+
+Usage:
+    >>> records = run_tasks(_run_window, tasks, max_workers=8,
+    ...                     strategy=strategy, cache_entries=64,
+    ...                     state={'data': data, 'daily_data': daily_data})
+    >>> report_errors(pd.DataFrame(records), lambda row: f"window {row['window']}")
+"""
+
+import copy
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# Strategy attributes holding per-symbol data (see module docstring)
+SYMBOL_STATE_ATTRS = ('data_daily',)
+
+# Worker process state (set once per process by init_worker)
+WORKER_STATE: Dict[str, Any] = {}
+
+
+def worker_strategy(strategy, cache_entries: int = 0, cache_dir: Optional[str] = None):
+    """
+    Private shallow copy of a strategy with its own signal cache.
+
+    Args:
+        strategy: BaseStrategy instance
+        cache_entries: Signal cache size (0 disables caching)
+        cache_dir: Optional persistent signal cache directory
+
+    Returns:
+        Strategy copy (caching enabled if the strategy supports it)
+    """
+    strategy = copy.copy(strategy)
+    if cache_entries and hasattr(strategy, 'enable_signal_cache'):
+        strategy.enable_signal_cache(max_entries=cache_entries, cache_dir=cache_dir)
+    return strategy
+
+
+def init_worker(
+    strategy,
+    cache_entries: int = 0,
+    cache_dir: Optional[str] = None,
+    state: Optional[Dict[str, Any]] = None
+):
+    """
+    Process-pool initializer: keep strategy copy and shared objects per worker.
+
+    WORKER_STATE gets 'strategy' (see worker_strategy()), an empty LRU
+    'memo' for engine-level memoization, and every item of state.
+    """
+    WORKER_STATE.clear()
+    WORKER_STATE.update(state or {})
+    WORKER_STATE['strategy'] = worker_strategy(strategy, cache_entries, cache_dir)
+    WORKER_STATE['memo'] = OrderedDict()
+
+
+def run_tasks(
+    worker: Callable[[Any], Dict],
+    tasks: List,
+    max_workers: Optional[int],
+    strategy,
+    cache_entries: int = 0,
+    cache_dir: Optional[str] = None,
+    state: Optional[Dict[str, Any]] = None
+) -> List:
+    """
+    Run tasks in a process pool (or in-process) with shared worker state.
+
+    Args:
+        worker: Module-level function taking one task
+        tasks: Picklable task descriptions
+        max_workers: Pool size (None = CPU count, 1 = in-process)
+        strategy: Strategy copied once per worker (see init_worker())
+        cache_entries: Signal cache size per worker (0 disables caching)
+        cache_dir: Optional persistent signal cache directory
+        state: Objects shipped once per worker (e.g., {'data': data})
+
+    Returns:
+        Worker outputs in task order
+    """
+    init_args = (strategy, cache_entries, cache_dir, state)
+    if max_workers == 1 or len(tasks) <= 1:
+        init_worker(*init_args)
+        return [worker(task) for task in tasks]
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=init_worker,
+        initargs=init_args
+    ) as executor:
+        return list(executor.map(worker, tasks))
+
+
+def signal_cache_stats() -> Dict[str, int]:
+    """
+    Signal cache counters of this process's worker strategy.
+
+    Only meaningful in the process that ran the tasks (max_workers=1).
+
+    Returns:
+        Dictionary with 'hits', 'disk_hits' and 'misses' (0 if caching is off)
+    """
+    cache = getattr(WORKER_STATE.get('strategy'), '_signal_cache', None)
+    if cache is None:
+        return {'hits': 0, 'disk_hits': 0, 'misses': 0}
+    return {'hits': cache.hits, 'disk_hits': cache.disk_hits, 'misses': cache.misses}
+
+
+def strategy_with_params(base, params: Dict):
+    """
+    Shallow copy of the strategy with a validated config update.
+
+    Args:
+        base: BaseStrategy instance (returned unchanged if params is empty)
+        params: Config field -> value
+
+    Returns:
+        Strategy copy sharing base's signal cache
+
+    Raises:
+        ValueError / AssertionError: From config or parameter validation
+    """
+    if not params:
+        return base
+    strategy = copy.copy(base)
+    strategy.config = type(base.config).model_validate({**base.config.model_dump(), **params})
+    strategy.validate_config()
+    strategy.validate_parameters()
+    return strategy
+
+
+def strategy_for_symbol(base, symbol: str, daily_data: Optional[Dict[str, pd.DataFrame]]):
+    """
+    Shallow copy of the strategy bound to one symbol's daily bars.
+
+    Args:
+        base: BaseStrategy instance
+        symbol: Symbol of the task
+        daily_data: Dict of symbol -> daily OHLCV (None = use base as is)
+
+    Returns:
+        Strategy copy with data_daily set (shares base's signal cache; the
+        daily bars are part of the cache key, see _signal_cache_extra())
+    """
+    if not daily_data:
+        return base
+    strategy = copy.copy(base)
+    strategy.data_daily = daily_data[symbol]
+    return strategy
+
+
+def check_symbol_state(
+    strategy,
+    symbols: Iterable[str],
+    daily_data: Optional[Dict[str, pd.DataFrame]]
+) -> None:
+    """
+    Reject runs that would share one strategy's per-symbol state.
+
+    Args:
+        strategy: BaseStrategy instance
+        symbols: Symbols of the run
+        daily_data: Dict of symbol -> daily OHLCV, or None
+
+    Raises:
+        ValueError: If daily_data misses a symbol, or several symbols are
+            run with a strategy holding per-symbol state and no daily_data
+    """
+    symbols = list(symbols)
+    if daily_data is not None:
+        missing = [s for s in symbols if s not in daily_data]
+        if missing:
+            raise ValueError(f"daily_data has no bars for: {', '.join(map(str, missing))}")
+        return
+
+    attrs = [a for a in SYMBOL_STATE_ATTRS if hasattr(strategy, a)]
+    if len(symbols) > 1 and attrs:
+        raise ValueError(
+            f"{type(strategy).__name__} keeps per-symbol state ({', '.join(attrs)}); "
+            f"pass daily_data={{symbol: daily bars}} to run several symbols"
+        )
+
+
+def metric_value(metrics: Dict, metric: str) -> float:
+    """Metric from a backtest_metrics() record as float (NaN if missing)."""
+    value = metrics.get(metric, np.nan)
+    return float(value) if value is not None else np.nan
+
+
+def report_errors(results: pd.DataFrame, describe: Callable[[pd.Series], str]) -> int:
+    """
+    Print one [ERROR] line per failed task.
+
+    Args:
+        results: Task records with an 'error' column (None/NaN = success)
+        describe: Row -> task label, e.g. "NVDA window 3"
+
+    Returns:
+        Number of failed tasks
+    """
+    if 'error' not in results:
+        return 0
+    failed = results['error'].notna()
+    for _, row in results[failed].iterrows():
+        print(f"[ERROR] {describe(row)}: {row['error'].splitlines()[0]}")
+    return int(failed.sum())
@@ -1,3 +1,25 @@
 """
 Comparison module for strategy performance comparison and analysis.
+
+Modules:
+    strategy_comparison: Vectorized metric tables, bootstrap Sharpe-difference
+        tests, probabilistic / deflated Sharpe ratios
 """
+
+from .strategy_comparison import (
+    adjust_pvalues,
+    bootstrap_sharpe_test,
+    compare_strategies,
+    deflated_sharpe_ratio,
+    metric_table,
+    probabilistic_sharpe_ratio,
+)
+
+__all__ = [
+    'adjust_pvalues',
+    'bootstrap_sharpe_test',
+    'compare_strategies',
+    'deflated_sharpe_ratio',
+    'metric_table',
+    'probabilistic_sharpe_ratio',
+]
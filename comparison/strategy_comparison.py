@@ -0,0 +1,484 @@
+"""
+Strategy Comparison and Significance Testing
+
+One-call comparison of many return streams (strategy variants, parameter
+sets, symbols, in-sample vs out-of-sample):
+
+- metric_table(): performance metrics for every stream at once (NumPy over
+  the (time x variants) matrix, no per-variant loop)
+- bootstrap_sharpe_test(): paired circular block bootstrap of Sharpe
+  differences vs a benchmark stream over their common periods, compiled
+  kernel, chunks run in a process pool; p-values adjusted for multiple
+  testing (Holm, BH)
+- probabilistic_sharpe_ratio() / deflated_sharpe_ratio(): probability that
+  the true Sharpe beats zero / the best Sharpe expected from luck alone
+  across the number of variants tried (Bailey & Lopez de Prado, 2014)
+- compare_strategies(): all of the above joined into one table
+
+Input: DataFrame of periodic returns (one column per variant), or a dict
+of name -> returns Series / vbt.Portfolio (uses pf.returns).
+
+Usage:
+    >>> table = compare_strategies(returns_by_variant, benchmark='baseline',
+    ...                            n_boot=5000, max_workers=8)
+    >>> table.sort_values('deflated_sharpe', ascending=False).head(10)
+
+Reference: Bailey & Lopez de Prado, "The Deflated Sharpe Ratio", 2014;
+           Ledoit & Wolf, "Robust performance hypothesis testing with the
+           Sharpe ratio", 2008
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+from numba import njit
+from scipy.stats import norm
+
+
+EULER_GAMMA = 0.5772156649015329
+
+
+@njit(cache=True)
+def bootstrap_sharpe_nb(
+    returns: np.ndarray,
+    n_boot: int,
+    block_size: int,
+    seed: int
+) -> np.ndarray:
+    """
+    Per-period Sharpe of every column on circular block bootstrap samples.
+
+    All columns share the same resampled rows per draw (paired bootstrap),
+    so differences between columns keep their correlation.
+
+    Args:
+        returns: (time, variants) returns without NaN
+        n_boot: Number of bootstrap draws
+        block_size: Consecutive rows per block
+        seed: RNG seed (numba RNG)
+
+    Returns:
+        (n_boot, variants) array of per-period Sharpe ratios
+    """
+    np.random.seed(seed)
+    n_rows, n_cols = returns.shape
+    out = np.empty((n_boot, n_cols))
+    total = np.empty(n_cols)
+    total_sq = np.empty(n_cols)
+
+    for b in range(n_boot):
+        total[:] = 0.0
+        total_sq[:] = 0.0
+        start = 0
+        for i in range(n_rows):
+            offset = i % block_size
+            if offset == 0:
+                start = np.random.randint(0, n_rows)
+            row = (start + offset) % n_rows
+            for j in range(n_cols):
+                r = returns[row, j]
+                total[j] += r
+                total_sq[j] += r * r
+
+        for j in range(n_cols):
+            mean = total[j] / n_rows
+            var = (total_sq[j] - n_rows * mean * mean) / (n_rows - 1)
+            out[b, j] = mean / np.sqrt(var) if var > 0 else np.nan
+
+    return out
+
+
+def _bootstrap_chunk(args) -> np.ndarray:
+    """Process-pool task: one chunk of bootstrap draws."""
+    returns, n_boot, block_size, seed = args
+    return bootstrap_sharpe_nb(returns, n_boot, block_size, seed)
+
+
+def _sharpe_per_period(returns: np.ndarray) -> np.ndarray:
+    """Per-period Sharpe of every column, same estimator as bootstrap_sharpe_nb()."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = returns.mean(axis=0)
+        std = returns.std(axis=0, ddof=1)
+        return np.where(std > 0, mean / std, np.nan)
+
+
+def to_returns_frame(returns: Union[pd.DataFrame, Dict]) -> pd.DataFrame:
+    """
+    Normalize input to a (time x variants) returns DataFrame.
+
+    Args:
+        returns: DataFrame, or dict of name -> Series / vbt.Portfolio
+
+    Returns:
+        Float DataFrame aligned on the union of timestamps
+
+    Raises:
+        ValueError: If there are no variants
+    """
+    if isinstance(returns, dict):
+        series = {
+            name: value.returns if hasattr(value, 'returns') else value
+            for name, value in returns.items()
+        }
+        returns = pd.concat(series, axis=1) if series else pd.DataFrame()
+    frame = pd.DataFrame(returns).astype(np.float64)
+    if frame.shape[1] == 0:
+        raise ValueError("No return streams to compare")
+    return frame
+
+
+def metric_table(
+    returns: Union[pd.DataFrame, Dict],
+    periods_per_year: float = 252,
+    risk_free: float = 0.0
+) -> pd.DataFrame:
+    """
+    Performance metrics for every return stream in one pass.
+
+    NaN returns are ignored in moments and treated as flat in the equity
+    curve (e.g., before a variant's first bar).
+
+    Args:
+        returns: (time x variants) returns or dict (see to_returns_frame())
+        periods_per_year: Annualization factor (252 daily, 52 weekly)
+        risk_free: Annual risk-free rate (decimal)
+
+    Returns:
+        DataFrame indexed by variant with n_obs, total_return,
+        annual_return, volatility, sharpe_ratio, sortino_ratio,
+        max_drawdown, calmar_ratio, hit_rate, skew, kurtosis (non-excess)
+        and sharpe_per_period
+    """
+    frame = to_returns_frame(returns)
+    r = frame.to_numpy()
+    valid = ~np.isnan(r)
+    n_obs = valid.sum(axis=0)
+
+    rf = (1 + risk_free) ** (1 / periods_per_year) - 1
+    filled = np.where(valid, r, 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = filled.sum(axis=0) / n_obs
+        centered = np.where(valid, r - mean, 0.0)
+        m2 = (centered ** 2).sum(axis=0) / n_obs
+        m3 = (centered ** 3).sum(axis=0) / n_obs
+        m4 = (centered ** 4).sum(axis=0) / n_obs
+        std = np.sqrt(m2 * n_obs / (n_obs - 1))
+
+        excess = mean - rf
+        sharpe_pp = excess / std
+        downside = np.sqrt((np.minimum(np.where(valid, r - rf, 0.0), 0.0) ** 2).sum(axis=0) / n_obs)
+
+        equity = np.cumprod(1 + filled, axis=0)
+        drawdown = 1 - equity / np.maximum.accumulate(equity, axis=0)
+        total_return = equity[-1] - 1
+        annual_return = (1 + total_return) ** (periods_per_year / n_obs) - 1
+        max_drawdown = drawdown.max(axis=0)
+
+        table = pd.DataFrame({
+            'n_obs': n_obs,
+            'total_return': total_return,
+            'annual_return': annual_return,
+            'volatility': std * np.sqrt(periods_per_year),
+            'sharpe_ratio': sharpe_pp * np.sqrt(periods_per_year),
+            'sortino_ratio': excess / downside * np.sqrt(periods_per_year),
+            'max_drawdown': max_drawdown,
+            'calmar_ratio': annual_return / max_drawdown,
+            'hit_rate': (filled > 0).sum(axis=0) / n_obs,
+            'skew': m3 / m2 ** 1.5,
+            'kurtosis': m4 / m2 ** 2,
+            'sharpe_per_period': sharpe_pp,
+        }, index=frame.columns)
+
+    return table.replace([np.inf, -np.inf], np.nan)
+
+
+def probabilistic_sharpe_ratio(
+    sharpe: Union[float, np.ndarray],
+    n_obs: Union[int, np.ndarray],
+    skew: Union[float, np.ndarray] = 0.0,
+    kurtosis: Union[float, np.ndarray] = 3.0,
+    benchmark_sharpe: Union[float, np.ndarray] = 0.0
+) -> np.ndarray:
+    """
+    Probability that the true Sharpe exceeds benchmark_sharpe (PSR).
+
+    Args:
+        sharpe: Per-period (non-annualized) Sharpe ratio(s)
+        n_obs: Number of return observations
+        skew: Return skewness
+        kurtosis: Return kurtosis (non-excess, normal = 3)
+        benchmark_sharpe: Per-period Sharpe to beat
+
+    Returns:
+        PSR in [0, 1] (array)
+    """
+    sharpe = np.asarray(sharpe, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        denom = np.sqrt(1 - skew * sharpe + (np.asarray(kurtosis) - 1) / 4 * sharpe ** 2)
+        z = (sharpe - benchmark_sharpe) * np.sqrt(np.asarray(n_obs) - 1) / denom
+    return norm.cdf(z)
+
+
+def expected_max_sharpe(sharpe_std: float, n_trials: int) -> float:
+    """
+    Expected maximum per-period Sharpe of n_trials zero-skill variants.
+
+    Args:
+        sharpe_std: Standard deviation of Sharpe ratios across trials
+        n_trials: Number of independent variants tried
+
+    Returns:
+        Per-period Sharpe threshold (SR0 of the deflated Sharpe ratio)
+    """
+    if n_trials < 2:
+        return 0.0
+    return float(sharpe_std * (
+        (1 - EULER_GAMMA) * norm.ppf(1 - 1 / n_trials)
+        + EULER_GAMMA * norm.ppf(1 - 1 / (n_trials * np.e))
+    ))
+
+
+def deflated_sharpe_ratio(
+    sharpe: Union[float, np.ndarray],
+    n_obs: Union[int, np.ndarray],
+    skew: Union[float, np.ndarray] = 0.0,
+    kurtosis: Union[float, np.ndarray] = 3.0,
+    n_trials: Optional[int] = None,
+    sharpe_std: Optional[float] = None
+) -> np.ndarray:
+    """
+    Deflated Sharpe ratio: PSR against the Sharpe expected from selection.
+
+    Args:
+        sharpe: Per-period Sharpe ratio(s) of the variants
+        n_obs: Number of return observations
+        skew: Return skewness
+        kurtosis: Return kurtosis (non-excess)
+        n_trials: Variants tried (default: len(sharpe))
+        sharpe_std: Std of Sharpe across trials (default: from sharpe)
+
+    Returns:
+        DSR in [0, 1] (array); > 0.95 = significant after selection bias
+    """
+    sharpe = np.atleast_1d(np.asarray(sharpe, dtype=np.float64))
+    if n_trials is None:
+        n_trials = int(np.isfinite(sharpe).sum())
+    if sharpe_std is None:
+        finite = sharpe[np.isfinite(sharpe)]
+        sharpe_std = float(finite.std(ddof=1)) if len(finite) > 1 else 0.0
+
+    threshold = expected_max_sharpe(sharpe_std, n_trials)
+    return probabilistic_sharpe_ratio(sharpe, n_obs, skew, kurtosis, benchmark_sharpe=threshold)
+
+
+def adjust_pvalues(p_values: Union[np.ndarray, pd.Series], method: str = 'holm') -> np.ndarray:
+    """
+    Multiple-testing adjustment.
+
+    Args:
+        p_values: Raw p-values (NaN ignored)
+        method: 'holm' (family-wise error) or 'bh' (Benjamini-Hochberg FDR)
+
+    Returns:
+        Adjusted p-values (same order, capped at 1)
+
+    Raises:
+        ValueError: If method is unknown
+    """
+    p = np.asarray(p_values, dtype=np.float64)
+    out = np.full_like(p, np.nan)
+    valid = np.flatnonzero(~np.isnan(p))
+    m = len(valid)
+    if m == 0:
+        return out
+
+    order = valid[np.argsort(p[valid], kind='stable')]
+    ranked = p[order]
+
+    if method == 'holm':
+        adjusted = np.maximum.accumulate(ranked * (m - np.arange(m)))
+    elif method == 'bh':
+        adjusted = np.minimum.accumulate((ranked * m / np.arange(1, m + 1))[::-1])[::-1]
+    else:
+        raise ValueError(f"method must be 'holm' or 'bh', got '{method}'")
+
+    out[order] = np.minimum(adjusted, 1.0)
+    return out
+
+
+def bootstrap_sharpe_test(
+    returns: Union[pd.DataFrame, Dict],
+    benchmark: Optional[str] = None,
+    n_boot: int = 5000,
+    block_size: int = 5,
+    periods_per_year: float = 252,
+    alpha: float = 0.05,
+    seed: Optional[int] = None,
+    max_workers: Optional[int] = 1,
+    chunk_size: int = 500
+) -> pd.DataFrame:
+    """
+    Paired block-bootstrap test of Sharpe differences vs a benchmark.
+
+    H0: Sharpe(variant) == Sharpe(benchmark). The p-value is two-sided and
+    uses the centered bootstrap distribution of the difference. Each variant
+    is paired with the benchmark on the rows where both have returns; the
+    point and resampled Sharpe ratios are computed on the same rows with
+    the same estimator. Draws are generated in fixed-size chunks with
+    independent seeds, so results do not depend on max_workers.
+
+    Streams covering different periods (e.g., in-sample vs out-of-sample)
+    have nothing to pair: compare them with metric_table() instead.
+
+    Args:
+        returns: (time x variants) returns or dict (see to_returns_frame())
+        benchmark: Benchmark column (default: first column)
+        n_boot: Bootstrap draws
+        block_size: Rows per block (keeps autocorrelation / vol clustering)
+        periods_per_year: Annualization factor for reported Sharpe values
+        alpha: Confidence interval level (1 - alpha)
+        seed: Base seed (None = random)
+        max_workers: Processes for the chunks (1 = in-process, None = CPUs)
+        chunk_size: Draws per chunk
+
+    Returns:
+        DataFrame indexed by variant: sharpe_ratio (own valid rows),
+        n_paired (rows shared with the benchmark), sharpe_diff, ci_low,
+        ci_high (annualized, on the paired rows), p_value, p_value_holm,
+        p_value_bh
+
+    Raises:
+        ValueError: If the benchmark is unknown, or a stream shares fewer
+            than 2 rows with it
+    """
+    frame = to_returns_frame(returns)
+    if benchmark is None:
+        benchmark = frame.columns[0]
+    if benchmark not in frame.columns:
+        raise ValueError(f"benchmark '{benchmark}' not in returns columns")
+
+    values = frame.to_numpy()
+    bench_col = frame.columns.get_loc(benchmark)
+    valid = ~np.isnan(values)
+    paired = valid & valid[:, [bench_col]]
+    n_paired = paired.sum(axis=0)
+
+    unpaired = [str(name) for name, n in zip(frame.columns, n_paired) if n < 2]
+    if unpaired:
+        raise ValueError(
+            f"Need at least 2 return observations shared with benchmark '{benchmark}': "
+            f"{', '.join(unpaired)} (streams over different periods cannot be paired)"
+        )
+
+    # Variants with the same paired rows share one bootstrap (benchmark first)
+    groups: Dict[bytes, list] = {}
+    for j in range(frame.shape[1]):
+        if j != bench_col:
+            groups.setdefault(paired[:, j].tobytes(), []).append(j)
+    samples = [
+        (cols, np.ascontiguousarray(values[paired[:, cols[0]]][:, [bench_col] + cols]))
+        for cols in groups.values()
+    ]
+
+    n_chunks = max(1, -(-n_boot // chunk_size))
+    seeds = np.random.SeedSequence(seed).generate_state(n_chunks)
+    sizes = [min(chunk_size, n_boot - i * chunk_size) for i in range(n_chunks)]
+    tasks = [(sample, size, block_size, int(s))
+             for _, sample in samples for size, s in zip(sizes, seeds)]
+
+    if max_workers == 1 or len(tasks) <= 1:
+        chunks = [_bootstrap_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            chunks = list(executor.map(_bootstrap_chunk, tasks))
+
+    diff = np.zeros(frame.shape[1])
+    boot_diff = np.zeros((n_boot, frame.shape[1]))
+    for g, (cols, sample) in enumerate(samples):
+        boot = np.vstack(chunks[g * n_chunks:(g + 1) * n_chunks])
+        point = _sharpe_per_period(sample)
+        diff[cols] = point[1:] - point[0]
+        boot_diff[:, cols] = boot[:, 1:] - boot[:, [0]]
+
+    sharpe = np.array([_sharpe_per_period(values[valid[:, j], j][:, None])[0]
+                       for j in range(frame.shape[1])])
+
+    with np.errstate(invalid='ignore'):
+        exceed = np.abs(boot_diff - diff) >= np.abs(diff)
+    p_value = np.where(np.isnan(boot_diff).all(axis=0), np.nan, np.nanmean(exceed, axis=0))
+    p_value[bench_col] = np.nan
+
+    scale = np.sqrt(periods_per_year)
+    low, high = np.nanpercentile(boot_diff, [100 * alpha / 2, 100 * (1 - alpha / 2)], axis=0)
+
+    return pd.DataFrame({
+        'sharpe_ratio': sharpe * scale,
+        'n_paired': n_paired,
+        'sharpe_diff': diff * scale,
+        'ci_low': low * scale,
+        'ci_high': high * scale,
+        'p_value': p_value,
+        'p_value_holm': adjust_pvalues(p_value, 'holm'),
+        'p_value_bh': adjust_pvalues(p_value, 'bh'),
+    }, index=frame.columns)
+
+
+def compare_strategies(
+    returns: Union[pd.DataFrame, Dict],
+    benchmark: Optional[str] = None,
+    periods_per_year: float = 252,
+    risk_free: float = 0.0,
+    n_trials: Optional[int] = None,
+    n_boot: int = 5000,
+    block_size: int = 5,
+    seed: Optional[int] = None,
+    max_workers: Optional[int] = 1
+) -> pd.DataFrame:
+    """
+    Metric table + PSR/DSR + bootstrap Sharpe-difference test in one call.
+
+    Args:
+        returns: (time x variants) returns or dict (see to_returns_frame())
+        benchmark: Benchmark column for the bootstrap test (default: first)
+        periods_per_year: Annualization factor
+        risk_free: Annual risk-free rate for metric_table()
+        n_trials: Variants tried in total (default: number of columns;
+            pass more if variants were discarded before this comparison)
+        n_boot: Bootstrap draws (0 skips the bootstrap test)
+        block_size: Rows per bootstrap block
+        seed: Bootstrap seed
+        max_workers: Processes for bootstrap chunks
+
+    Returns:
+        metric_table() columns plus psr, deflated_sharpe and (if n_boot)
+        the bootstrap_sharpe_test() columns, sorted by sharpe_ratio
+
+    Example:
+        >>> table = compare_strategies({'baseline': base_pf, 'atr_2x': pf_2x, 'atr_3x': pf_3x},
+        ...                            benchmark='baseline', seed=0)
+        >>> table[['sharpe_ratio', 'deflated_sharpe', 'p_value']]
+        >>> # IS vs OOS cover different periods: metrics only, no paired test
+        >>> compare_strategies({'IS': is_returns, 'OOS': oos_returns}, n_boot=0)
+    """
+    frame = to_returns_frame(returns)
+    table = metric_table(frame, periods_per_year=periods_per_year, risk_free=risk_free)
+
+    sharpe_pp = table['sharpe_per_period'].to_numpy()
+    table['psr'] = probabilistic_sharpe_ratio(
+        sharpe_pp, table['n_obs'].to_numpy(), table['skew'].to_numpy(), table['kurtosis'].to_numpy()
+    )
+    table['deflated_sharpe'] = deflated_sharpe_ratio(
+        sharpe_pp, table['n_obs'].to_numpy(), table['skew'].to_numpy(),
+        table['kurtosis'].to_numpy(), n_trials=n_trials
+    )
+
+    if n_boot:
+        test = bootstrap_sharpe_test(
+            frame, benchmark=benchmark, n_boot=n_boot, block_size=block_size,
+            periods_per_year=periods_per_year, seed=seed, max_workers=max_workers
+        )
+        table = table.join(test.drop(columns='sharpe_ratio'))
+
+    return table.sort_values('sharpe_ratio', ascending=False)
@@ -6,8 +6,9 @@ trading strategies with integrated risk management (portfolio heat limits,
 drawdown circuit breakers, and position sizing).
 
 Architecture:
-- Phase 4 (Current): Single-strategy execution with heat gating and circuit breakers
-- Phase 5 (Future): Full multi-strategy orchestration with VBT column_stack
+- Phase 4: Single-strategy execution with heat gating and circuit breakers
+- Phase 5: Multi-strategy orchestration in one grouped, cash-sharing simulation
+  (run_multi_strategy_backtest)
 
 Design Decision:
 VBT's Portfolio.from_signals() is fully vectorized (processes all trades at once),
@@ -21,7 +22,8 @@ we use a HYBRID APPROACH:
 Reference: System_Architecture_Reference.md lines 1315-1441
 """
 
-from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional, Tuple, Union
 import pandas as pd
 import numpy as np
 import vectorbtpro as vbt
@@ -29,6 +31,8 @@ import vectorbtpro as vbt
 from strategies.base_strategy import BaseStrategy
 from utils.portfolio_heat import PortfolioHeatManager
 from core.risk_manager import RiskManager
+from utils.heat_gating import apply_heat_gate
+from utils.trade_statistics import compute_trade_statistics
 
 
 class PortfolioManager:
@@ -40,7 +44,7 @@ class PortfolioManager:
     - Enforce portfolio heat limits (max aggregate risk across positions)
     - Trigger drawdown circuit breakers (10%/15%/20% thresholds)
     - Allocate capital across multiple strategies (Phase 5)
-    - Coordinate multi-strategy execution (Phase 5)
+    - Coordinate multi-strategy execution with shared cash (Phase 5)
 
     Attributes:
         strategies: List of BaseStrategy instances to manage
@@ -167,7 +171,8 @@ class PortfolioManager:
             - 'circuit_breaker_triggers': List of (date, threshold, action)
             - 'final_equity': Final equity value
             - 'drawdown_max': Maximum drawdown reached
-            - 'trading_halted': Whether 20% DD triggered halt
+            - 'trading_halted': Whether the STOP_TRADING level was reached
+              (20% DD by default, see RiskManager.drawdown_thresholds)
 
         Example:
             >>> results = pm.run_single_strategy_with_gates(
@@ -196,34 +201,16 @@ class PortfolioManager:
         # Get equity curve
         equity_curve = pf.value
 
-        # Track circuit breaker triggers
-        circuit_breaker_triggers = []
-
-        # Update risk manager with equity curve
-        # Check for circuit breaker triggers at each point
-        for date, equity in equity_curve.items():
-            self.risk_manager.update_equity(equity)
-
-            drawdown = self.risk_manager.calculate_drawdown()
-
-            # Record circuit breaker triggers
-            if drawdown >= 0.20 and not any(
-                t[1] == 0.20 for t in circuit_breaker_triggers
-            ):
-                circuit_breaker_triggers.append((date, 0.20, 'STOP_TRADING'))
-            elif drawdown >= 0.15 and not any(
-                t[1] == 0.15 for t in circuit_breaker_triggers
-            ):
-                circuit_breaker_triggers.append((date, 0.15, 'REDUCE_SIZE'))
-            elif drawdown >= 0.10 and not any(
-                t[1] == 0.10 for t in circuit_breaker_triggers
-            ):
-                circuit_breaker_triggers.append((date, 0.10, 'WARNING'))
+        # Update risk manager with the whole equity curve at once
+        # (same triggers and final state as calling update_equity() per bar)
+        circuit_breaker_triggers = self.risk_manager.update_equity_curve(
+            equity_curve
+        )['triggers']
 
         # Calculate final metrics
         final_equity = equity_curve.iloc[-1]
         drawdown_max = (equity_curve / equity_curve.cummax() - 1).min()
-        trading_halted = any(t[1] >= 0.20 for t in circuit_breaker_triggers)
+        trading_halted = any(t[2] == 'STOP_TRADING' for t in circuit_breaker_triggers)
 
         # Print results
         print(f"\n{'-'*70}")
@@ -247,7 +234,8 @@ class PortfolioManager:
             print(f"\nNo circuit breakers triggered")
 
         if trading_halted:
-            print(f"\n[WARNING] Trading halted at 20% drawdown")
+            halt_level = self.risk_manager.circuit_breaker_levels()['STOP_TRADING']
+            print(f"\n[WARNING] Trading halted at {halt_level:.0%} drawdown")
 
         print(f"{'='*70}\n")
 
@@ -264,38 +252,246 @@ class PortfolioManager:
 
     def run_multi_strategy_backtest(
         self,
-        data_dict: Dict[str, pd.DataFrame],
-        initial_capital: float
+        data_dict: Dict[str, Union[pd.DataFrame, Dict[str, pd.DataFrame]]],
+        initial_capital: Optional[float] = None,
+        max_workers: Optional[int] = None,
+        enforce_heat: bool = True
     ) -> Dict:
         """
-        Run coordinated backtest across multiple strategies.
-
-        PHASE 5 IMPLEMENTATION (Stub for now)
+        Run coordinated backtest across multiple strategies with shared cash.
 
-        This method will:
+        Workflow:
         1. Allocate capital across strategies using allocate_capital()
-        2. Run each strategy independently
-        3. Combine portfolios using vbt.Portfolio.column_stack()
-        4. Track aggregate portfolio heat across all strategies
-        5. Enforce heat gating (reject trades exceeding 8% total heat)
-        6. Apply circuit breakers to combined equity
+           (split equally across symbols within a strategy)
+        2. Generate signals and position sizes for every (strategy, symbol)
+           in parallel with a process pool
+        3. Align all columns on the union of bar timestamps and run ONE
+           grouped vbt.Portfolio.from_signals() with cash_sharing=True
+           (call_seq='auto' so exits release cash before entries)
+        4. Enforce heat_manager.max_heat inside the simulation (compiled
+           signal_func_nb, see utils/heat_gating.py) and report aggregate
+           heat (open risk / equity) per bar
+        5. Apply circuit breakers to the combined equity curve
 
         Args:
-            data_dict: Dictionary mapping strategy_name -> OHLCV DataFrame
-            initial_capital: Total starting capital
+            data_dict: Dictionary mapping strategy name (get_strategy_name())
+                -> OHLCV DataFrame, or -> {symbol: OHLCV DataFrame} to run a
+                strategy across several symbols
+            initial_capital: Total starting capital (default: self.capital)
+            max_workers: Process pool size (None = CPU count, 1 = in-process)
+            enforce_heat: Reject entries that would push aggregate heat above
+                heat_manager.max_heat (False = measure heat only)
 
         Returns:
-            Dictionary containing combined portfolio results
+            Dictionary containing:
+            - 'portfolio': Grouped VBT Portfolio (one group, shared cash)
+            - 'metrics': total_return, sharpe_ratio, max_drawdown, total_trades,
+              win_rate, profit_factor
+            - 'equity_curve': Combined equity (pd.Series)
+            - 'portfolio_heat': Aggregate open risk / equity per bar
+            - 'max_heat': Highest aggregate heat reached
+            - 'heat_limit_bars': Bars where heat exceeded heat_manager.max_heat
+            - 'rejected_entries': Entries rejected by the heat gate per column
+            - 'circuit_breaker_triggers': List of (date, threshold, action)
+            - 'final_equity', 'drawdown_max', 'trading_halted'
+            - 'capital_allocation': Capital used for sizing per column
+
+        Raises:
+            ValueError: If data_dict is missing a strategy or has no data
+
+        Example:
+            >>> results = pm.run_multi_strategy_backtest(
+            ...     data_dict={
+            ...         'ORB - NVDA': nvda_5min,
+            ...         'Momentum': {'AAPL': aapl, 'MSFT': msft},
+            ...     },
+            ...     initial_capital=100000
+            ... )
+            >>> print(f"Max heat: {results['max_heat']:.1%}")
 
         Note:
-            Phase 4: This is a stub that raises NotImplementedError
-            Phase 5: Full implementation with multi-strategy coordination
+            - Heat gate uses stop distance at entry x shares as position risk
+            - Strategies must be picklable for max_workers != 1
         """
-        raise NotImplementedError(
-            "Multi-strategy backtest is Phase 5 feature. "
-            "For Phase 4, use run_single_strategy_with_gates()."
+        if initial_capital is None:
+            initial_capital = self.capital
+
+        # 1. Build (strategy, symbol, data, capital) jobs
+        allocations = self.allocate_capital()
+        scale = initial_capital / self.capital
+        jobs = []
+        for strategy in self.strategies:
+            name = strategy.get_strategy_name()
+            if name not in data_dict:
+                raise ValueError(
+                    f"data_dict has no data for strategy '{name}'. "
+                    f"Keys: {list(data_dict.keys())}"
+                )
+
+            strategy_data = data_dict[name]
+            if isinstance(strategy_data, pd.DataFrame):
+                symbol = getattr(strategy.config, 'symbol', name)
+                strategy_data = {symbol: strategy_data}
+
+            strategy_data = {
+                symbol: data for symbol, data in strategy_data.items() if len(data) > 0
+            }
+            if not strategy_data:
+                raise ValueError(f"No data for strategy '{name}'")
+
+            capital_per_symbol = allocations[name] * scale / len(strategy_data)
+            for symbol, data in strategy_data.items():
+                jobs.append((strategy, name, symbol, data, capital_per_symbol))
+
+        print(f"\n{'='*70}")
+        print("RUNNING MULTI-STRATEGY BACKTEST")
+        print(f"Strategies: {len(self.strategies)}, Columns: {len(jobs)}")
+        print(f"Capital: ${initial_capital:,.2f} (shared cash)")
+        print(f"{'='*70}")
+
+        # 2. Signals and sizes in parallel (one process per job)
+        if max_workers == 1 or len(jobs) == 1:
+            job_kwargs = [
+                _build_job_kwargs(strategy, data, capital)
+                for strategy, _, _, data, capital in jobs
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                job_kwargs = list(executor.map(
+                    _build_job_kwargs,
+                    [job[0] for job in jobs],
+                    [job[3] for job in jobs],
+                    [job[4] for job in jobs]
+                ))
+
+        # 3. One grouped simulation with shared cash
+        keys = pd.MultiIndex.from_tuples(
+            [(name, symbol) for _, name, symbol, _, _ in jobs],
+            names=['strategy', 'symbol']
+        )
+        index = job_kwargs[0]['close'].index
+        for kwargs in job_kwargs[1:]:
+            index = index.union(kwargs['close'].index)
+
+        def stack(field: str, fill_value=np.nan) -> pd.DataFrame:
+            """Align one kwarg across jobs (missing optional signals -> fill_value)."""
+            frames = [
+                pd.Series(fill_value, index=index) if kwargs[field] is None
+                else kwargs[field].reindex(index, fill_value=fill_value)
+                for kwargs in job_kwargs
+            ]
+            return pd.concat(frames, axis=1, keys=keys)
+
+        close = stack('close').ffill()
+        entries = stack('entries', False).astype(bool)
+        exits = stack('exits', False).astype(bool)
+        short_entries = stack('short_entries', False).astype(bool)
+        short_exits = stack('short_exits', False).astype(bool)
+        size = stack('size', 0.0)
+        sl_stop = stack('sl_stop')
+
+        sim_kwargs = dict(
+            close=close,
+            entries=entries,
+            exits=exits,
+            short_entries=short_entries,
+            short_exits=short_exits,
+            size=size,
+            size_type='amount',
+            init_cash=initial_capital,
+            fees=np.array([[kwargs['fees'] for kwargs in job_kwargs]]),
+            slippage=np.array([[kwargs['slippage'] for kwargs in job_kwargs]]),
+            sl_stop=sl_stop,
+            cash_sharing=True,
+            group_by=True,
+            call_seq='auto',
+            freq=job_kwargs[0]['freq']
         )
 
+        rejected = np.zeros(len(jobs), dtype=np.int64)
+        if enforce_heat:
+            sim_kwargs, rejected = apply_heat_gate(sim_kwargs, self.heat_manager.max_heat)
+
+        pf = vbt.Portfolio.from_signals(**sim_kwargs)
+
+        # 4. Aggregate heat: |shares| x stop distance at entry, over equity.
+        # The stop comes from the bar each position was actually entered;
+        # later entry signals (gated, or ignored while in a position) don't
+        # replace it.
+        equity_curve = pf.value
+        trades = pf.trades.records_arr
+        stops = sl_stop.to_numpy()
+        entry_stop = np.full(stops.shape, np.nan)
+        entry_stop[trades['entry_idx'], trades['col']] = stops[trades['entry_idx'], trades['col']]
+        entry_stop = pd.DataFrame(entry_stop, index=sl_stop.index, columns=sl_stop.columns).ffill()
+        open_risk = (pf.assets.abs() * entry_stop).sum(axis=1)
+        portfolio_heat = (open_risk / equity_curve).fillna(0.0)
+        heat_limit_bars = int((portfolio_heat > self.heat_manager.max_heat).sum())
+
+        # 5. Circuit breakers on combined equity
+        self.risk_manager.update_equity(initial_capital)
+        circuit_breaker_triggers = self.risk_manager.update_equity_curve(
+            equity_curve
+        )['triggers']
+
+        final_equity = equity_curve.iloc[-1]
+        drawdown_max = (equity_curve / equity_curve.cummax() - 1).min()
+        trading_halted = any(t[2] == 'STOP_TRADING' for t in circuit_breaker_triggers)
+
+        # All columns pooled into one set of trade statistics
+        trade_records = pf.trades.records_arr.copy()
+        trade_records['col'] = 0
+        trade_stats = compute_trade_statistics(trade_records).iloc[0]
+
+        metrics = {
+            'total_return': pf.total_return,
+            'sharpe_ratio': pf.sharpe_ratio,
+            'max_drawdown': pf.max_drawdown,
+            'total_trades': int(trade_stats['total_trades']),
+            'win_rate': trade_stats['win_rate'],
+            'profit_factor': trade_stats['profit_factor'],
+        }
+
+        self.current_equity = final_equity
+        self.peak_equity = self.risk_manager.peak_equity
+
+        print(f"\n{'-'*70}")
+        print("MULTI-STRATEGY RESULTS")
+        print(f"{'-'*70}")
+        print(f"Final Equity:    ${final_equity:,.2f}")
+        print(f"Total Return:    {metrics['total_return']:.2%}")
+        print(f"Sharpe Ratio:    {metrics['sharpe_ratio']:.2f}")
+        print(f"Max Drawdown:    {drawdown_max:.2%}")
+        print(f"Total Trades:    {metrics['total_trades']}")
+        print(f"Max Heat:        {portfolio_heat.max():.2%} "
+              f"({heat_limit_bars} bars above {self.heat_manager.max_heat:.0%})")
+        if enforce_heat:
+            print(f"Heat Rejections: {int(rejected.sum())} entries")
+
+        if circuit_breaker_triggers:
+            print(f"\nCircuit breaker triggers:")
+            for date, threshold, action in circuit_breaker_triggers:
+                print(f"{date}: {threshold:.0%} DD -> {action}")
+
+        print(f"{'='*70}\n")
+
+        return {
+            'portfolio': pf,
+            'metrics': metrics,
+            'equity_curve': equity_curve,
+            'portfolio_heat': portfolio_heat,
+            'max_heat': float(portfolio_heat.max()),
+            'heat_limit_bars': heat_limit_bars,
+            'rejected_entries': pd.Series(rejected, index=keys),
+            'circuit_breaker_triggers': circuit_breaker_triggers,
+            'final_equity': final_equity,
+            'drawdown_max': drawdown_max,
+            'trading_halted': trading_halted,
+            'capital_allocation': {
+                (name, symbol): capital for _, name, symbol, _, capital in jobs
+            }
+        }
+
     def get_portfolio_status(self) -> Dict:
         """
         Get current portfolio status and risk metrics.
@@ -353,3 +549,17 @@ class PortfolioManager:
         self.heat_manager.reset()
         self.current_equity = self.capital
         self.peak_equity = self.capital
+
+
+def _build_job_kwargs(
+    strategy: BaseStrategy,
+    data: pd.DataFrame,
+    capital: float
+) -> Dict:
+    """
+    Process-pool worker: signals + sizes for one (strategy, symbol) column.
+
+    Returns the same from_signals() kwargs as strategy.backtest(), so each
+    column of the combined simulation behaves like its single-strategy run.
+    """
+    return strategy._build_simulation_kwargs(data, capital, None)
@@ -8,10 +8,89 @@ or halt trading when drawdowns exceed defined thresholds.
 CRITICAL: This protects against catastrophic losses during adverse market
 conditions by automatically de-risking the portfolio.
 
+Batch evaluation:
+- update_equity_curve(): one equity curve, updates manager state
+- evaluate_equity_paths(): many (time x paths) curves, stateless, for
+  Monte Carlo stress tests of the threshold ladder
+
 Reference: System_Architecture_Reference.md lines 1444-1547
 """
 
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from numba import njit
+
+
+# Actions that drive circuit-breaker state (highest level first)
+CIRCUIT_BREAKER_ACTIONS = ('STOP_TRADING', 'REDUCE_SIZE', 'WARNING')
+
+
+@njit(cache=True)
+def circuit_breaker_paths_nb(
+    equity: np.ndarray,
+    thresholds: np.ndarray,
+    halt_level: float,
+    reduce_level: float,
+    warn_level: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Circuit-breaker state machine over many equity paths in one pass.
+
+    Per bar, same rules as RiskManager.check_circuit_breakers():
+    - dd >= halt_level: trading disabled, multiplier 0.0
+    - dd >= reduce_level: multiplier 0.5 (trading flag unchanged)
+    - dd >= warn_level: no change
+    - otherwise: trading enabled, multiplier 1.0
+
+    Args:
+        equity: Equity values, shape (time, paths)
+        thresholds: Drawdown levels to record first crossings for
+        halt_level: STOP_TRADING threshold
+        reduce_level: REDUCE_SIZE threshold
+        warn_level: WARNING threshold (below it, state resets to normal)
+
+    Returns:
+        (drawdown, risk_multiplier, trading_enabled, first_cross) where
+        first_cross has shape (thresholds, paths), -1 = never crossed
+    """
+    n_bars, n_paths = equity.shape
+    drawdown = np.zeros((n_bars, n_paths))
+    multiplier = np.ones((n_bars, n_paths))
+    enabled = np.ones((n_bars, n_paths), dtype=np.bool_)
+    first_cross = np.full((thresholds.shape[0], n_paths), -1, dtype=np.int64)
+
+    for p in range(n_paths):
+        peak = 0.0
+        mult = 1.0
+        trading = True
+        for i in range(n_bars):
+            value = equity[i, p]
+            if value > peak:
+                peak = value
+
+            dd = 0.0
+            if peak != 0 and not np.isnan(value):
+                dd = max((peak - value) / peak, 0.0)
+            drawdown[i, p] = dd
+
+            if dd >= halt_level:
+                trading = False
+                mult = 0.0
+            elif dd >= reduce_level:
+                mult = 0.5
+            elif dd < warn_level:
+                trading = True
+                mult = 1.0
+            multiplier[i, p] = mult
+            enabled[i, p] = trading
+
+            for t in range(thresholds.shape[0]):
+                if first_cross[t, p] == -1 and dd >= thresholds[t]:
+                    first_cross[t, p] = i
+
+    return drawdown, multiplier, enabled, first_cross
 
 
 class RiskManager:
@@ -65,6 +144,8 @@ class RiskManager:
 
         Raises:
             ValueError: If max_portfolio_heat or max_position_risk out of range
+            ValueError: If drawdown_thresholds has no STOP_TRADING,
+                        REDUCE_SIZE or WARNING level
         """
         if max_portfolio_heat < 0.06 or max_portfolio_heat > 0.10:
             raise ValueError(
@@ -90,6 +171,7 @@ class RiskManager:
             }
         else:
             self.drawdown_thresholds = drawdown_thresholds
+        self.circuit_breaker_levels()
 
         self.peak_equity = 0.0
         self.current_equity = 0.0
@@ -146,11 +228,33 @@ class RiskManager:
         drawdown = (self.peak_equity - self.current_equity) / self.peak_equity
         return max(0.0, drawdown)  # Ensure non-negative
 
+    def circuit_breaker_levels(self) -> Dict[str, float]:
+        """
+        Drawdown level per circuit-breaker action from drawdown_thresholds.
+
+        Used by check_circuit_breakers(), update_equity_curve() and
+        evaluate_equity_paths() so all three act on the same ladder.
+
+        Returns:
+            Dictionary mapping 'STOP_TRADING', 'REDUCE_SIZE' and 'WARNING'
+            to their (lowest) threshold
+
+        Raises:
+            ValueError: If any of those actions has no threshold
+        """
+        levels = {}
+        for threshold, action in self.drawdown_thresholds.items():
+            levels[action] = min(threshold, levels.get(action, np.inf))
+        missing = [a for a in CIRCUIT_BREAKER_ACTIONS if a not in levels]
+        if missing:
+            raise ValueError(f"drawdown_thresholds has no level for: {', '.join(missing)}")
+        return {action: levels[action] for action in CIRCUIT_BREAKER_ACTIONS}
+
     def check_circuit_breakers(self, drawdown: float):
         """
         Trigger actions based on drawdown thresholds.
 
-        Implements cascading circuit breakers:
+        Implements cascading circuit breakers (default drawdown_thresholds):
         - 10% DD: WARNING (log only)
         - 15% DD: REDUCE_SIZE (50% position size)
         - 20% DD: STOP_TRADING (halt new trades)
@@ -169,20 +273,22 @@ class RiskManager:
             >>> # Prints: "RISK REDUCTION: Position size reduced 50% at 16.0% drawdown"
             >>> print(risk_mgr.risk_multiplier)  # 0.5
         """
-        if drawdown >= 0.20:
+        levels = self.circuit_breaker_levels()
+
+        if drawdown >= levels['STOP_TRADING']:
             self.trading_enabled = False
             self.risk_multiplier = 0.0
             print(
                 f"CIRCUIT BREAKER: Trading halted at {drawdown:.1%} drawdown"
             )
 
-        elif drawdown >= 0.15:
+        elif drawdown >= levels['REDUCE_SIZE']:
             self.risk_multiplier = 0.5
             print(
                 f"RISK REDUCTION: Position size reduced 50% at {drawdown:.1%} drawdown"
             )
 
-        elif drawdown >= 0.10:
+        elif drawdown >= levels['WARNING']:
             print(f"WARNING: {drawdown:.1%} drawdown reached")
 
         else:
@@ -190,6 +296,158 @@ class RiskManager:
             self.trading_enabled = True
             self.risk_multiplier = 1.0
 
+    def update_equity_curve(self, equity_curve: pd.Series) -> Dict:
+        """
+        Vectorized equivalent of calling update_equity() for every bar.
+
+        Computes the running peak and drawdown for the whole curve at once,
+        finds the first crossing of each circuit_breaker_levels() level, and
+        sets the final state (peak, current equity, trading_enabled,
+        risk_multiplier) exactly as the bar-by-bar loop would. No per-bar
+        console output.
+
+        Trigger semantics match the bar-by-bar recording loop: each bar
+        records at most one trigger, the highest level reached that has not
+        been recorded yet. So a jump straight to 22% records STOP_TRADING on
+        that bar and REDUCE_SIZE on the next bar still >= 15%.
+
+        Args:
+            equity_curve: Equity values with DatetimeIndex (e.g., pf.value)
+
+        Returns:
+            Dictionary containing:
+            - 'drawdown': pd.Series of drawdown from running peak (decimal)
+            - 'triggers': List of (date, threshold, action) in bar order
+
+        Example:
+            >>> result = risk_mgr.update_equity_curve(pf.value)
+            >>> for date, threshold, action in result['triggers']:
+            ...     print(f"{date}: {threshold:.0%} DD -> {action}")
+            >>> risk_mgr.is_trading_allowed()
+        """
+        equity = np.asarray(equity_curve, dtype=np.float64)
+
+        if len(equity) == 0:
+            return {'drawdown': pd.Series(dtype=float), 'triggers': []}
+
+        # Running peak continues from the current peak (NaN never sets a peak)
+        peak = np.fmax(np.fmax.accumulate(equity), self.peak_equity)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            drawdown = np.where(peak == 0, 0.0, (peak - equity) / peak)
+        drawdown = np.fmax(drawdown, 0.0)
+
+        # First crossing per level; a bar claimed by a higher level can't
+        # also record a lower one (one trigger per bar)
+        levels = self.circuit_breaker_levels()
+        triggers = []
+        claimed = set()
+        for action in CIRCUIT_BREAKER_ACTIONS:
+            threshold = levels[action]
+            for idx in np.flatnonzero(drawdown >= threshold):
+                if idx not in claimed:
+                    claimed.add(idx)
+                    triggers.append((idx, threshold, action))
+                    break
+        triggers.sort(key=lambda t: t[0])
+
+        # Final state: last bar that sets each flag (see check_circuit_breakers)
+        halted = drawdown >= levels['STOP_TRADING']
+        reduced = (drawdown >= levels['REDUCE_SIZE']) & ~halted
+        normal = drawdown < levels['WARNING']
+
+        enabled_setters = np.flatnonzero(halted | normal)
+        if len(enabled_setters):
+            self.trading_enabled = bool(normal[enabled_setters[-1]])
+
+        multiplier_setters = np.flatnonzero(halted | reduced | normal)
+        if len(multiplier_setters):
+            last = multiplier_setters[-1]
+            self.risk_multiplier = 0.0 if halted[last] else (0.5 if reduced[last] else 1.0)
+
+        self.peak_equity = float(peak[-1])
+        self.current_equity = float(equity[-1])
+
+        index = equity_curve.index if isinstance(equity_curve, pd.Series) else pd.RangeIndex(len(equity))
+
+        return {
+            'drawdown': pd.Series(drawdown, index=index),
+            'triggers': [(index[idx], threshold, action) for idx, threshold, action in triggers]
+        }
+
+    def evaluate_equity_paths(
+        self,
+        equity_paths: Union[np.ndarray, pd.DataFrame]
+    ) -> Dict:
+        """
+        Evaluate circuit breakers on many equity paths at once (stateless).
+
+        Each path is run as if by a fresh RiskManager with the same
+        drawdown_thresholds calling update_equity() on every bar (see
+        circuit_breaker_levels()). The
+        compiled kernel (circuit_breaker_paths_nb) does the work; this
+        manager's own state is not touched and nothing is printed.
+
+        Args:
+            equity_paths: Equity values, shape (time, paths), e.g. Monte Carlo
+                simulations. A DataFrame keeps its index and columns; a 1-D
+                array is treated as one path.
+
+        Returns:
+            Dictionary containing:
+            - 'drawdown': DataFrame (time x paths) of drawdown from peak
+            - 'risk_multiplier': DataFrame (time x paths) of size multiplier
+            - 'trading_enabled': DataFrame (time x paths) of bools
+            - 'first_crossing': DataFrame (threshold x paths) with the first
+              bar position where drawdown >= threshold (-1 = never)
+            - 'crossing_probability': Series, fraction of paths crossing each
+              threshold
+
+        Raises:
+            ValueError: If equity_paths is not 1-D or 2-D, or the ladder has
+                no STOP_TRADING / REDUCE_SIZE / WARNING level
+
+        Example:
+            >>> paths = 100000 * np.exp(np.cumsum(returns, axis=0))  # (252, 10000)
+            >>> result = risk_mgr.evaluate_equity_paths(paths)
+            >>> print(result['crossing_probability'])
+            >>> halted_share = (~result['trading_enabled']).iloc[-1].mean()
+        """
+        if isinstance(equity_paths, pd.DataFrame):
+            index, columns = equity_paths.index, equity_paths.columns
+            equity = equity_paths.to_numpy(dtype=np.float64)
+        else:
+            equity = np.asarray(equity_paths, dtype=np.float64)
+            if equity.ndim == 1:
+                equity = equity[:, None]
+            if equity.ndim != 2:
+                raise ValueError(
+                    f"equity_paths must be 1-D or 2-D (time x paths), got {equity.ndim}-D"
+                )
+            index, columns = pd.RangeIndex(equity.shape[0]), pd.RangeIndex(equity.shape[1])
+
+        levels = self.circuit_breaker_levels()
+        thresholds = np.array(sorted(self.drawdown_thresholds), dtype=np.float64)
+
+        drawdown, multiplier, enabled, first_cross = circuit_breaker_paths_nb(
+            np.ascontiguousarray(equity),
+            thresholds,
+            levels['STOP_TRADING'],
+            levels['REDUCE_SIZE'],
+            levels['WARNING']
+        )
+
+        threshold_index = pd.Index(thresholds, name='threshold')
+        first_crossing = pd.DataFrame(first_cross, index=threshold_index, columns=columns)
+
+        return {
+            'drawdown': pd.DataFrame(drawdown, index=index, columns=columns),
+            'risk_multiplier': pd.DataFrame(multiplier, index=index, columns=columns),
+            'trading_enabled': pd.DataFrame(enabled, index=index, columns=columns),
+            'first_crossing': first_crossing,
+            'crossing_probability': (first_crossing >= 0).mean(axis=1)
+        }
+
     def validate_position_size(
         self,
         position_size: float,
@@ -0,0 +1,243 @@
+"""
+Heat-Budgeted Setup Selection
+
+Picks the best subset of candidate setups at each decision time (e.g., each
+trading day) subject to:
+- Portfolio heat budget: sum(stop_distance x size) <= max_heat x capital
+- Maximum number of positions
+
+All decision times are solved in one compiled pass: candidates are sorted
+once by (decision time, score), then a Numba kernel walks the groups.
+
+Methods:
+- 'greedy': Take candidates in score order, skip any that would break the
+  heat budget or position limit. O(n) over all setups.
+- 'dp': Exact 0/1 knapsack with a cardinality limit (maximize total score).
+  Risk is discretized to `resolution` (fraction of capital), rounded UP so
+  the selected subset never exceeds the real budget.
+  O(n_group x max_positions x budget / resolution) per group.
+
+Greedy matches "top N by score" whenever heat is not binding. DP helps when
+one high-score, wide-stop setup would crowd out two almost-as-good ones.
+
+Usage:
+    >>> setups['risk'] = setup_risk(setups, capital=100000, risk_pct=0.02)
+    >>> mask = select_setups(setups, capital=100000, max_heat=0.08, max_positions=3)
+    >>> selected = setups[mask]
+
+Reference: utils/portfolio_heat.py (PortfolioHeatManager)
+"""
+
+import numpy as np
+import pandas as pd
+from numba import njit
+
+
+@njit(cache=True)
+def greedy_select_nb(
+    group_starts: np.ndarray,
+    risk: np.ndarray,
+    budget: float,
+    max_positions: int
+) -> np.ndarray:
+    """
+    Greedy selection per group (rows pre-sorted by score, descending).
+
+    Args:
+        group_starts: Start offset of each group, plus total length at the end
+        risk: Risk per candidate as fraction of capital
+        budget: Heat budget as fraction of capital
+        max_positions: Maximum selected candidates per group
+
+    Returns:
+        Boolean selection mask (sorted order)
+    """
+    selected = np.zeros(risk.shape[0], dtype=np.bool_)
+    for g in range(group_starts.shape[0] - 1):
+        heat = 0.0
+        count = 0
+        for i in range(group_starts[g], group_starts[g + 1]):
+            if count >= max_positions:
+                break
+            r = risk[i]
+            if np.isnan(r) or r < 0:
+                continue
+            if heat + r <= budget + 1e-12:
+                selected[i] = True
+                heat += r
+                count += 1
+    return selected
+
+
+@njit(cache=True)
+def knapsack_select_nb(
+    group_starts: np.ndarray,
+    weight: np.ndarray,
+    score: np.ndarray,
+    capacity: int,
+    max_positions: int
+) -> np.ndarray:
+    """
+    Exact cardinality-constrained 0/1 knapsack per group.
+
+    Args:
+        group_starts: Start offset of each group, plus total length at the end
+        weight: Integer risk units per candidate (-1 = not selectable)
+        score: Score per candidate (only positive scores are worth selecting)
+        capacity: Heat budget in risk units
+        max_positions: Maximum selected candidates per group
+
+    Returns:
+        Boolean selection mask (sorted order)
+    """
+    selected = np.zeros(weight.shape[0], dtype=np.bool_)
+    n_k = max_positions + 1
+    n_w = capacity + 1
+
+    for g in range(group_starts.shape[0] - 1):
+        start = group_starts[g]
+        n = group_starts[g + 1] - start
+        if n == 0:
+            continue
+
+        # best[k, w] = max score using exactly <= k items and <= w units
+        best = np.zeros((n_k, n_w))
+        take = np.zeros((n, n_k, n_w), dtype=np.bool_)
+
+        for j in range(n):
+            w_j = weight[start + j]
+            s_j = score[start + j]
+            if w_j < 0 or w_j > capacity or not (s_j > 0):
+                continue
+            for k in range(max_positions, 0, -1):
+                for w in range(capacity, w_j - 1, -1):
+                    candidate = best[k - 1, w - w_j] + s_j
+                    if candidate > best[k, w]:
+                        best[k, w] = candidate
+                        take[j, k, w] = True
+
+        # Backtrack from the full budget
+        k = max_positions
+        w = capacity
+        for j in range(n - 1, -1, -1):
+            if k > 0 and take[j, k, w]:
+                selected[start + j] = True
+                w -= weight[start + j]
+                k -= 1
+
+    return selected
+
+
+def setup_risk(
+    setups: pd.DataFrame,
+    capital: float,
+    risk_pct: float = 0.02,
+    stop_col: str = 'stop_distance',
+    price_col: str = 'entry_price',
+    size_col: str = 'size'
+) -> pd.Series:
+    """
+    Dollar risk per setup: stop_distance x size.
+
+    Uses the 'size' column when present. Otherwise sizes each setup with the
+    ATR formula from calculate_position_size_atr():
+    min(capital x risk_pct / stop_distance, capital / entry_price).
+
+    Args:
+        setups: Candidate setups (one row per setup)
+        capital: Account size used for sizing
+        risk_pct: Risk per trade as decimal
+        stop_col: Column with stop distance in price units
+        price_col: Column with entry price
+        size_col: Optional column with size in shares
+
+    Returns:
+        Series of dollar risk per setup (NaN where stop or price is invalid)
+    """
+    stop = setups[stop_col].astype(float)
+
+    if size_col in setups.columns:
+        size = setups[size_col].astype(float)
+    else:
+        price = setups[price_col].astype(float)
+        valid = (stop > 0) & (price > 0)
+        size = np.minimum(capital * risk_pct / stop, capital / price).where(valid)
+
+    return (stop * size).rename('risk')
+
+
+def select_setups(
+    setups: pd.DataFrame,
+    capital: float,
+    max_heat: float = 0.08,
+    max_positions: int = 3,
+    method: str = 'greedy',
+    group_col: str = 'date',
+    score_col: str = 'quality_score',
+    risk_col: str = 'risk',
+    resolution: float = 0.0001
+) -> pd.Series:
+    """
+    Select the best subset of setups per decision time under heat limits.
+
+    Args:
+        setups: Candidate setups with group, score and dollar risk columns
+            (see setup_risk())
+        capital: Account size (heat budget = max_heat x capital)
+        max_heat: Maximum portfolio heat as decimal
+        max_positions: Maximum selected setups per decision time
+        method: 'greedy' (score order) or 'dp' (exact knapsack)
+        group_col: Decision-time column (e.g., 'date' or 'datetime')
+        score_col: Column to maximize
+        risk_col: Dollar risk column
+        resolution: DP risk unit as fraction of capital (default 0.01%)
+
+    Returns:
+        Boolean Series aligned to setups.index (True = selected)
+
+    Raises:
+        ValueError: If method is unknown or limits are not positive
+
+    Example:
+        >>> setups['risk'] = setup_risk(setups, capital=100000)
+        >>> mask = select_setups(setups, 100000, max_heat=0.08, method='dp')
+        >>> print(setups[mask].groupby('date')['risk'].sum().max() / 100000)
+    """
+    if method not in ('greedy', 'dp'):
+        raise ValueError(f"method must be 'greedy' or 'dp', got {method!r}")
+    if capital <= 0 or max_heat <= 0 or max_positions < 1:
+        raise ValueError(
+            f"capital, max_heat and max_positions must be positive. "
+            f"Got capital={capital}, max_heat={max_heat}, max_positions={max_positions}"
+        )
+    if method == 'dp' and resolution <= 0:
+        raise ValueError(f"resolution must be positive, got {resolution}")
+
+    if len(setups) == 0:
+        return pd.Series(False, index=setups.index, dtype=bool)
+
+    # One sort for all decision times: group ascending, score descending
+    group_codes, _ = pd.factorize(setups[group_col], sort=True)
+    score = setups[score_col].to_numpy(dtype=np.float64)
+    order = np.lexsort((-np.nan_to_num(score, nan=-np.inf), group_codes))
+
+    sorted_codes = group_codes[order]
+    boundaries = np.flatnonzero(np.diff(sorted_codes)) + 1
+    group_starts = np.concatenate(([0], boundaries, [len(order)])).astype(np.int64)
+
+    risk = setups[risk_col].to_numpy(dtype=np.float64)[order] / capital
+
+    if method == 'greedy':
+        selected_sorted = greedy_select_nb(group_starts, risk, max_heat, max_positions)
+    else:
+        capacity = int(np.floor(max_heat / resolution + 1e-9))
+        weight = np.where(
+            np.isnan(risk) | (risk < 0), -1, np.ceil(risk / resolution - 1e-9)
+        ).astype(np.int64)
+        selected_sorted = knapsack_select_nb(
+            group_starts, weight, score[order], capacity, max_positions
+        )
+
+    mask = np.zeros(len(setups), dtype=bool)
+    mask[order] = selected_sorted
+    return pd.Series(mask, index=setups.index, name='selected')
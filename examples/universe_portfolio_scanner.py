@@ -8,7 +8,9 @@ a single symbol, it:
 1. Scans 20 high-volatility stocks daily for qualifying ORB setups
 2. Ranks setups by quality (volume surge + ATR% + breakout conviction)
 3. Selects best 1-3 setups per day respecting 8% portfolio heat constraint
-4. Simulates portfolio performance with position-level tracking
+   (heat-budgeted subset selection, core/setup_selection.py)
+4. Simulates portfolio performance in one grouped, cash-sharing simulation
+   (simulate_portfolio_shared; per-symbol simulate_portfolio kept)
 
 Universe Criteria:
 - ATR% > 3% (high daily volatility)
@@ -35,6 +37,9 @@ Future Refinements (Phase 6):
 """
 
 import sys
+import time as timer
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import pandas as pd
@@ -48,6 +53,7 @@ sys.path.insert(0, str(project_root))
 
 from strategies.orb import ORBStrategy, ORBConfig
 from core.portfolio_manager import PortfolioManager
+from core.setup_selection import select_setups, setup_risk
 from utils.portfolio_heat import PortfolioHeatManager
 from core.risk_manager import RiskManager
 import vectorbtpro as vbt
@@ -124,23 +130,28 @@ def calculate_setup_quality_score(
 
     Returns:
         Quality score (0-100, higher = better setup)
+
+    Note:
+        A NaN factor input (e.g., ATR or volume MA still warming up) scores
+        0 points for that factor instead of its cap.
     """
     score = 0.0
 
     # 1. Volume surge (0-40 points)
     # 2.0x = 20 pts, 3.0x = 30 pts, 4.0x+ = 40 pts
-    volume_score = min(40, (volume_surge_ratio - 1.0) * 20)
-    score += volume_score
+    # (NaN checked on the input: min(40, nan) is 40, not nan)
+    if not np.isnan(volume_surge_ratio):
+        score += min(40, (volume_surge_ratio - 1.0) * 20)
 
     # 2. ATR% (0-30 points)
     # 3% = 15 pts, 5% = 25 pts, 7%+ = 30 pts
-    atr_score = min(30, atr_pct * 500)
-    score += atr_score
+    if not np.isnan(atr_pct):
+        score += min(30, atr_pct * 500)
 
     # 3. Breakout conviction (0-20 points)
     # 0.5 ATR = 10 pts, 1.0 ATR = 20 pts
-    conviction_score = min(20, breakout_conviction_pct * 20)
-    score += conviction_score
+    if not np.isnan(breakout_conviction_pct):
+        score += min(20, breakout_conviction_pct * 20)
 
     # 4. Time of day (0-10 points)
     # 10:00 AM = 10 pts, 12:00 PM = 5 pts, 2:00 PM = 2 pts
@@ -165,6 +176,229 @@ def calculate_setup_quality_score(
     return score
 
 
+# Priority tier bonus points (factor 5 of calculate_setup_quality_score)
+PRIORITY_BONUS = {'High': 10.0, 'Medium': 5.0, 'Low': 0.0}
+
+
+def calculate_setup_quality_scores(
+    volume_surge_ratio: np.ndarray,
+    atr_pct: np.ndarray,
+    breakout_conviction_pct: np.ndarray,
+    entry_times: pd.DatetimeIndex,
+    priority_bonus: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized calculate_setup_quality_score() for many setups at once.
+
+    Same five factors and caps as the scalar version, computed as array
+    operations (time-of-day buckets via np.select). NaN factor inputs score
+    0 points, as in the scalar version.
+
+    Args:
+        volume_surge_ratio: Volume / 20-bar volume MA per setup
+        atr_pct: ATR as fraction of close per setup
+        breakout_conviction_pct: Distance above opening range in ATR units
+        entry_times: Breakout bar timestamps
+        priority_bonus: Priority tier points per setup (see PRIORITY_BONUS)
+
+    Returns:
+        Quality scores (higher = better setup)
+    """
+    hour = entry_times.hour.to_numpy() + entry_times.minute.to_numpy() / 60.0
+    time_score = np.select([hour < 11.0, hour < 12.5, hour < 14.0], [10.0, 7.0, 4.0], default=2.0)
+
+    def capped(values, factor: float, cap: float) -> np.ndarray:
+        """min(cap, values x factor) with NaN -> 0 points."""
+        points = np.minimum(cap, np.asarray(values, dtype=float) * factor)
+        return np.where(np.isnan(points), 0.0, points)
+
+    return (
+        capped(np.asarray(volume_surge_ratio, dtype=float) - 1.0, 20, 40)
+        + capped(atr_pct, 500, 30)
+        + capped(breakout_conviction_pct, 20, 20)
+        + time_score
+        + np.asarray(priority_bonus, dtype=float)
+    )
+
+
+def build_setups_table(
+    symbol: str,
+    data_5min: pd.DataFrame,
+    signals: Dict[str, pd.Series],
+    universe_metadata: Dict
+) -> pd.DataFrame:
+    """
+    Score every long entry of one symbol and return a columnar setups table.
+
+    Pulls all inputs for the entry bars with one boolean mask per column
+    (no per-entry .loc lookups), then scores them with
+    calculate_setup_quality_scores().
+
+    Args:
+        symbol: Stock ticker
+        data_5min: 5-minute OHLCV bars
+        signals: ORBStrategy.generate_signals() output (needs 'long_entries',
+            'volume_ma', 'atr', 'opening_high', 'stop_distance')
+        universe_metadata: Universe configuration dict
+
+    Returns:
+        DataFrame with one row per setup: datetime, date, symbol,
+        quality_score, volume_surge, atr_pct, breakout_conviction,
+        entry_price, stop_distance, sector
+    """
+    mask = signals['long_entries'].to_numpy(dtype=bool)
+    entry_times = data_5min.index[mask]
+
+    close = data_5min['Close'].to_numpy(dtype=float)[mask]
+    volume = data_5min['Volume'].to_numpy(dtype=float)[mask]
+    volume_ma = signals['volume_ma'].to_numpy(dtype=float)[mask]
+    atr = signals['atr'].to_numpy(dtype=float)[mask]
+    opening_high = signals['opening_high'].to_numpy(dtype=float)[mask]
+    stop_distance = signals['stop_distance'].to_numpy(dtype=float)[mask]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        volume_surge = volume / volume_ma
+        atr_pct = atr / close
+        conviction = np.where(atr > 0, (close - opening_high) / atr, 0.0)
+
+    metadata = universe_metadata.get(symbol, {})
+    bonus = PRIORITY_BONUS.get(metadata.get('priority', 'Low'), 0.0)
+
+    scores = calculate_setup_quality_scores(
+        volume_surge, atr_pct, conviction, entry_times, np.full(len(entry_times), bonus)
+    )
+
+    return pd.DataFrame({
+        'datetime': entry_times,
+        'date': entry_times.date,
+        'symbol': symbol,
+        'quality_score': scores,
+        'volume_surge': volume_surge,
+        'atr_pct': atr_pct,
+        'breakout_conviction': conviction,
+        'entry_price': close,
+        'stop_distance': stop_distance,
+        'sector': metadata.get('sector')
+    })
+
+
+# Float columns shipped back by scan workers (symbol/sector/datetime rebuilt)
+SETUP_ARRAY_COLUMNS = (
+    'quality_score', 'volume_surge', 'atr_pct', 'breakout_conviction',
+    'entry_price', 'stop_distance'
+)
+
+
+def scan_symbol(
+    symbol: str,
+    universe_metadata: Dict,
+    start_date: str,
+    end_date: str,
+    return_data: bool = False
+) -> Dict:
+    """
+    Fetch, generate signals and score setups for one symbol.
+
+    Runs in the scanner process (serial scan) or in a pool worker (parallel
+    scan). Errors are caught and returned so one symbol never stops the scan.
+
+    Args:
+        symbol: Stock ticker
+        universe_metadata: Universe configuration dict
+        start_date: Scan start date
+        end_date: Scan end date
+        return_data: Also return the 5-minute bars (serial scan only; avoids
+            shipping bars back from workers)
+
+    Returns:
+        Dictionary containing:
+        - 'symbol': Ticker
+        - 'setups': Columnar arrays ('datetime_utc', 'tz' and
+          SETUP_ARRAY_COLUMNS), None on error or missing data
+        - 'n_bars': Number of 5-minute bars fetched
+        - 'elapsed': Seconds spent on this symbol
+        - 'error': Error message with traceback, or None
+        - 'data': 5-minute bars if return_data else None
+    """
+    start = timer.perf_counter()
+    result = {'symbol': symbol, 'setups': None, 'n_bars': 0, 'error': None, 'data': None}
+
+    try:
+        orb_config = ORBConfig(
+            name=f"ORB_{symbol}",
+            symbol=symbol,
+            opening_minutes=5,  # 5-minute range (validated in Session 8)
+            atr_stop_multiplier=2.5,
+            volume_multiplier=2.0,
+            start_date=start_date,
+            end_date=end_date
+        )
+        orb_strategy = ORBStrategy(orb_config)
+
+        data_5min, _ = orb_strategy.fetch_data()
+        result['n_bars'] = len(data_5min)
+
+        if len(data_5min) > 0:
+            signals = orb_strategy.generate_signals(data_5min)
+            table = build_setups_table(symbol, data_5min, signals, universe_metadata)
+
+            entry_times = pd.DatetimeIndex(table['datetime'])
+            tz = entry_times.tz
+            result['setups'] = {
+                'datetime_utc': (entry_times.tz_convert('UTC').tz_localize(None)
+                                 if tz is not None else entry_times).to_numpy(),
+                'tz': str(tz) if tz is not None else None,
+                **{col: table[col].to_numpy(dtype=np.float64) for col in SETUP_ARRAY_COLUMNS}
+            }
+            if return_data:
+                result['data'] = data_5min
+
+    except Exception as e:
+        result['error'] = f"{e}\n{traceback.format_exc()}"
+
+    result['elapsed'] = timer.perf_counter() - start
+    return result
+
+
+def assemble_setups(results: List[Dict], universe_metadata: Dict) -> pd.DataFrame:
+    """
+    Build the setups table from scan_symbol() results in one concat per column.
+
+    Args:
+        results: scan_symbol() outputs (symbols without setups are skipped)
+        universe_metadata: Universe configuration dict (for sector)
+
+    Returns:
+        Setups DataFrame with the same columns as build_setups_table()
+    """
+    parts = [r for r in results if r['setups'] is not None and len(r['setups']['datetime_utc'])]
+    if not parts:
+        return pd.DataFrame()
+
+    counts = [len(r['setups']['datetime_utc']) for r in parts]
+    symbols = [r['symbol'] for r in parts]
+
+    datetimes = pd.DatetimeIndex(np.concatenate([r['setups']['datetime_utc'] for r in parts]))
+    tz = parts[0]['setups']['tz']
+    if tz is not None:
+        datetimes = datetimes.tz_localize('UTC').tz_convert(tz)
+
+    table = {
+        'datetime': datetimes,
+        'date': datetimes.date,
+        'symbol': np.repeat(symbols, counts),
+    }
+    for col in SETUP_ARRAY_COLUMNS:
+        table[col] = np.concatenate([r['setups'][col] for r in parts])
+    table['sector'] = np.repeat(
+        [universe_metadata.get(sym, {}).get('sector') for sym in symbols], counts
+    )
+
+    columns = ['datetime', 'date', 'symbol', 'quality_score', 'volume_surge', 'atr_pct',
+               'breakout_conviction', 'entry_price', 'stop_distance', 'sector']
+    return pd.DataFrame(table)[columns]
+
+
 # =============================================================================
 # Universe Scanner
 # =============================================================================
@@ -205,12 +439,28 @@ class UniverseScanner:
         self.daily_setups = defaultdict(list)  # date -> list of (symbol, score, signals)
         self.selected_trades = []  # list of selected trades
 
-    def scan_universe(self) -> pd.DataFrame:
+        # Bars fetched during scan_universe(), reused by simulate_portfolio()
+        self.market_data: Dict[str, pd.DataFrame] = {}
+
+        # Seconds per symbol from the last scan_universe()
+        self.scan_timings = pd.Series(dtype=float, name='seconds')
+
+    def scan_universe(
+        self,
+        parallel: bool = False,
+        max_workers: Optional[int] = None
+    ) -> pd.DataFrame:
         """
         Scan all symbols and build daily setup opportunities.
 
+        Args:
+            parallel: Dispatch symbols to a process pool (scales with cores
+                for large universes). Bars stay in the workers, so
+                simulate_portfolio() fetches them on demand.
+            max_workers: Pool size (default: CPU count)
+
         Returns:
-            DataFrame with columns: date, symbol, score, entry_signals, exit_signals
+            Columnar setups table (see build_setups_table()), all symbols
         """
         print("="*70)
         print("UNIVERSE SCANNER: Building ORB Setup Database")
@@ -219,87 +469,56 @@ class UniverseScanner:
         print(f"Period: {self.start_date} to {self.end_date}")
         print(f"Max positions: {self.max_positions}")
         print(f"Portfolio heat limit: {self.max_portfolio_heat:.0%}")
-
-        all_setups = []
-
-        for symbol, metadata in self.universe.items():
-            print(f"\n--- Scanning {symbol} ({metadata['sector']}) ---")
-
-            try:
-                # Initialize ORB strategy for this symbol
-                orb_config = ORBConfig(
-                    name=f"ORB_{symbol}",
-                    symbol=symbol,
-                    opening_minutes=5,  # 5-minute range (validated in Session 8)
-                    atr_stop_multiplier=2.5,
-                    volume_multiplier=2.0,
-                    start_date=self.start_date,
-                    end_date=self.end_date
+        print(f"Mode: {'parallel' if parallel else 'serial'}")
+
+        scan_start = timer.perf_counter()
+        results = {}
+
+        if parallel:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        scan_symbol, symbol, self.universe, self.start_date, self.end_date
+                    ): symbol
+                    for symbol in self.universe
+                }
+                for future in as_completed(futures):
+                    symbol = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        # Worker crash (BrokenProcessPool) or pickling failure:
+                        # record it as this symbol's error, like scan_symbol()
+                        result = {'symbol': symbol, 'setups': None, 'n_bars': 0,
+                                  'error': f"{e}\n{traceback.format_exc()}",
+                                  'data': None, 'elapsed': 0.0}
+                    results[symbol] = result
+                    self._report_scan_result(result)
+        else:
+            for symbol, metadata in self.universe.items():
+                print(f"\n--- Scanning {symbol} ({metadata['sector']}) ---")
+                result = scan_symbol(
+                    symbol, self.universe, self.start_date, self.end_date, return_data=True
                 )
+                if result['data'] is not None:
+                    self.market_data[symbol] = result.pop('data')
+                results[symbol] = result
+                self._report_scan_result(result)
+
+        wall_time = timer.perf_counter() - scan_start
+        self.scan_timings = pd.Series(
+            {symbol: r['elapsed'] for symbol, r in results.items()}, name='seconds'
+        )
 
-                orb_strategy = ORBStrategy(orb_config)
-
-                # Fetch data
-                data_5min, data_daily = orb_strategy.fetch_data()
-
-                if len(data_5min) == 0:
-                    print(f"[WARNING] No data for {symbol}, skipping")
-                    continue
-
-                # Generate signals
-                signals = orb_strategy.generate_signals(data_5min)
-
-                # Find entry points and score them
-                entry_bars = signals['long_entries'][signals['long_entries'] == True]
-
-                print(f"Found {len(entry_bars)} potential setups for {symbol}")
-
-                for entry_time in entry_bars.index:
-                    # Calculate quality score
-                    volume_surge = (
-                        data_5min.loc[entry_time, 'Volume'] /
-                        signals['volume_ma'].loc[entry_time]
-                    )
-
-                    atr = signals['atr'].loc[entry_time]
-                    close = data_5min.loc[entry_time, 'Close']
-                    atr_pct = atr / close
-
-                    opening_high = signals['opening_high'].loc[entry_time]
-                    breakout_distance = close - opening_high
-                    breakout_conviction_pct = breakout_distance / atr if atr > 0 else 0
-
-                    quality_score = calculate_setup_quality_score(
-                        symbol=symbol,
-                        volume_surge_ratio=volume_surge,
-                        atr_pct=atr_pct,
-                        breakout_conviction_pct=breakout_conviction_pct,
-                        time_of_day=entry_time.time(),
-                        universe_metadata=self.universe
-                    )
-
-                    # Store setup
-                    all_setups.append({
-                        'datetime': entry_time,
-                        'date': entry_time.date(),
-                        'symbol': symbol,
-                        'quality_score': quality_score,
-                        'volume_surge': volume_surge,
-                        'atr_pct': atr_pct,
-                        'breakout_conviction': breakout_conviction_pct,
-                        'entry_price': close,
-                        'stop_distance': signals['stop_distance'].loc[entry_time],
-                        'sector': metadata['sector']
-                    })
-
-            except Exception as e:
-                print(f"[ERROR] Failed to scan {symbol}: {str(e)}")
-                import traceback
-                traceback.print_exc()
-                continue
+        # Assemble in universe order
+        setups_df = assemble_setups(
+            [results[s] for s in self.universe if s in results], self.universe
+        )
 
-        # Convert to DataFrame
-        setups_df = pd.DataFrame(all_setups)
+        print(f"\nScan time: {wall_time:.1f}s wall, {self.scan_timings.sum():.1f}s total "
+              f"symbol time ({self.scan_timings.sum() / max(wall_time, 1e-9):.1f}x)")
+        print(f"Slowest: {self.scan_timings.idxmax()} ({self.scan_timings.max():.1f}s)"
+              if len(self.scan_timings) else "Slowest: n/a")
 
         if len(setups_df) > 0:
             print(f"\n{'='*70}")
@@ -314,38 +533,63 @@ class UniverseScanner:
 
         return setups_df
 
-    def select_daily_top_setups(self, setups_df: pd.DataFrame) -> pd.DataFrame:
+    @staticmethod
+    def _report_scan_result(result: Dict):
+        """Print per-symbol scan outcome and timing."""
+        symbol = result['symbol']
+        if result['error'] is not None:
+            print(f"[ERROR] Failed to scan {symbol}: {result['error']}")
+        elif result['n_bars'] == 0:
+            print(f"[WARNING] No data for {symbol}, skipping")
+        else:
+            n_setups = len(result['setups']['datetime_utc'])
+            print(f"Found {n_setups} potential setups for {symbol} "
+                  f"({result['n_bars']} bars, {result['elapsed']:.2f}s)")
+
+    def select_daily_top_setups(
+        self,
+        setups_df: pd.DataFrame,
+        capital: float = 100000,
+        risk_pct: float = 0.02,
+        method: str = 'greedy'
+    ) -> pd.DataFrame:
         """
-        Select top N setups per day based on quality score.
+        Select best setups per day under the heat and position limits.
+
+        Risk per setup is stop_distance x size (ATR sizing at `capital`).
+        Selection for all days runs in one pass (core/setup_selection.py).
 
         Args:
             setups_df: DataFrame with all potential setups
+            capital: Account size for sizing and the heat budget
+            risk_pct: Risk per trade as decimal
+            method: 'greedy' (score order) or 'dp' (best-score subset)
 
         Returns:
-            DataFrame with only selected setups (filtered by quality ranking)
+            DataFrame with only selected setups (with 'risk' column added)
         """
         print(f"\n{'='*70}")
         print("DAILY SETUP SELECTION")
         print(f"{'='*70}")
 
-        selected_setups = []
-
-        # Group by trading date
-        for date, day_setups in setups_df.groupby('date'):
-            # Sort by quality score (descending)
-            day_setups_sorted = day_setups.sort_values('quality_score', ascending=False)
-
-            # Select top N (respecting max_positions limit)
-            top_setups = day_setups_sorted.head(self.max_positions)
-
-            selected_setups.append(top_setups)
+        setups_df = setups_df.assign(risk=setup_risk(setups_df, capital, risk_pct))
+        mask = select_setups(
+            setups_df,
+            capital=capital,
+            max_heat=self.max_portfolio_heat,
+            max_positions=self.max_positions,
+            method=method
+        )
+        selected_df = setups_df[mask].sort_values(
+            ['date', 'quality_score'], ascending=[True, False]
+        ).reset_index(drop=True)
 
-        # Combine all selected setups
-        selected_df = pd.concat(selected_setups, ignore_index=True)
+        daily_heat = selected_df.groupby('date')['risk'].sum() / capital
 
         print(f"\nTotal potential setups: {len(setups_df)}")
         print(f"Selected setups: {len(selected_df)} ({len(selected_df)/len(setups_df):.1%})")
         print(f"Avg setups per day: {len(selected_df)/setups_df['date'].nunique():.2f}")
+        print(f"Max daily heat: {daily_heat.max():.2%} (limit {self.max_portfolio_heat:.0%})")
 
         print(f"\nSelected setups by symbol:")
         print(selected_df.groupby('symbol').size().sort_values(ascending=False))
@@ -361,7 +605,7 @@ class UniverseScanner:
         Simulate portfolio using VBT from selected setups.
 
         This method:
-        1. Fetches price data for each symbol
+        1. Reuses price data fetched by scan_universe() (fetches if missing)
         2. Builds entry/exit signals from selected timestamps
         3. Creates individual VBT portfolios
         4. Combines using Portfolio.column_stack()
@@ -394,15 +638,8 @@ class UniverseScanner:
                 # Get selected setups for this symbol
                 symbol_setups = selected_setups[selected_setups['symbol'] == symbol]
 
-                # Fetch price data (5-minute bars)
-                orb_config = ORBConfig(
-                    name=f"ORB_{symbol}",
-                    symbol=symbol,
-                    start_date=self.start_date,
-                    end_date=self.end_date
-                )
-                orb_strategy = ORBStrategy(orb_config)
-                data_5min, _ = orb_strategy.fetch_data()
+                # Price data (5-minute bars) from the scan, fetch only if missing
+                data_5min = self._get_market_data(symbol)
 
                 if len(data_5min) == 0:
                     print(f"    [WARNING] No data for {symbol}, skipping")
@@ -486,6 +723,144 @@ class UniverseScanner:
             }
         }
 
+    def _get_market_data(self, symbol: str) -> pd.DataFrame:
+        """5-minute bars from the scan, fetched (and kept) if missing."""
+        data_5min = self.market_data.get(symbol)
+        if data_5min is None:
+            orb_config = ORBConfig(
+                name=f"ORB_{symbol}",
+                symbol=symbol,
+                start_date=self.start_date,
+                end_date=self.end_date
+            )
+            data_5min, _ = ORBStrategy(orb_config).fetch_data()
+            self.market_data[symbol] = data_5min
+        return data_5min
+
+    def simulate_portfolio_shared(
+        self,
+        selected_setups: pd.DataFrame,
+        initial_capital: float = 100000,
+        risk_pct: float = 0.02,
+        fees: float = 0.0035
+    ) -> Dict:
+        """
+        Simulate all selected setups in ONE grouped, cash-sharing portfolio.
+
+        Instead of one from_signals() per symbol with capital split equally:
+        1. Align every symbol's close onto one bar index (wide frame)
+        2. Scatter entries (setup bar) and exits (3:55 PM same day) into
+           boolean matrices with integer indexing - no per-row loop
+        3. Size each entry with ATR sizing at initial_capital
+           (setup 'risk' / stop_distance, see core/setup_selection.setup_risk)
+        4. Run one from_signals() with cash_sharing=True, group_by=True,
+           call_seq='auto' so all symbols draw on the same cash
+
+        Args:
+            selected_setups: DataFrame with selected trades
+                (select_daily_top_setups() output)
+            initial_capital: Starting capital for the whole portfolio
+            risk_pct: Risk per trade (used if 'risk' column is missing)
+            fees: Total costs as fraction of traded value
+
+        Returns:
+            Dict with combined_portfolio, metrics, skipped_setups
+        """
+        print(f"\n{'='*70}")
+        print("PORTFOLIO SIMULATION (VBT, shared cash)")
+        print(f"{'='*70}")
+        print(f"Initial capital: ${initial_capital:,.0f}")
+        print(f"Selected trades: {len(selected_setups)}")
+
+        closes = {}
+        for symbol in selected_setups['symbol'].unique():
+            data_5min = self._get_market_data(symbol)
+            if len(data_5min) == 0:
+                print(f"  [WARNING] No data for {symbol}, skipping")
+                continue
+            closes[symbol] = data_5min['Close']
+
+        if not closes:
+            print("\n[ERROR] No price data for selected setups")
+            return None
+
+        # 1. Wide close frame on the union bar index (ffill between a symbol's bars)
+        close = pd.concat(closes, axis=1).sort_index().ffill()
+        close.columns.name = 'symbol'
+        print(f"Wide frame: {close.shape[0]} bars x {close.shape[1]} symbols")
+
+        # 2. Vectorized scatter of entries/exits
+        setups = selected_setups[selected_setups['symbol'].isin(closes.keys())]
+        entry_times = pd.DatetimeIndex(setups['datetime'])
+        rows = close.index.get_indexer(entry_times)
+        cols = close.columns.get_indexer(setups['symbol'])
+        exit_rows = close.index.get_indexer(
+            entry_times.normalize() + pd.Timedelta(hours=15, minutes=55)
+        )
+
+        valid = rows >= 0
+        skipped = int((~valid).sum()) + (len(selected_setups) - len(setups))
+
+        entries = np.zeros(close.shape, dtype=bool)
+        entries[rows[valid], cols[valid]] = True
+
+        exits = np.zeros(close.shape, dtype=bool)
+        has_exit = valid & (exit_rows >= 0)
+        exits[exit_rows[has_exit], cols[has_exit]] = True
+
+        # 3. Shares per entry (NaN elsewhere = no order)
+        risk = (setups['risk'] if 'risk' in setups.columns
+                else setup_risk(setups, initial_capital, risk_pct)).to_numpy(dtype=float)
+        size = np.full(close.shape, np.nan)
+        size[rows[valid], cols[valid]] = (risk / setups['stop_distance'].to_numpy(dtype=float))[valid]
+
+        # 4. One grouped, cash-sharing simulation
+        pf = vbt.Portfolio.from_signals(
+            close=close,
+            entries=pd.DataFrame(entries, index=close.index, columns=close.columns),
+            exits=pd.DataFrame(exits, index=close.index, columns=close.columns),
+            size=pd.DataFrame(size, index=close.index, columns=close.columns),
+            size_type='amount',
+            init_cash=initial_capital,
+            cash_sharing=True,
+            group_by=True,
+            call_seq='auto',
+            fees=fees,
+            freq='5min'
+        )
+
+        print(f"\n{'='*70}")
+        print("PORTFOLIO RESULTS")
+        print(f"{'='*70}")
+
+        value = pf.value
+        final_value = float(value.iloc[-1])
+        total_return = (final_value - initial_capital) / initial_capital
+        sharpe = pf.sharpe_ratio
+        max_dd = pf.max_drawdown
+        total_trades = len(pf.trades.records_arr)
+
+        print(f"\nPerformance:")
+        print(f"  Final Value:    ${final_value:,.2f}")
+        print(f"  Total Return:   {total_return:.2%}")
+        print(f"  Sharpe Ratio:   {sharpe:.2f}")
+        print(f"  Max Drawdown:   {max_dd:.2%}")
+        print(f"  Total Trades:   {total_trades}")
+        if skipped:
+            print(f"  Skipped setups: {skipped} (no matching bar)")
+
+        return {
+            'combined_portfolio': pf,
+            'skipped_setups': skipped,
+            'metrics': {
+                'total_return': total_return,
+                'sharpe_ratio': sharpe,
+                'max_drawdown': max_dd,
+                'final_value': final_value,
+                'total_trades': total_trades
+            }
+        }
+
 
 # =============================================================================
 # Main Execution
@@ -515,10 +890,10 @@ def main():
         return None
 
     # Select top setups per day
-    selected_setups = scanner.select_daily_top_setups(setups_df)
+    selected_setups = scanner.select_daily_top_setups(setups_df, capital=100000)
 
-    # Run portfolio simulation using VBT
-    portfolio_results = scanner.simulate_portfolio(
+    # Run portfolio simulation using VBT (one grouped, cash-sharing run)
+    portfolio_results = scanner.simulate_portfolio_shared(
         selected_setups=selected_setups,
         initial_capital=100000
     )
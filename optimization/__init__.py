@@ -1,3 +1,21 @@
 """
 Optimization module for strategy parameter optimization and walk-forward analysis.
+
+Modules:
+    parameter_optimizer: Optuna search over strategy / regime model parameters,
+        pruned on walk-forward windows, with multi-process trials
 """
+
+from .parameter_optimizer import (
+    ParameterOptimizer,
+    ORB_SEARCH_SPACE,
+    JUMP_MODEL_SEARCH_SPACE,
+    ACADEMIC_JUMP_MODEL_SEARCH_SPACE,
+)
+
+__all__ = [
+    'ParameterOptimizer',
+    'ORB_SEARCH_SPACE',
+    'JUMP_MODEL_SEARCH_SPACE',
+    'ACADEMIC_JUMP_MODEL_SEARCH_SPACE',
+]
@@ -0,0 +1,580 @@
+"""
+Parameter Optimization - Optuna Search with Walk-Forward Pruning
+
+Replaces exhaustive grid searches with Optuna's TPE sampler. Each trial is
+scored on the test slices of the walk-forward windows, one window at a time,
+and reports its running score after every window so the pruner (median or
+hyperband) can stop obviously bad regions after a few windows instead of
+paying for the full analysis.
+
+The search is in-sample:
+    Strategy parameters are not fitted on the train slices (only regime
+    models are), so TPE tunes directly on the scored bars. The test slices
+    are laid end to end (step = validator.test_days, whatever the
+    validator's step_days) so every pre-holdout bar after the first train
+    period is scored exactly once. Only the holdout (holdout_start) is
+    out-of-sample; use WalkForwardValidator.run_analysis() for a
+    walk-forward estimate of the chosen parameters.
+
+Tunable parameters:
+    - Strategy config fields (e.g., ORBConfig, see ORB_SEARCH_SPACE)
+    - Optional regime model gating entries per bar:
+        'jump':     JumpModel (JUMP_MODEL_SEARCH_SPACE)
+        'academic': AcademicJumpModel (ACADEMIC_JUMP_MODEL_SEARCH_SPACE)
+      Regime parameters are prefixed 'regime_' in trial parameters.
+
+Performance Design:
+    - Data is shipped once per worker process (pool initializer)
+    - Windows are positional .iloc slices (views)
+    - Strategy signals are memoized per worker with the SignalCache (keyed by
+      slice + config; regime-only changes always hit). cache_dir adds a disk
+      tier that later runs reuse.
+    - Regime series are causal (a bar's label uses only bars up to it) and
+      memoized per worker by (regime params, window), so trials that only
+      change strategy parameters never refit the model
+    - Trials run in several processes that share one study through storage
+
+Storage:
+    - 'studies.db' / 'sqlite:///studies.db': SQLite (workers on one box)
+    - 'studies.log' (any other path): Optuna journal file, safe on a shared
+      filesystem, so workers on several machines can join the same study by
+      constructing the same optimizer and calling optimize()
+    - None: in-memory (single process only)
+
+Usage:
+    >>> optimizer = ParameterOptimizer(
+    ...     strategy=ORBStrategy(ORBConfig(name="ORB", symbol="NVDA")),
+    ...     data={'NVDA': nvda_5min, 'AMD': amd_5min},
+    ...     daily_data={'NVDA': nvda_daily, 'AMD': amd_daily},
+    ...     search_space=ORB_SEARCH_SPACE,
+    ...     regime_model='jump', regime_data=spy_daily,
+    ...     storage='optuna_orb.log', study_name='orb_nvda_amd',
+    ...     pruner='hyperband', holdout_start='2025-01-01'
+    ... )
+    >>> result = optimizer.optimize(n_trials=200, n_workers=8)
+    >>> result['best_params'], result['holdout']
+
+Reference: backtesting/walk_forward.py (windows and acceptance criteria)
+"""
+
+import copy
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import optuna
+import pandas as pd
+
+from backtesting.walk_forward import WalkForwardValidator
+from backtesting.workers import (
+    WORKER_STATE,
+    check_symbol_state,
+    init_worker,
+    run_tasks,
+    strategy_for_symbol,
+    strategy_with_params,
+)
+
+
+# Search spaces: name -> ('int', low, high) | ('float', low, high[, 'log'])
+#                        | ('categorical', [choices])
+ORB_SEARCH_SPACE = {
+    'opening_minutes': ('categorical', [5, 10, 15, 30]),
+    'atr_period': ('int', 5, 30),
+    'atr_stop_multiplier': ('float', 1.5, 5.0),
+    'volume_multiplier': ('float', 1.5, 3.0),
+}
+
+JUMP_MODEL_SEARCH_SPACE = {
+    'window': ('int', 10, 60),
+    'volatility_method': ('categorical', ['atr', 'yang_zhang']),
+    'bull_threshold': ('float', 0.60, 0.85),
+    'neutral_lower': ('float', 0.20, 0.45),
+    'crash_threshold': ('float', 0.86, 0.97),
+}
+
+ACADEMIC_JUMP_MODEL_SEARCH_SPACE = {
+    'lambda_penalty': ('float', 1.0, 200.0, 'log'),
+}
+
+REGIME_PREFIX = 'regime_'
+
+# AcademicJumpModel state labels -> BaseStrategy regime labels
+ACADEMIC_REGIME_LABELS = {'bull': 'TREND_BULL', 'bear': 'TREND_BEAR'}
+
+# Regime series kept per worker (regime params x windows)
+REGIME_CACHE_ENTRIES = 512
+
+
+
+def suggest_params(trial: optuna.Trial, space: Dict[str, Tuple], prefix: str = '') -> Dict:
+    """
+    Draw one parameter set from a search space.
+
+    Args:
+        trial: Optuna trial
+        space: Search space (see ORB_SEARCH_SPACE for the format)
+        prefix: Prefix for the trial parameter names
+
+    Returns:
+        Dict of parameter name (without prefix) -> value
+
+    Raises:
+        ValueError: If a space entry has an unknown type
+    """
+    params = {}
+    for name, spec in space.items():
+        kind = spec[0]
+        if kind == 'int':
+            params[name] = trial.suggest_int(prefix + name, spec[1], spec[2])
+        elif kind == 'float':
+            log = len(spec) > 3 and spec[3] == 'log'
+            params[name] = trial.suggest_float(prefix + name, spec[1], spec[2], log=log)
+        elif kind == 'categorical':
+            params[name] = trial.suggest_categorical(prefix + name, list(spec[1]))
+        else:
+            raise ValueError(f"Unknown search space type '{kind}' for {name}")
+    return params
+
+
+def split_params(params: Dict) -> Tuple[Dict, Dict]:
+    """Split trial parameters into (strategy params, regime params)."""
+    strategy_params = {k: v for k, v in params.items() if not k.startswith(REGIME_PREFIX)}
+    regime_params = {
+        k[len(REGIME_PREFIX):]: v for k, v in params.items() if k.startswith(REGIME_PREFIX)
+    }
+    return strategy_params, regime_params
+
+
+def make_storage(storage: Optional[str]):
+    """
+    Build Optuna storage from a path or URL.
+
+    Args:
+        storage: None (in-memory), database URL, '*.db'/'*.sqlite' path
+            (SQLite) or any other path (journal file)
+
+    Returns:
+        Storage object or URL accepted by optuna.create_study()
+    """
+    if storage is None or '://' in storage:
+        return storage
+    if storage.endswith(('.db', '.sqlite', '.sqlite3')):
+        return f"sqlite:///{storage}"
+    return optuna.storages.JournalStorage(optuna.storages.journal.JournalFileBackend(storage))
+
+
+def make_pruner(pruner: str, n_windows: int) -> optuna.pruners.BasePruner:
+    """
+    Build the pruner (steps are walk-forward windows).
+
+    Args:
+        pruner: 'median', 'hyperband' or 'none'
+        n_windows: Number of windows (maximum resource)
+
+    Raises:
+        ValueError: If pruner is unknown
+    """
+    if pruner == 'median':
+        return optuna.pruners.MedianPruner(n_startup_trials=5, n_warmup_steps=1)
+    if pruner == 'hyperband':
+        return optuna.pruners.HyperbandPruner(
+            min_resource=1, max_resource=max(n_windows, 1), reduction_factor=3
+        )
+    if pruner == 'none':
+        return optuna.pruners.NopPruner()
+    raise ValueError(f"pruner must be 'median', 'hyperband' or 'none', got '{pruner}'")
+
+
+def _objective(trial: optuna.Trial) -> float:
+    """Trial objective, evaluated in the worker's state."""
+    return WORKER_STATE['optimizer']._evaluate_trial(trial, WORKER_STATE['strategy'])
+
+
+def _optimize_worker(task: Tuple[int, Optional[float], int]) -> int:
+    """Process-pool task (n_trials, timeout, seed_offset): join the shared study and run trials."""
+    n_trials, timeout, seed_offset = task
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    study = WORKER_STATE['optimizer'].create_study(seed_offset=seed_offset)
+    study.optimize(_objective, n_trials=n_trials, timeout=timeout, catch=(Exception,))
+    return n_trials
+
+
+class ParameterOptimizer:
+    """
+    Optuna parameter search scored on non-overlapping test slices (in-sample).
+
+    Attributes:
+        strategy: BaseStrategy whose config is tuned
+        data: Dict of symbol -> OHLCV DataFrame (before holdout_start)
+        holdout: Dict of symbol -> OHLCV DataFrame (from holdout_start on)
+        search_space: Strategy search space
+        daily_data: Dict of symbol -> daily OHLCV (None = not per symbol)
+        regime_model: None, 'jump' or 'academic'
+        regime_space: Regime model search space
+        validator: WalkForwardValidator providing windows, metric, min_trades
+        windows: Scoring windows, test slices end to end (trial steps)
+
+    Example:
+        >>> optimizer = ParameterOptimizer(strategy, data, ORB_SEARCH_SPACE,
+        ...                                storage='orb.db', pruner='median')
+        >>> result = optimizer.optimize(n_trials=100, n_workers=4)
+        >>> print(result['best_value'], result['n_pruned'])
+    """
+
+    def __init__(
+        self,
+        strategy,
+        data: Union[pd.DataFrame, Dict[str, pd.DataFrame]],
+        search_space: Optional[Dict[str, Tuple]] = None,
+        regime_model: Optional[str] = None,
+        regime_space: Optional[Dict[str, Tuple]] = None,
+        regime_data: Optional[pd.DataFrame] = None,
+        daily_data: Optional[Dict[str, pd.DataFrame]] = None,
+        validator: Optional[WalkForwardValidator] = None,
+        storage: Optional[str] = None,
+        study_name: Optional[str] = None,
+        pruner: str = 'median',
+        direction: str = 'maximize',
+        holdout_start: Optional[str] = None,
+        initial_capital: float = 10000.0,
+        cache_entries: int = 64,
+        cache_dir: Optional[str] = None,
+        seed: Optional[int] = None
+    ):
+        """
+        Initialize parameter optimizer.
+
+        Args:
+            strategy: BaseStrategy instance (trial params are config updates)
+            data: OHLCV DataFrame or dict of symbol -> DataFrame
+            search_space: Strategy search space (default: ORB_SEARCH_SPACE)
+            regime_model: None, 'jump' (JumpModel) or 'academic'
+                (AcademicJumpModel) for per-bar regime gating of entries
+            regime_space: Regime search space (default per regime_model)
+            regime_data: Daily OHLC for the regime model (e.g., SPY). Default:
+                each symbol's daily_data (the models are built for daily
+                bars, so one of the two is required with regime_model).
+            daily_data: Dict of symbol -> daily OHLCV, set on each symbol's
+                strategy copy (ORB's data_daily ATR) and used for per-symbol
+                regimes. Required for multi-symbol runs of such strategies.
+            validator: Train/test lengths, metric and min_trades
+                (default: WalkForwardValidator()); its step_days is
+                replaced by test_days so test slices do not overlap
+            storage: Study storage (see module docstring)
+            study_name: Study name (required to share a study between runs)
+            pruner: 'median', 'hyperband' or 'none'
+            direction: 'maximize' or 'minimize' the validator's metric
+            holdout_start: Data from this date on is excluded from the search
+                and used to evaluate the best parameters once
+            initial_capital: Starting capital for every window backtest
+            cache_entries: Signal cache size per worker (0 disables caching)
+            cache_dir: Optional persistent signal cache directory
+            seed: Sampler seed (workers use seed + worker index)
+
+        Raises:
+            ValueError: If data is empty, regime_model is unknown, or no
+                complete walk-forward window fits before holdout_start
+            ValueError: If regime_model is set without regime_data or
+                daily_data, or several symbols would share one strategy's
+                daily bars (see backtesting.workers.check_symbol_state())
+        """
+        if isinstance(data, pd.DataFrame):
+            data = {getattr(strategy.config, 'symbol', None) or 'data': data}
+        if regime_model not in (None, 'jump', 'academic'):
+            raise ValueError(f"regime_model must be None, 'jump' or 'academic', got '{regime_model}'")
+        if regime_model is not None and regime_data is None and daily_data is None:
+            raise ValueError(
+                "regime_model needs daily bars: pass regime_data (e.g., SPY daily) "
+                "or daily_data per symbol"
+            )
+        check_symbol_state(strategy, data, daily_data)
+        self.daily_data = None if daily_data is None else {s: daily_data[s] for s in data}
+
+        self.holdout = {}
+        if holdout_start is not None:
+            cutoff = pd.Timestamp(holdout_start)
+            self.holdout = {s: df[df.index >= _localize(cutoff, df.index)] for s, df in data.items()}
+            data = {s: df[df.index < _localize(cutoff, df.index)] for s, df in data.items()}
+
+        self.data = {symbol: df for symbol, df in data.items() if len(df) > 0}
+        if not self.data:
+            raise ValueError("data is empty")
+
+        self.strategy = strategy
+        self.search_space = ORB_SEARCH_SPACE if search_space is None else search_space
+        self.regime_model = regime_model
+        if regime_space is None:
+            regime_space = {
+                None: {},
+                'jump': JUMP_MODEL_SEARCH_SPACE,
+                'academic': ACADEMIC_JUMP_MODEL_SEARCH_SPACE,
+            }[regime_model]
+        self.regime_space = regime_space
+        self.regime_data = regime_data
+        self.validator = validator or WalkForwardValidator()
+        self.storage = storage
+        self.study_name = study_name
+        self.pruner = pruner
+        self.direction = direction
+        self.initial_capital = initial_capital
+        self.cache_entries = cache_entries
+        self.cache_dir = cache_dir
+        self.seed = seed
+
+        start = min(df.index[0] for df in self.data.values())
+        end = max(df.index[-1] for df in self.data.values())
+        # Test slices end to end: overlapping slices would weight bars 2-3x
+        scoring = copy.copy(self.validator)
+        scoring.step_days = scoring.test_days
+        self.windows = scoring.generate_windows(start, end)
+        if not self.windows:
+            raise ValueError(
+                f"No complete window: need {self.validator.train_days + self.validator.test_days} "
+                f"days, data spans {(end - start).days} days"
+            )
+
+        # Fail fast on a bad pruner name
+        make_pruner(pruner, len(self.windows))
+
+    def create_study(self, seed_offset: int = 0) -> optuna.Study:
+        """
+        Create or load the study (same name + storage = same study).
+
+        Args:
+            seed_offset: Added to the sampler seed (distinct per worker)
+
+        Returns:
+            optuna.Study
+        """
+        seed = None if self.seed is None else self.seed + seed_offset
+        return optuna.create_study(
+            study_name=self.study_name,
+            storage=make_storage(self.storage),
+            sampler=optuna.samplers.TPESampler(seed=seed),
+            pruner=make_pruner(self.pruner, len(self.windows)),
+            direction=self.direction,
+            load_if_exists=True,
+        )
+
+    def optimize(
+        self,
+        n_trials: int = 100,
+        n_workers: int = 1,
+        timeout: Optional[float] = None
+    ) -> Dict:
+        """
+        Run trials (in-process or across worker processes).
+
+        Args:
+            n_trials: Trials to run in this call (split across workers)
+            n_workers: Worker processes (1 = in-process)
+            timeout: Per-worker time limit in seconds
+
+        Returns:
+            Dictionary containing:
+            - 'best_params': Best trial parameters (regime ones prefixed)
+            - 'best_value': Best trial score
+            - 'n_complete' / 'n_pruned' / 'n_failed': Trial state counts
+              (a trial raising an exception is recorded as failed)
+            - 'trials': DataFrame from study.trials_dataframe()
+            - 'holdout': Best parameters' metrics per symbol on the holdout
+              data (None without holdout_start)
+            - 'study': optuna.Study
+
+        Raises:
+            ValueError: If n_workers > 1 without persistent storage
+        """
+        if n_workers > 1 and self.storage is None:
+            raise ValueError("n_workers > 1 requires storage (SQLite or journal file)")
+
+        study = self.create_study()
+
+        print(f"Optimizer: {n_trials} trials, {n_workers} workers, "
+              f"{len(self.windows)} windows x {len(self.data)} symbols, "
+              f"pruner={self.pruner}")
+
+        worker_args = (self.strategy, self.cache_entries, self.cache_dir, {'optimizer': self})
+        if n_workers == 1:
+            init_worker(*worker_args)
+            study.optimize(_objective, n_trials=n_trials, timeout=timeout, catch=(Exception,))
+        else:
+            shares = [n_trials // n_workers + (i < n_trials % n_workers) for i in range(n_workers)]
+            tasks = [(share, timeout, i + 1) for i, share in enumerate(shares) if share > 0]
+            run_tasks(_optimize_worker, tasks, n_workers, *worker_args)
+            study = self.create_study()
+
+        states = [t.state for t in study.trials]
+        n_complete = states.count(optuna.trial.TrialState.COMPLETE)
+        n_pruned = states.count(optuna.trial.TrialState.PRUNED)
+        n_failed = states.count(optuna.trial.TrialState.FAIL)
+
+        result = {
+            'best_params': study.best_params if n_complete else {},
+            'best_value': study.best_value if n_complete else np.nan,
+            'n_complete': n_complete,
+            'n_pruned': n_pruned,
+            'n_failed': n_failed,
+            'trials': study.trials_dataframe(),
+            'holdout': None,
+            'study': study,
+        }
+
+        print(f"  Complete: {n_complete}, pruned: {n_pruned}, failed: {n_failed}")
+        if n_complete:
+            print(f"  Best {self.validator.metric}: {result['best_value']:.4f}")
+            print(f"  Best params: {result['best_params']}")
+
+            if self.holdout:
+                result['holdout'] = self.evaluate_holdout(result['best_params'])
+
+        return result
+
+    def evaluate_holdout(self, params: Dict) -> Dict[str, Dict]:
+        """
+        Backtest a parameter set on the holdout data of every symbol.
+
+        The regime model (if any) is fitted on all pre-holdout data and
+        labels holdout bars causally (see _regime_series()).
+
+        Args:
+            params: Trial parameters (e.g., result['best_params'])
+
+        Returns:
+            Dict of symbol -> backtest_metrics() record
+        """
+        strategy_params, regime_params = split_params(params)
+        strategy = strategy_with_params(self.strategy, strategy_params)
+
+        records = {}
+        for symbol, holdout in self.holdout.items():
+            if len(holdout) == 0:
+                continue
+            regime = None
+            if self.regime_model is not None:
+                source = self.regime_data if self.regime_data is not None else self.daily_data[symbol]
+                cutoff = _localize(holdout.index[0], source.index)
+                fit_end = int(source.index.searchsorted(cutoff, side='left'))
+                regime = self._regime_series(regime_params, source, 0, fit_end, len(source))
+            symbol_strategy = strategy_for_symbol(strategy, symbol, self.daily_data)
+            records[symbol] = symbol_strategy.backtest_metrics(
+                holdout, initial_capital=self.initial_capital, regime=regime
+            )
+        return records
+
+    def _evaluate_trial(self, trial: optuna.Trial, base_strategy) -> float:
+        """
+        Score one trial on the windows' test slices, reporting after each.
+
+        The slices do not overlap, but they are the bars the search tunes
+        on: the score is in-sample (see module docstring).
+
+        A window's score is the mean metric over symbols with at least
+        validator.min_trades trades (0.0 if none qualify).
+        """
+        strategy_params = suggest_params(trial, self.search_space)
+        regime_params = suggest_params(trial, self.regime_space, prefix=REGIME_PREFIX)
+
+        try:
+            strategy = strategy_with_params(base_strategy, strategy_params)
+        except (ValueError, AssertionError) as e:
+            # Invalid combination for this strategy: prune instead of failing
+            raise optuna.TrialPruned(f"invalid parameters: {e}")
+
+        metric = self.validator.metric
+        scores: List[float] = []
+        trades = 0
+
+        for k, window in enumerate(self.windows):
+            values = []
+            for symbol, df in self.data.items():
+                train_start, _, test_start, test_end = self.validator.window_positions(df.index, window)
+                test = df.iloc[test_start:test_end]
+                if len(test) == 0:
+                    continue
+
+                regime = self._window_regime(regime_params, symbol, k, window)
+                symbol_strategy = strategy_for_symbol(strategy, symbol, self.daily_data)
+                metrics = symbol_strategy.backtest_metrics(
+                    test, initial_capital=self.initial_capital, regime=regime
+                )
+                trades += int(metrics.get('total_trades', 0))
+                value = metrics.get(metric, np.nan)
+                if metrics.get('total_trades', 0) >= self.validator.min_trades and np.isfinite(value):
+                    values.append(float(value))
+
+            scores.append(float(np.mean(values)) if values else 0.0)
+
+            trial.report(float(np.mean(scores)), step=k)
+            if trial.should_prune():
+                trial.set_user_attr('windows_evaluated', k + 1)
+                raise optuna.TrialPruned()
+
+        trial.set_user_attr('windows_evaluated', len(scores))
+        trial.set_user_attr('window_scores', scores)
+        trial.set_user_attr('total_trades', trades)
+        return float(np.mean(scores))
+
+    def _window_regime(self, regime_params: Dict, symbol: str, k: int, window) -> Optional[pd.Series]:
+        """Regime series covering window k (memoized per worker)."""
+        if self.regime_model is None:
+            return None
+
+        shared = self.regime_data is not None
+        regime_cache = WORKER_STATE['memo']
+        key = (tuple(sorted(regime_params.items())), None if shared else symbol, k)
+        cached = regime_cache.get(key)
+        if cached is not None:
+            regime_cache.move_to_end(key)
+            return cached
+
+        source = self.regime_data if shared else self.daily_data[symbol]
+        start, fit_end, _, end = self.validator.window_positions(
+            source.index, tuple(_localize(ts, source.index) for ts in window)
+        )
+        regime = self._regime_series(regime_params, source, start, fit_end, end)
+
+        regime_cache[key] = regime
+        if len(regime_cache) > REGIME_CACHE_ENTRIES:
+            regime_cache.popitem(last=False)
+        return regime
+
+    def _regime_series(
+        self,
+        regime_params: Dict,
+        source: pd.DataFrame,
+        start: int,
+        fit_end: int,
+        end: int
+    ) -> pd.Series:
+        """
+        Causal regime labels over source[start:end], lagged one bar.
+
+        'jump' is causal (rolling windows) and runs over the whole span.
+        'academic' is fitted on source[start:fit_end]; each bar is then
+        labelled by online inference over the span up to that bar
+        (AcademicJumpModel.predict_online()), never by a decode that sees
+        later bars.
+        """
+        span = source.iloc[start:end]
+
+        if self.regime_model == 'jump':
+            from regime.jump_model import JumpModel
+            regime = JumpModel(**regime_params).detect_regime(span)
+        else:
+            from regime.academic_jump_model import AcademicJumpModel
+            model = AcademicJumpModel(**regime_params).fit(source.iloc[start:fit_end])
+            regime = model.predict_online(span).map(ACADEMIC_REGIME_LABELS)
+
+        # Regime from a bar's close applies from the next bar
+        return regime.shift(1)
+
+
+def _localize(ts: pd.Timestamp, index: pd.Index) -> pd.Timestamp:
+    """Match a timestamp's timezone to an index (naive <-> aware)."""
+    ts = pd.Timestamp(ts)
+    tz = getattr(index, 'tz', None)
+    if tz is not None and ts.tzinfo is None:
+        return ts.tz_localize(tz)
+    if tz is None and ts.tzinfo is not None:
+        return ts.tz_convert(None)
+    return ts
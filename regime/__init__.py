@@ -6,6 +6,7 @@ for the ATLAS trading system.
 
 Modules:
     jump_model: Jump Model implementation for regime classification
+    academic_jump_model: Statistical Jump Model (Shu et al., 2024)
     regime_allocator: Regime-based capital allocation logic
 
 Market Regimes:
@@ -13,11 +14,39 @@ Market Regimes:
     TREND_NEUTRAL: Choppy/sideways market (jump probability 30-70%)
     TREND_BEAR: Strong bearish trend (jump probability >70%, negative direction)
     CRASH: Extreme volatility event (special indicators triggered)
+
+Exports are loaded lazily (PEP 562): `import regime` does not import
+vectorbtpro (jump_model) or sklearn (academic_jump_model) until the model
+class is first accessed.
 """
 
-from regime.jump_model import JumpModel
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .academic_jump_model import AcademicJumpModel
+    from .jump_model import JumpModel
+
+_LAZY_EXPORTS = {
+    'JumpModel': '.jump_model',
+    'AcademicJumpModel': '.academic_jump_model',
+}
 
 __all__ = [
     'JumpModel',
-    'RegimeAllocator',
+    'AcademicJumpModel',
 ]
+
+
+def __getattr__(name: str):
+    """Import the submodule defining `name` on first access and cache it."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -35,7 +35,6 @@ Implementation Reference:
 from typing import Tuple, Optional
 import numpy as np
 import pandas as pd
-from sklearn.cluster import KMeans
 
 from regime.academic_features import calculate_features
 
@@ -196,6 +195,9 @@ def coordinate_descent(
         >>> theta, states, obj, conv = coordinate_descent(features, lambda_penalty=50.0)
         >>> print(f"Converged: {conv}, Final objective: {obj:.2f}")
     """
+    # Deferred: sklearn adds ~2s to import time and is only needed here
+    from sklearn.cluster import KMeans
+
     T, D = features.shape
     K = 2  # Two states: bull (0) and bear (1)
 
@@ -210,6 +212,9 @@ def coordinate_descent(
     # Initial state sequence from K-means
     state_sequence = kmeans_labels.astype(int)
 
+    # Seeded generator for empty-cluster restarts (reproducible fits)
+    rng = np.random.default_rng(random_seed)
+
     # Compute initial objective
     prev_objective = np.inf
 
@@ -229,7 +234,7 @@ def coordinate_descent(
             else:
                 # Handle empty cluster (shouldn't happen with good initialization)
                 # Reinitialize to random feature
-                theta[k, :] = features[np.random.randint(T), :]
+                theta[k, :] = features[rng.integers(T), :]
                 if verbose:
                     print(f"  Warning: Empty cluster {k} at iteration {iteration}")
 
@@ -611,6 +616,52 @@ class AcademicJumpModel:
         # Return last state
         return regime_series.iloc[-1]
 
+    def predict_online(self, data: pd.DataFrame) -> pd.Series:
+        """
+        Causal state per bar: online inference at every bar of data.
+
+        The label at bar t is the last state of a DP decode over data up to
+        t (what online_inference() returns on that prefix), so appending
+        later bars never changes it. The last state of a decode is the
+        argmin of the forward DP costs, so one forward pass yields every
+        prefix's last state without backtracking.
+
+        Args:
+            data: OHLC DataFrame with 'Close' column
+
+        Returns:
+            Series of state labels ('bull' or 'bear') with original data index
+            (feature warm-up bars dropped, as in predict())
+
+        Raises:
+            ValueError: If model not fitted
+
+        Example:
+            >>> model.fit(train_data)
+            >>> regimes = model.predict_online(test_data)  # no lookahead
+        """
+        if not self.is_fitted_:
+            raise ValueError("Model must be fitted before prediction. Call fit() first.")
+
+        features_df = calculate_features(
+            close=data['Close'],
+            risk_free_rate=0.03,
+            standardize=False
+        ).dropna()
+        loss = _compute_loss(features_df.values, self.theta_)  # (T, K)
+
+        # Forward pass of dynamic_programming() (K=2: the other state is cost[::-1])
+        states = np.zeros(len(loss), dtype=int)
+        if len(loss):
+            cost = loss[0].copy()
+            states[0] = np.argmin(cost)
+            for t in range(1, len(loss)):
+                cost = loss[t] + np.minimum(cost, cost[::-1] + self.lambda_penalty)
+                states[t] = np.argmin(cost)
+
+        state_labels = [self.state_labels_[s] for s in states]
+        return pd.Series(state_labels, index=features_df.index, name='regime')
+
     def get_fit_info(self) -> dict:
         """
         Get diagnostic information from fitting process.
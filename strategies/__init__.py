@@ -4,9 +4,37 @@ Strategies module for ATLAS algorithmic trading strategies.
 Contains:
 - base_strategy.py: Abstract base class for all strategies
 - orb.py: Opening Range Breakout (ORB) strategy with ATR-based position sizing
+
+Exports are loaded lazily (PEP 562): `import strategies` does not import
+vectorbtpro, pandas_market_calendars or pydantic until a strategy class is
+first accessed. See tests/test_import_time.py for the startup budget.
 """
 
-from .base_strategy import BaseStrategy, StrategyConfig
-from .orb import ORBStrategy
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base_strategy import BaseStrategy, StrategyConfig
+    from .orb import ORBStrategy
+
+_LAZY_EXPORTS = {
+    'BaseStrategy': '.base_strategy',
+    'StrategyConfig': '.base_strategy',
+    'ORBStrategy': '.orb',
+}
 
 __all__ = ['BaseStrategy', 'StrategyConfig', 'ORBStrategy']
+
+
+def __getattr__(name: str):
+    """Import the submodule defining `name` on first access and cache it."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
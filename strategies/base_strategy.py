@@ -27,12 +27,25 @@ Reference:
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Tuple, Optional, Union
+from typing import Dict, Tuple, Optional, Sequence, Union
 import pandas as pd
 import numpy as np
 from pydantic import BaseModel, Field
 import vectorbtpro as vbt
 
+from utils.signal_cache import SignalCache
+from utils.trade_statistics import breakeven_cost, portfolio_trade_statistics
+
+
+# Label order for int-coded regime arrays (code i -> REGIME_CODES[i])
+REGIME_CODES = ('TREND_BULL', 'TREND_NEUTRAL', 'TREND_BEAR', 'CRASH')
+
+# Scalar regime label, or per-bar regime labels/codes aligned to the data
+RegimeInput = Optional[Union[str, pd.Series, np.ndarray]]
+
+# Per-side cost grid for cost_sweep() (fees + slippage, decimals)
+DEFAULT_COST_LEVELS = (0.0, 0.0005, 0.001, 0.0015, 0.002, 0.003, 0.004, 0.005)
+
 
 class StrategyConfig(BaseModel):
     """
@@ -144,6 +157,9 @@ class BaseStrategy(ABC):
         self.validate_config()
         self.validate_parameters()  # v2.0: Strategy-specific validation
 
+        # Optional memoization of generate_signals() (see enable_signal_cache())
+        self._signal_cache: Optional[SignalCache] = None
+
     def validate_config(self) -> None:
         """
         Validate strategy configuration for risk management compliance.
@@ -240,6 +256,68 @@ class BaseStrategy(ABC):
         """
         return self.config.regime_compatibility.get(regime, False)
 
+    def regime_entry_mask(
+        self,
+        regime: Union[pd.Series, np.ndarray],
+        index: pd.Index
+    ) -> pd.Series:
+        """
+        Vectorized should_trade_in_regime() over a per-bar regime history.
+
+        Args:
+            regime: Regime per bar, either
+                - pd.Series of labels ('TREND_BULL', ...) or int codes
+                - np.ndarray of labels or int codes (same length as index)
+                Int codes map to labels via REGIME_CODES.
+                A Series with a different index (e.g., daily regimes for
+                intraday bars) is forward-filled onto index.
+            index: Bar index of the data being backtested
+
+        Returns:
+            Boolean Series (True = entries allowed) aligned to index
+
+        Raises:
+            ValueError: If an array does not match the length of index
+
+        Example:
+            >>> regimes = pd.Series(['TREND_BULL', 'TREND_BEAR', 'TREND_BULL'], index=data.index)
+            >>> strategy.regime_entry_mask(regimes, data.index).tolist()
+            [True, False, True]
+
+        Note:
+            - Unknown labels, NaN and out-of-range codes map to False (safety first)
+            - Regimes computed from a bar's close must be lagged by the caller
+              before use, otherwise entries see the regime one bar early
+        """
+        if isinstance(regime, pd.Series):
+            if not regime.index.equals(index):
+                regime = regime.reindex(index, method='ffill')
+            values = regime.values
+        else:
+            values = np.asarray(regime)
+            if len(values) != len(index):
+                raise ValueError(
+                    f"Regime array length ({len(values)}) must match "
+                    f"data length ({len(index)})"
+                )
+
+        compatibility = self.config.regime_compatibility
+
+        if values.dtype.kind in 'iuf':
+            # Int codes (float if NaN-padded): lookup table over REGIME_CODES
+            table = np.array([compatibility.get(label, False) for label in REGIME_CODES])
+            if values.dtype.kind == 'f':
+                values = np.where(np.isnan(values), -1, values)
+            codes = values.astype(np.int64)
+            valid = (codes >= 0) & (codes < len(REGIME_CODES))
+            mask = np.zeros(len(codes), dtype=bool)
+            mask[valid] = table[codes[valid]]
+        else:
+            allowed = [label for label, active in compatibility.items() if active]
+            mask = pd.Series(values).isin(allowed).values
+
+        return pd.Series(mask, index=index)
+
     @abstractmethod
     def generate_signals(
         self,
@@ -367,11 +445,91 @@ class BaseStrategy(ABC):
         """
         pass
 
+    def enable_signal_cache(
+        self,
+        max_entries: int = 32,
+        cache_dir: Optional[str] = None
+    ) -> SignalCache:
+        """
+        Memoize generate_signals() for backtest()/backtest_metrics()/get_signals().
+
+        Signals are keyed by a fingerprint of the input bars plus the strategy
+        config, so repeated backtests over the same data that only change
+        capital (or anything else outside the config) skip signal generation.
+
+        Args:
+            max_entries: Maximum signal sets kept in memory (LRU eviction)
+            cache_dir: Optional directory for a persistent pickle tier
+
+        Returns:
+            The SignalCache instance (for inspecting hits/misses)
+
+        Example:
+            >>> cache = strategy.enable_signal_cache(max_entries=8)
+            >>> for capital in [10000, 25000, 50000]:
+            ...     metrics = strategy.backtest_metrics(data, initial_capital=capital)
+            >>> cache.misses, cache.hits  # (1, 2)
+
+        Note:
+            - Config changes produce new keys automatically
+            - State outside the config that affects signals must be exposed
+              via _signal_cache_extra() (e.g., ORB daily bars)
+            - Cached Series are shared between calls; treat them as read-only
+        """
+        self._signal_cache = SignalCache(max_entries=max_entries, cache_dir=cache_dir)
+        return self._signal_cache
+
+    def disable_signal_cache(self) -> None:
+        """Turn off signal memoization and drop the in-memory cache."""
+        self._signal_cache = None
+
+    def get_signals(
+        self,
+        data: pd.DataFrame,
+        regime: Optional[str] = None
+    ) -> Dict[str, pd.Series]:
+        """
+        Return generate_signals() output, served from the signal cache if enabled.
+
+        Args:
+            data: OHLCV DataFrame (same as generate_signals())
+            regime: Optional market regime (same as generate_signals())
+
+        Returns:
+            Signals dict (see generate_signals())
+        """
+        cache = getattr(self, '_signal_cache', None)
+        if cache is None:
+            return self.generate_signals(data, regime=regime)
+
+        key = cache.make_key(
+            data,
+            self.config,
+            type(self).__name__,
+            regime=regime,
+            extra=self._signal_cache_extra()
+        )
+        signals = cache.get(key)
+        if signals is None:
+            signals = self.generate_signals(data, regime=regime)
+            cache.put(key, signals)
+
+        return signals
+
+    def _signal_cache_extra(self) -> Tuple:
+        """
+        Strategy state outside config that affects generate_signals().
+
+        Default is empty. Override when signals depend on attributes other
+        than config and the input bars.
+        """
+        return ()
+
     def backtest(
         self,
         data: pd.DataFrame,
         initial_capital: float = 10000.0,
-        regime: Optional[str] = None
+        regime: RegimeInput = None
     ) -> vbt.Portfolio:
         """
         Run backtest using VectorBT Pro.
@@ -382,6 +540,7 @@ class BaseStrategy(ABC):
 
         Workflow:
         1. Call child's generate_signals() to get entries/exits/stops (with regime)
+           (served from the signal cache if enable_signal_cache() was called)
         2. Call child's calculate_position_size() to get share counts
         3. Run vbt.Portfolio.from_signals() with standard settings
         4. Return VBT Portfolio object for analysis
@@ -391,7 +550,10 @@ class BaseStrategy(ABC):
                 Required columns: Open, High, Low, Close, Volume
             initial_capital: Starting capital in dollars (default: $10,000)
             regime: Optional market regime for regime-aware strategies
-                ('TREND_BULL', 'TREND_NEUTRAL', 'TREND_BEAR', 'CRASH')
+                ('TREND_BULL', 'TREND_NEUTRAL', 'TREND_BEAR', 'CRASH'),
+                or a per-bar regime Series/int-coded array. Per-bar regimes
+                are applied as an entry mask (see regime_entry_mask()) inside
+                a single simulation; exits are unaffected.
 
         Returns:
             vbt.Portfolio object with backtest results
@@ -407,6 +569,9 @@ class BaseStrategy(ABC):
             >>> # Regime-aware backtest (v2.0)
             >>> pf = strategy.backtest(data, initial_capital=10000, regime='TREND_BULL')
             >>>
+            >>> # Regime history (one simulation, entries gated per bar)
+            >>> pf = strategy.backtest(data, initial_capital=10000, regime=regime_series)
+            >>>
             >>> print(f"Total Return: {pf.total_return:.2%}")
             >>> print(f"Sharpe Ratio: {pf.sharpe_ratio:.2f}")
             >>> print(f"Max Drawdown: {pf.max_drawdown:.2%}")
@@ -436,8 +601,178 @@ class BaseStrategy(ABC):
             This method should NOT be overridden by child classes.
             If you need custom VBT integration, create a new method.
         """
-        # Generate signals from child class (pass regime)
-        signals = self.generate_signals(data, regime=regime)
+        # Run VectorBT Pro backtest
+        # Pattern validated: vbt.Portfolio.from_signals VERIFIED via MCP
+        pf = vbt.Portfolio.from_signals(
+            **self._build_simulation_kwargs(data, initial_capital, regime)
+        )
+
+        return pf
+
+    def backtest_metrics(
+        self,
+        data: pd.DataFrame,
+        initial_capital: float = 10000.0,
+        regime: RegimeInput = None,
+        equity_points: Optional[int] = None
+    ) -> Dict[str, Union[float, pd.Series]]:
+        """
+        Run backtest and return a compact metrics record instead of a Portfolio.
+
+        Metrics-only mode for large parameter sweeps. The simulation is
+        identical to backtest(), but the vbt.Portfolio (order records, wrapper,
+        cached views) is dropped as soon as the metrics are extracted, so each
+        run leaves behind only a dict of scalars (plus an optional small
+        equity sample).
+
+        Args:
+            data: OHLCV DataFrame with DatetimeIndex
+            initial_capital: Starting capital in dollars (default: $10,000)
+            regime: Optional market regime (same as backtest())
+            equity_points: If set, include an equity curve downsampled to at
+                most this many points (always includes first and last bar)
+
+        Returns:
+            Dictionary containing:
+            - All keys from get_performance_metrics()
+            - 'init_cash': Starting capital
+            - 'final_value': Final portfolio value
+            - 'equity_curve': pd.Series (only if equity_points is set)
+
+        Example:
+            >>> records = [
+            ...     strategy.backtest_metrics(data, initial_capital=cap)
+            ...     for cap in [10000, 25000, 50000]
+            ... ]
+            >>> pd.DataFrame(records)[['init_cash', 'total_return', 'sharpe_ratio']]
+
+        Note:
+            Use backtest() when you need trade-level inspection or plotting.
+        """
+        pf = vbt.Portfolio.from_signals(
+            **self._build_simulation_kwargs(data, initial_capital, regime)
+        )
+
+        record = self.get_performance_metrics(pf)
+        record['init_cash'] = initial_capital
+        record['final_value'] = float(pf.final_value)
+
+        if equity_points:
+            record['equity_curve'] = _downsample_equity(pf.value, equity_points)
+
+        return record
+
+    def cost_sweep(
+        self,
+        data: pd.DataFrame,
+        cost_levels: Sequence[float] = DEFAULT_COST_LEVELS,
+        initial_capital: float = 10000.0,
+        regime: RegimeInput = None,
+        slippage_share: Optional[float] = None
+    ) -> Dict:
+        """
+        Transaction-cost sensitivity in one multi-column simulation.
+
+        Signals and position sizes are generated once; the cost grid is
+        passed to from_signals() as a vbt.Param, so every cost level is one
+        column of a single simulation instead of one backtest per level.
+
+        Args:
+            data: OHLCV DataFrame with DatetimeIndex
+            cost_levels: Ascending per-side costs as decimals (fees + slippage
+                per order; a round trip pays roughly twice this)
+            initial_capital: Starting capital in dollars (default: $10,000)
+            regime: Optional market regime (same as backtest())
+            slippage_share: Share of each level charged as slippage (rest as
+                fees). Default: config's slippage / (commission_rate + slippage)
+
+        Returns:
+            Dictionary containing:
+            - 'curve': DataFrame indexed by cost_per_side with fees, slippage,
+              total_return, sharpe_ratio, total_trades, win_rate, avg_trade
+              and net_expectancy (per-trade, net of costs)
+            - 'breakeven_cost': Per-side cost where net expectancy reaches
+              zero (NaN if it does not cross zero inside the grid)
+            - 'current_cost': Config's commission_rate + slippage
+            - 'cost_margin': breakeven_cost - current_cost
+
+        Raises:
+            ValueError: If cost_levels is empty, negative or not ascending,
+                or slippage_share is outside [0, 1]
+
+        Example:
+            >>> sweep = strategy.cost_sweep(data, cost_levels=[0, 0.001, 0.002, 0.004])
+            >>> print(sweep['curve'][['net_expectancy', 'sharpe_ratio']])
+            >>> print(f"Breakeven: {sweep['breakeven_cost']:.3%} per side")
+        """
+        levels = np.asarray(cost_levels, dtype=np.float64)
+        if levels.ndim != 1 or len(levels) == 0:
+            raise ValueError("cost_levels must be a non-empty 1-D sequence")
+        if (levels < 0).any() or (np.diff(levels) <= 0).any():
+            raise ValueError(f"cost_levels must be non-negative and ascending, got {levels}")
+
+        if slippage_share is None:
+            current = self.config.commission_rate + self.config.slippage
+            slippage_share = self.config.slippage / current if current > 0 else 0.5
+        if not 0 <= slippage_share <= 1:
+            raise ValueError(f"slippage_share must be in [0, 1], got {slippage_share}")
+
+        fees = levels * (1 - slippage_share)
+        slippage = levels * slippage_share
+
+        kwargs = self._build_simulation_kwargs(data, initial_capital, regime)
+        kwargs['fees'] = vbt.Param(fees, level=0)
+        kwargs['slippage'] = vbt.Param(slippage, level=0)
+        pf = vbt.Portfolio.from_signals(**kwargs)
+
+        trade_stats = portfolio_trade_statistics(pf)
+        curve = pd.DataFrame(
+            {
+                'fees': fees,
+                'slippage': slippage,
+                'total_return': np.asarray(pf.total_return, dtype=np.float64),
+                'sharpe_ratio': np.asarray(pf.sharpe_ratio, dtype=np.float64),
+                'total_trades': trade_stats['total_trades'].to_numpy(),
+                'win_rate': trade_stats['win_rate'].to_numpy(),
+                'avg_trade': trade_stats['avg_trade'].to_numpy(),
+                'net_expectancy': trade_stats['expectancy'].to_numpy(),
+            },
+            index=pd.Index(levels, name='cost_per_side')
+        )
+
+        breakeven = breakeven_cost(levels, curve['net_expectancy'])
+        current_cost = self.config.commission_rate + self.config.slippage
+
+        return {
+            'curve': curve,
+            'breakeven_cost': breakeven,
+            'current_cost': current_cost,
+            'cost_margin': breakeven - current_cost,
+        }
+
+    def _build_simulation_kwargs(
+        self,
+        data: pd.DataFrame,
+        initial_capital: float,
+        regime: RegimeInput
+    ) -> Dict:
+        """
+        Generate signals and position sizes, and assemble from_signals() kwargs.
+
+        Shared by backtest() and backtest_metrics() so both run the exact same
+        simulation.
+
+        Raises:
+            ValueError: If signals or position sizes are invalid (see backtest())
+        """
+        # Per-bar regimes: generate unfiltered signals, gate entries below
+        regime_mask = None
+        if regime is not None and not isinstance(regime, str):
+            regime_mask = self.regime_entry_mask(regime, data.index)
+            regime = None
+
+        # Generate signals from child class (pass regime, cached if enabled)
+        signals = self.get_signals(data, regime=regime)
 
         # Auto-detect signal format and normalize to v1.0 format for VBT
         # (VBT from_signals expects 'entries'/'exits' parameters)
@@ -460,6 +795,11 @@ class BaseStrategy(ABC):
                 f"('long_entries', 'long_exits'). Got keys: {signals.keys()}"
             )
 
+        if regime_mask is not None:
+            long_entries = long_entries & regime_mask
+            if short_entries is not None:
+                short_entries = short_entries & regime_mask
+
         # Validate stop_distance exists (required in both formats)
         if 'stop_distance' not in signals:
             raise ValueError(
@@ -489,9 +829,7 @@ class BaseStrategy(ABC):
                 "Use data.index when creating position_sizes Series."
             )
 
-        # Run VectorBT Pro backtest
-        # Pattern validated: vbt.Portfolio.from_signals VERIFIED via MCP
-        pf = vbt.Portfolio.from_signals(
+        return dict(
             close=data['Close'],
             entries=long_entries,              # Normalized to v1.0 format
             exits=long_exits,                   # Normalized to v1.0 format
@@ -506,8 +844,6 @@ class BaseStrategy(ABC):
             freq='1D'                           # Daily data frequency
         )
 
-        return pf
-
     def get_performance_metrics(self, pf: vbt.Portfolio) -> Dict[str, float]:
         """
         Extract standardized performance metrics from VBT Portfolio.
@@ -530,6 +866,7 @@ class BaseStrategy(ABC):
             - total_trades: Number of trades executed
             - avg_winner: Average winning trade return
             - avg_loser: Average losing trade return
+            - expectancy: Per-trade expectancy from returns (decimal)
 
         Example:
             >>> pf = strategy.backtest(data, initial_capital=10000)
@@ -542,8 +879,10 @@ class BaseStrategy(ABC):
             - Sharpe ratio annualized (assumes daily frequency)
             - If no trades, returns NaN for trade-based metrics
         """
-        # Handle case where no trades were executed
-        trades_count = pf.trades.count()
+        # Single pass over trade records (instead of rebuilding pf.trades,
+        # pf.trades.winning and pf.trades.losing views for each metric)
+        trade_stats = portfolio_trade_statistics(pf).iloc[0]
+        trades_count = int(trade_stats['total_trades'])
 
         return {
             # Portfolio-level metrics
@@ -553,21 +892,27 @@ class BaseStrategy(ABC):
             'max_drawdown': pf.max_drawdown if not np.isnan(pf.max_drawdown) else 0.0,
 
             # Trade-level metrics (NaN if no trades)
-            'win_rate': pf.trades.win_rate if trades_count > 0 else np.nan,
-            'profit_factor': pf.trades.profit_factor if trades_count > 0 else np.nan,
-            'avg_trade': pf.trades.returns.mean() if trades_count > 0 else np.nan,
+            'win_rate': trade_stats['win_rate'],
+            'profit_factor': trade_stats['profit_factor'],
+            'avg_trade': trade_stats['avg_trade'],
             'total_trades': trades_count,
 
-            # Winner/loser analysis
-            # Use VBT Pro built-in properties (verified via MCP tools)
-            'avg_winner': (
-                pf.trades.winning.returns.mean()
-                if trades_count > 0 and pf.trades.winning.count() > 0
-                else np.nan
-            ),
-            'avg_loser': (
-                pf.trades.losing.returns.mean()
-                if trades_count > 0 and pf.trades.losing.count() > 0
-                else np.nan
-            ),
+            # Winner/loser analysis (NaN if no winners/losers)
+            'avg_winner': trade_stats['avg_winner'],
+            'avg_loser': trade_stats['avg_loser'],
+            'expectancy': trade_stats['expectancy'],
         }
+
+
+def _downsample_equity(equity: pd.Series, points: int) -> pd.Series:
+    """
+    Downsample an equity curve to at most `points` evenly spaced bars.
+
+    Always keeps the first and last bar so total return is preserved.
+    """
+    n = len(equity)
+    if n <= points:
+        return equity.copy()
+
+    positions = np.unique(np.linspace(0, n - 1, num=max(points, 2)).round().astype(int))
+    return equity.iloc[positions].copy()
@@ -21,13 +21,15 @@ import numpy as np
 import vectorbtpro as vbt
 from datetime import time
 from typing import Dict, Tuple, Optional
-import pandas_market_calendars as mcal
 import os
 from dotenv import load_dotenv
 from pydantic import Field
 
 from strategies.base_strategy import BaseStrategy, StrategyConfig
 from utils.position_sizing import calculate_position_size_atr
+from utils.signal_cache import fingerprint_data
+from strategies.orb_simulator import simulate_orb
+from utils.trade_statistics import portfolio_trade_statistics
 
 # Load environment variables
 load_dotenv('config/.env')
@@ -76,8 +78,6 @@ class ORBStrategy(BaseStrategy):
         # Data storage (populated by fetch_data())
         self.data_5min = None
         self.data_daily = None
-        self._opening_range_cache = None
-        self._atr_cache = None
 
     def fetch_data(
         self,
@@ -145,6 +145,8 @@ class ORBStrategy(BaseStrategy):
         print(f"DEBUG: After RTH filter: {len(data_5min)} bars")
 
         # Filter NYSE trading days only (no weekends/holidays)
+        # Deferred: pandas_market_calendars is slow to import, used only here
+        import pandas_market_calendars as mcal
         nyse = mcal.get_calendar('NYSE')
         trading_days = nyse.valid_days(start_date=start, end_date=end)
 
@@ -241,6 +243,10 @@ class ORBStrategy(BaseStrategy):
             'opening_open': opening_open_ff
         }
 
+    def _signal_cache_extra(self) -> Tuple:
+        """ATR comes from data_daily when set, so daily bars are part of the signal cache key."""
+        return (fingerprint_data(self.data_daily),)
+
     def generate_signals(self, data: pd.DataFrame, regime: Optional[str] = None) -> Dict[str, pd.Series]:
         """
         Generate entry/exit signals with MANDATORY volume confirmation.
@@ -418,6 +424,47 @@ class ORBStrategy(BaseStrategy):
 
     # Additional helper methods (not part of BaseStrategy interface)
 
+    def simulate(
+        self,
+        data: pd.DataFrame,
+        initial_capital: float = 10000.0
+    ) -> Dict:
+        """
+        Fast ORB backtest using the compiled simulator (no vbt.Portfolio).
+
+        Sizes each trade once at entry, tracks the ATR stop intrabar with
+        High/Low, and flattens at 3:55 PM or the session's last bar.
+        Returns trade records directly instead of a Portfolio.
+
+        Args:
+            data: 5-minute OHLCV DataFrame with DatetimeIndex
+            initial_capital: Starting capital in dollars
+
+        Returns:
+            Dict from strategies/orb_simulator.simulate_orb():
+            'trades' (structured array), 'init_cash', 'final_value',
+            'total_return', 'index'
+
+        Example:
+            >>> result = strategy.simulate(data_5min, initial_capital=10000)
+            >>> stats = compute_trade_statistics(result['trades'])
+
+        Note:
+            Stops are fixed in price units (entry -/+ stop_distance), which is
+            how generate_signals() defines stop_distance. Use backtest() when
+            you need a vbt.Portfolio for plotting or order-level analysis.
+        """
+        signals = self.get_signals(data)
+
+        return simulate_orb(
+            data,
+            signals,
+            init_cash=initial_capital,
+            risk_pct=self.config.risk_per_trade,
+            fees=self.config.commission_rate,
+            slippage=self.config.slippage
+        )
+
     def analyze_expectancy(
         self,
         pf: vbt.Portfolio,
@@ -435,24 +482,18 @@ class ORBStrategy(BaseStrategy):
         Returns:
             Dict with expectancy metrics and viability assessment
         """
-        trades = pf.trades
+        # Single pass over trade records (utils/trade_statistics.py)
+        trade_stats = portfolio_trade_statistics(pf).iloc[0]
 
-        if trades.count() == 0:
+        if trade_stats['total_trades'] == 0:
             print("[WARNING] No trades executed - cannot calculate expectancy")
             return None
 
-        win_rate = trades.win_rate
+        win_rate = trade_stats['win_rate']
 
-        # Use VBT Pro built-in properties
-        if trades.winning.count() > 0:
-            avg_win = trades.winning.returns.mean()
-        else:
-            avg_win = 0.0
-
-        if trades.losing.count() > 0:
-            avg_loss = abs(trades.losing.returns.mean())
-        else:
-            avg_loss = 0.0
+        # No winners/losers count as 0 average (same as before)
+        avg_win = trade_stats['avg_winner'] if trade_stats['winning_trades'] > 0 else 0.0
+        avg_loss = abs(trade_stats['avg_loser']) if trade_stats['losing_trades'] > 0 else 0.0
 
         if avg_loss == 0:
             print("[WARNING] No losing trades - cannot calculate R:R")
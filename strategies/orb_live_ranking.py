@@ -0,0 +1,288 @@
+"""
+Live Cross-Sectional Setup Ranking - Bounded Top-N Heap
+
+UniverseScanner ranks setups in batch after the fact. Live, the universe-wide
+best setups must be ready right after each bar close. LiveSetupRanker sits
+after ORBStreamingEngine.on_bars() and keeps only the best N setups of the
+current session:
+
+- Bounded min-heap keyed by quality score: O(log N) per candidate
+- At most one candidate per symbol (a better setup replaces the old one;
+  replaced heap entries are dropped lazily)
+- Session cutoff: no candidates after the cutoff time, and everything
+  expires when a new session starts
+- top_n() returns the current best setups with heat checks against a
+  PortfolioHeatManager / ConcurrentHeatManager
+
+Scoring is supplied by the caller (e.g., calculate_setup_quality_score from
+examples/universe_portfolio_scanner.py), so the ranker works with any
+decision source that provides entry flags, close and stop distance.
+
+Usage:
+    >>> ranker = LiveSetupRanker(max_setups=10, score_func=score_decision)
+    >>> decisions = engine.on_bars(ts, bars)
+    >>> ranker.on_decisions(ts, decisions, bars)
+    >>> for setup in ranker.top_n(capital=100000, heat_manager=heat_mgr):
+    ...     if setup['heat_ok']:
+    ...         submit_order(setup['symbol'], setup['size'], setup['stop_distance'])
+
+Reference: strategies/orb_streaming.py (ORBStreamingEngine)
+"""
+
+import heapq
+from datetime import datetime, time
+from itertools import count
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+# Default cutoff for new candidates (ORB entries late in the day have no runway)
+DEFAULT_SESSION_CUTOFF = time(15, 30)
+
+# Score callback: (symbol, timestamp, decision, (open, high, low, close, volume)) -> score
+ScoreFunc = Callable[[str, datetime, Dict, Tuple[float, float, float, float, float]], float]
+
+
+class LiveSetupRanker:
+    """
+    Bounded top-N ranking of the current session's setups.
+
+    Attributes:
+        max_setups: Number of setups kept (N)
+        session_cutoff: Bar time after which candidates are ignored and
+            top_n() returns nothing
+        risk_pct: Risk per trade used to size candidates for heat checks
+        session_date: Date of the current session (None before first bar)
+
+    Example:
+        >>> ranker = LiveSetupRanker(max_setups=5)
+        >>> ranker.add_candidate('NVDA', ts, score=82.5, entry_price=490.0,
+        ...                      stop_distance=12.5)
+        >>> ranker.top_n()[0]['symbol']
+        'NVDA'
+    """
+
+    def __init__(
+        self,
+        max_setups: int = 10,
+        score_func: Optional[ScoreFunc] = None,
+        session_cutoff: time = DEFAULT_SESSION_CUTOFF,
+        risk_pct: float = 0.02
+    ):
+        """
+        Initialize live ranker.
+
+        Args:
+            max_setups: Number of best setups to keep (N)
+            score_func: Scoring callback used by on_decisions()
+                (not needed if only add_candidate() is used)
+            session_cutoff: Latest bar time that can add candidates
+            risk_pct: Risk per trade as decimal (ATR sizing for heat checks)
+
+        Raises:
+            ValueError: If max_setups < 1 or risk_pct not positive
+        """
+        if max_setups < 1:
+            raise ValueError(f"max_setups must be >= 1, got {max_setups}")
+        if risk_pct <= 0:
+            raise ValueError(f"risk_pct must be positive, got {risk_pct}")
+
+        self.max_setups = max_setups
+        self.score_func = score_func
+        self.session_cutoff = session_cutoff
+        self.risk_pct = risk_pct
+
+        self.session_date = None
+        self._cutoff_passed = False
+        self._heap: List[Tuple[float, int, str]] = []   # (score, seq, symbol)
+        self._live: Dict[str, Tuple[int, Dict]] = {}     # symbol -> (seq, setup)
+        self._seq = count()
+
+    def _roll_session(self, timestamp: datetime) -> bool:
+        """Expire on new session; return False if past the cutoff."""
+        bar_date = timestamp.date()
+        if bar_date != self.session_date:
+            self.session_date = bar_date
+            self._cutoff_passed = False
+            self._heap.clear()
+            self._live.clear()
+
+        if timestamp.time() > self.session_cutoff:
+            self._cutoff_passed = True
+        return not self._cutoff_passed
+
+    def add_candidate(
+        self,
+        symbol: str,
+        timestamp: datetime,
+        score: float,
+        entry_price: float,
+        stop_distance: float,
+        direction: str = 'long'
+    ) -> bool:
+        """
+        Offer one setup to the ranking (O(log N)).
+
+        Args:
+            symbol: Symbol of the setup
+            timestamp: Signal bar timestamp (exchange local time)
+            score: Quality score (higher = better)
+            entry_price: Expected entry price (signal bar close)
+            stop_distance: Stop distance in price units
+            direction: 'long' or 'short'
+
+        Returns:
+            True if the setup is currently in the top N
+        """
+        if not self._roll_session(timestamp):
+            return False
+        if not (stop_distance > 0) or not (entry_price > 0) or np.isnan(score):
+            return False
+
+        current = self._live.get(symbol)
+        if current is not None and current[1]['score'] >= score:
+            return False
+
+        if len(self._live) >= self.max_setups and current is None:
+            if score <= self._min_live_score():
+                return False
+
+        seq = next(self._seq)
+        self._live[symbol] = (seq, {
+            'symbol': symbol,
+            'timestamp': timestamp,
+            'score': score,
+            'entry_price': entry_price,
+            'stop_distance': stop_distance,
+            'direction': direction,
+        })
+        heapq.heappush(self._heap, (score, seq, symbol))
+
+        # Evict the worst live setups beyond N (stale entries are dropped)
+        while len(self._live) > self.max_setups:
+            _, old_seq, old_symbol = heapq.heappop(self._heap)
+            if self._is_live(old_seq, old_symbol):
+                del self._live[old_symbol]
+
+        # Keep replaced entries from piling up
+        if len(self._heap) > 2 * self.max_setups:
+            self._heap = [entry for entry in self._heap if self._is_live(entry[1], entry[2])]
+            heapq.heapify(self._heap)
+
+        return self._is_live(seq, symbol)
+
+    def on_decisions(
+        self,
+        timestamp: datetime,
+        decisions: Dict[str, Dict],
+        bars: Dict[str, Tuple[float, float, float, float, float]]
+    ) -> int:
+        """
+        Feed one bar close of ORBStreamingEngine.on_bars() output.
+
+        Args:
+            timestamp: Common bar timestamp
+            decisions: Dict mapping symbol -> decision dict (on_bar() format)
+            bars: Dict mapping symbol -> (open, high, low, close, volume)
+
+        Returns:
+            Number of candidates that entered the top N
+
+        Raises:
+            ValueError: If no score_func was configured
+        """
+        if self.score_func is None:
+            raise ValueError("on_decisions() requires a score_func")
+        if not self._roll_session(timestamp):
+            return 0
+
+        added = 0
+        for symbol, decision in decisions.items():
+            if decision['long_entry']:
+                direction = 'long'
+            elif decision['short_entry']:
+                direction = 'short'
+            else:
+                continue
+
+            ohlcv = bars[symbol]
+            score = self.score_func(symbol, timestamp, decision, ohlcv)
+            added += self.add_candidate(
+                symbol, timestamp, score, ohlcv[3], decision['stop_distance'], direction
+            )
+        return added
+
+    def top_n(
+        self,
+        n: Optional[int] = None,
+        capital: Optional[float] = None,
+        heat_manager=None
+    ) -> List[Dict]:
+        """
+        Current best setups, best first, with optional heat checks.
+
+        Heat check (when capital and heat_manager are given): setups are
+        sized with ATR sizing at capital, min(capital x risk_pct / stop,
+        capital / price). They are accepted greedily in rank order while
+        current heat + accepted risk <= heat_manager.max_heat. Symbols that
+        already have a position are never accepted.
+
+        Args:
+            n: Number of setups to return (default: all kept, up to N)
+            capital: Account size for sizing / heat
+            heat_manager: PortfolioHeatManager or ConcurrentHeatManager
+
+        Returns:
+            List of setup dicts (symbol, timestamp, score, entry_price,
+            stop_distance, direction, plus size, risk, heat_ok when heat
+            is checked). Empty after the session cutoff.
+        """
+        if self._cutoff_passed:
+            return []
+
+        setups = sorted(
+            (setup for _, setup in self._live.values()),
+            key=lambda s: s['score'], reverse=True
+        )[:n]
+        setups = [dict(setup) for setup in setups]
+
+        if capital is None or heat_manager is None:
+            return setups
+
+        open_symbols = set(heat_manager.get_active_positions())
+        budget = heat_manager.max_heat * capital
+        heat = heat_manager.calculate_current_heat(capital) * capital
+
+        for setup in setups:
+            size = min(capital * self.risk_pct / setup['stop_distance'],
+                       capital / setup['entry_price'])
+            risk = size * setup['stop_distance']
+            heat_ok = setup['symbol'] not in open_symbols and heat + risk <= budget
+            if heat_ok:
+                heat += risk
+            setup.update(size=size, risk=risk, heat_ok=heat_ok)
+
+        return setups
+
+    def remove(self, symbol: str):
+        """
+        Drop a symbol's setup (e.g., after its order was submitted).
+
+        Args:
+            symbol: Symbol to remove (silently succeeds if unknown)
+        """
+        self._live.pop(symbol, None)
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def _is_live(self, seq: int, symbol: str) -> bool:
+        current = self._live.get(symbol)
+        return current is not None and current[0] == seq
+
+    def _min_live_score(self) -> float:
+        """Lowest live score (drops stale heap tops on the way)."""
+        while not self._is_live(self._heap[0][1], self._heap[0][2]):
+            heapq.heappop(self._heap)
+        return self._heap[0][0]
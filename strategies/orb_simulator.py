@@ -0,0 +1,317 @@
+"""
+Compiled ORB Simulator - Direct Trade Records for Intraday Breakouts
+
+Dedicated simulation path for the ORB pattern (enter on breakout, ATR stop,
+flat by end of day) that bypasses vbt.Portfolio.from_signals().
+
+Why a dedicated path?
+- from_signals() broadcasts entries, exits, sizes and stops to full arrays
+  and builds order/log records for every column
+- ORB only needs a size on entry bars, one stop level per trade, and a
+  forced exit at the end of each session
+- One Numba loop over the bars produces trade records directly
+
+Execution Model (per column, one position at a time):
+- Entry at signal bar close (+/- slippage), sized ONCE at entry:
+  min(init_cash * risk_pct / stop_distance, init_cash / close), capped by cash
+  (same formula as utils/position_sizing.calculate_position_size_atr)
+- Stop level fixed at entry: entry_price -/+ stop_distance (price units)
+- Stop checked intrabar from the next bar: gap through stop fills at open,
+  otherwise at the stop level (high/low touch)
+- Exit signal (3:55 PM EOD) fills at close; the last bar of every session
+  force-exits if still in a position (half days, missing 3:55 bar)
+- Entries on exit bars and conflicting long/short entries are ignored
+- Fees: fraction of traded value on entry and exit
+
+Trade records are compatible with utils/trade_statistics.compute_trade_statistics().
+
+Reference: strategies/orb.py (generate_signals, calculate_position_size)
+"""
+
+from typing import Dict, Union
+
+import numpy as np
+import pandas as pd
+from numba import njit
+
+
+# Exit reasons for ORB_TRADE_DTYPE['exit_type']
+EXIT_STOP = 0
+EXIT_SIGNAL = 1
+EXIT_SESSION_END = 2
+
+# Direction codes (same convention as VBT trade records)
+DIRECTION_LONG = 0
+DIRECTION_SHORT = 1
+
+ORB_TRADE_DTYPE = np.dtype([
+    ('id', np.int64),
+    ('col', np.int64),
+    ('size', np.float64),
+    ('entry_idx', np.int64),
+    ('entry_price', np.float64),
+    ('entry_fees', np.float64),
+    ('exit_idx', np.int64),
+    ('exit_price', np.float64),
+    ('exit_fees', np.float64),
+    ('pnl', np.float64),
+    ('return', np.float64),
+    ('direction', np.int64),
+    ('exit_type', np.int64),
+])
+
+
+@njit(cache=True)
+def simulate_orb_nb(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    long_entries: np.ndarray,
+    short_entries: np.ndarray,
+    exits: np.ndarray,
+    stop_distance: np.ndarray,
+    session_end: np.ndarray,
+    init_cash: np.ndarray,
+    risk_pct: float,
+    fees: float,
+    slippage: float,
+    records: np.ndarray
+) -> tuple:
+    """
+    Simulate ORB trades for every column in one pass.
+
+    Args:
+        open_, high, low, close: Price arrays, shape (bars, cols)
+        long_entries, short_entries: Entry signals, shape (bars, cols)
+        exits: Exit signals (EOD), shape (bars, cols)
+        stop_distance: Stop distance in price units, shape (bars, cols)
+        session_end: True on the last bar of each session, shape (bars,)
+        init_cash: Starting capital per column, shape (cols,)
+        risk_pct: Risk per trade as decimal (sizing at entry)
+        fees: Fees as fraction of traded value
+        slippage: Slippage as fraction of price
+        records: Preallocated ORB_TRADE_DTYPE array (>= number of entries)
+
+    Returns:
+        (number of records written, final cash per column)
+    """
+    n_bars, n_cols = close.shape
+    final_cash = np.empty(n_cols)
+    n_records = 0
+
+    for col in range(n_cols):
+        cash = init_cash[col]
+        in_position = False
+        direction = DIRECTION_LONG
+        size = 0.0
+        entry_idx = 0
+        entry_price = 0.0
+        entry_fees = 0.0
+        stop_level = 0.0
+
+        for i in range(n_bars):
+            exited_this_bar = False
+
+            if in_position:
+                exit_price = np.nan
+                exit_type = EXIT_STOP
+
+                # 1. Intrabar stop (checked before the close-based exits)
+                if direction == DIRECTION_LONG:
+                    if open_[i, col] <= stop_level:
+                        exit_price = open_[i, col]
+                    elif low[i, col] <= stop_level:
+                        exit_price = stop_level
+                else:
+                    if open_[i, col] >= stop_level:
+                        exit_price = open_[i, col]
+                    elif high[i, col] >= stop_level:
+                        exit_price = stop_level
+
+                # 2. Exit signal / session end at close
+                if np.isnan(exit_price):
+                    if exits[i, col]:
+                        exit_price = close[i, col]
+                        exit_type = EXIT_SIGNAL
+                    elif session_end[i]:
+                        exit_price = close[i, col]
+                        exit_type = EXIT_SESSION_END
+
+                if not np.isnan(exit_price):
+                    if direction == DIRECTION_LONG:
+                        fill = exit_price * (1.0 - slippage)
+                        exit_fees = size * fill * fees
+                        cash += size * fill - exit_fees
+                        pnl = (fill - entry_price) * size - entry_fees - exit_fees
+                    else:
+                        fill = exit_price * (1.0 + slippage)
+                        exit_fees = size * fill * fees
+                        cash -= size * fill + exit_fees
+                        pnl = (entry_price - fill) * size - entry_fees - exit_fees
+
+                    rec = records[n_records]
+                    rec['id'] = n_records
+                    rec['col'] = col
+                    rec['size'] = size
+                    rec['entry_idx'] = entry_idx
+                    rec['entry_price'] = entry_price
+                    rec['entry_fees'] = entry_fees
+                    rec['exit_idx'] = i
+                    rec['exit_price'] = fill
+                    rec['exit_fees'] = exit_fees
+                    rec['pnl'] = pnl
+                    rec['return'] = pnl / (size * entry_price)
+                    rec['direction'] = direction
+                    rec['exit_type'] = exit_type
+                    n_records += 1
+
+                    in_position = False
+                    exited_this_bar = True
+
+            if in_position or exited_this_bar:
+                continue
+
+            # 3. Entries (never on an exit bar, conflicting signals ignored)
+            go_long = long_entries[i, col]
+            go_short = short_entries[i, col]
+            if go_long == go_short or exits[i, col] or session_end[i]:
+                continue
+
+            stop = stop_distance[i, col]
+            price = close[i, col]
+            if not (stop > 0) or not (price > 0):
+                continue  # ATR warmup / bad bar
+
+            # Size at entry only (risk-based, capped at 100% of capital)
+            size = min(init_cash[col] * risk_pct / stop, init_cash[col] / price)
+
+            if go_long:
+                direction = DIRECTION_LONG
+                fill = price * (1.0 + slippage)
+            else:
+                direction = DIRECTION_SHORT
+                fill = price * (1.0 - slippage)
+
+            # Cannot commit more than available cash
+            size = min(size, cash / (fill * (1.0 + fees)))
+            if not (size > 0):
+                continue
+
+            entry_fees = size * fill * fees
+            if direction == DIRECTION_LONG:
+                cash -= size * fill + entry_fees
+                stop_level = fill - stop
+            else:
+                cash += size * fill - entry_fees
+                stop_level = fill + stop
+
+            entry_idx = i
+            entry_price = fill
+            in_position = True
+
+        final_cash[col] = cash
+
+    return n_records, final_cash
+
+
+def session_end_mask(index: pd.DatetimeIndex) -> np.ndarray:
+    """
+    Flag the last bar of each calendar session.
+
+    Args:
+        index: Intraday DatetimeIndex (tz-aware recommended)
+
+    Returns:
+        Boolean array, True where the next bar belongs to a different day
+    """
+    days = index.normalize().asi8
+    mask = np.ones(len(days), dtype=bool)
+    mask[:-1] = days[:-1] != days[1:]
+    return mask
+
+
+def _as_2d(values: Union[pd.Series, pd.DataFrame, np.ndarray, None], shape, dtype) -> np.ndarray:
+    """Broadcast a Series/DataFrame/array (or None -> zeros) to (bars, cols)."""
+    if values is None:
+        return np.zeros(shape, dtype=dtype)
+    arr = np.asarray(values, dtype=dtype)
+    if arr.ndim == 1:
+        arr = arr[:, None]
+    return np.ascontiguousarray(np.broadcast_to(arr, shape))
+
+
+def simulate_orb(
+    data: Dict[str, Union[pd.Series, pd.DataFrame]],
+    signals: Dict[str, Union[pd.Series, pd.DataFrame]],
+    init_cash: Union[float, np.ndarray] = 10000.0,
+    risk_pct: float = 0.02,
+    fees: float = 0.0,
+    slippage: float = 0.0
+) -> Dict:
+    """
+    Run the compiled ORB simulation on one or many symbols.
+
+    Args:
+        data: OHLC mapping ('Open', 'High', 'Low', 'Close'); values are Series
+            (one symbol) or DataFrames with one column per symbol.
+            A single-symbol OHLCV DataFrame also works.
+        signals: generate_signals() output with 'long_entries', 'long_exits',
+            'stop_distance' and optionally 'short_entries'
+        init_cash: Starting capital (scalar or one per column)
+        risk_pct: Risk per trade as decimal
+        fees: Fees as fraction of traded value
+        slippage: Slippage as fraction of price
+
+    Returns:
+        Dictionary containing:
+        - 'trades': Structured array (ORB_TRADE_DTYPE), one record per trade
+        - 'init_cash': Starting capital per column (np.ndarray)
+        - 'final_value': Final cash per column (always flat at the end)
+        - 'total_return': Total return per column
+        - 'index': Bar index (map entry_idx/exit_idx to timestamps)
+
+    Example:
+        >>> result = simulate_orb(data_5min, signals, init_cash=10000, risk_pct=0.02)
+        >>> stats = compute_trade_statistics(result['trades'])
+        >>> print(f"Return: {result['total_return'][0]:.2%}")
+    """
+    close = data['Close']
+    index = close.index
+    n_bars = len(index)
+    n_cols = close.shape[1] if close.ndim == 2 else 1
+    shape = (n_bars, n_cols)
+
+    prices = [_as_2d(data[field], shape, np.float64) for field in ('Open', 'High', 'Low', 'Close')]
+    long_entries = _as_2d(signals['long_entries'], shape, np.bool_)
+    short_entries = _as_2d(signals.get('short_entries'), shape, np.bool_)
+    exits = _as_2d(signals['long_exits'], shape, np.bool_)
+    stop_distance = _as_2d(signals['stop_distance'], shape, np.float64)
+
+    cash = np.ascontiguousarray(np.broadcast_to(np.asarray(init_cash, dtype=np.float64), (n_cols,)))
+
+    # Upper bound: one trade per entry signal
+    max_trades = int(long_entries.sum() + short_entries.sum())
+    records = np.empty(max_trades, dtype=ORB_TRADE_DTYPE)
+
+    n_records, final_cash = simulate_orb_nb(
+        *prices,
+        long_entries,
+        short_entries,
+        exits,
+        stop_distance,
+        session_end_mask(index),
+        cash,
+        risk_pct,
+        fees,
+        slippage,
+        records
+    )
+
+    return {
+        'trades': records[:n_records],
+        'init_cash': cash,
+        'final_value': final_cash,
+        'total_return': final_cash / cash - 1.0,
+        'index': index,
+    }
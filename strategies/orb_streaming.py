@@ -0,0 +1,395 @@
+"""
+Streaming ORB Signal Engine - Bar-by-Bar Decisions for Live Trading
+
+ORBStrategy.generate_signals() works on a complete historical DataFrame:
+the rolling volume MA, ATR, opening range and EOD masks are recomputed over
+the full history on every call. That is fine for backtests but far too slow
+to run at every 5-minute bar close across hundreds of symbols.
+
+This module provides ORBStreamingEngine, which consumes one bar at a time per
+symbol and keeps O(1) state per symbol:
+- Current session opening range (high/low/open/close of first N bars)
+- 20-bar volume ring buffer with a compensated running sum
+- Latest daily ATR (incremental Wilder smoothing, same recurrence as TA-Lib)
+
+Decisions are identical to the batch path (same entry/exit/stop rules):
+- Long entry: close > opening high, bullish opening bar, volume surge,
+  bar time >= 9:30 + opening_minutes
+- Short entry: mirror image (only if enable_shorts)
+- Exit: EOD bar (3:55 PM ET)
+- Stop distance: daily ATR * atr_stop_multiplier
+
+Batch Parity Notes:
+- The batch path maps each session to the daily ATR of the SAME date. To
+  replay history exactly, call update_daily_bar() with a session's daily bar
+  before feeding its intraday bars. Live, call it after the close so the
+  next session uses the latest completed ATR.
+- The rolling volume mean uses the same remove/add Kahan-compensated sum as
+  pandas' rolling mean, so surge decisions match at the bit level.
+- The incremental ATR follows the TA-Lib recurrence but may differ from the
+  compiled library in the last floating-point digit. Entry/exit decisions do
+  not depend on the ATR; use update_daily_atr() with precomputed values if
+  stop distances must match bit for bit.
+- The batch opening range uses the first N bars of each date, even when they
+  arrive late (data gaps). The streaming engine cannot look ahead, so it only
+  decides entries once the opening range is complete.
+
+Usage:
+    >>> engine = ORBStreamingEngine(config)
+    >>> engine.update_daily_bar('NVDA', high=495.2, low=480.1, close=490.3)
+    >>> decision = engine.on_bar('NVDA', ts, open_, high, low, close, volume)
+    >>> if decision['long_entry']:
+    ...     submit_order('NVDA', stop_distance=decision['stop_distance'])
+
+Reference: strategies/orb.py (ORBStrategy.generate_signals)
+"""
+
+from datetime import datetime, time, timedelta
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+
+from strategies.orb import ORBConfig
+
+
+# Bar interval of the intraday feed (opening range is counted in bars)
+BAR_MINUTES = 5
+
+# Rolling window for volume confirmation (matches ORBStrategy.generate_signals)
+VOLUME_WINDOW = 20
+
+# EOD exit bar (3:55 PM ET - 5 minutes before close)
+EOD_EXIT_TIME = time(15, 55)
+
+
+class _SymbolState:
+    """Per-symbol streaming state (fixed size, no history retained)."""
+
+    __slots__ = (
+        # Session / opening range
+        'session_date', 'session_bar', 'or_high', 'or_low', 'or_open',
+        'or_close', 'or_complete',
+        # Volume ring buffer (pandas-compatible compensated rolling sum)
+        'vol_buffer', 'vol_pos', 'vol_nobs', 'vol_sum', 'vol_comp',
+        'vol_same_count', 'vol_prev',
+        # Daily ATR (Wilder smoothing)
+        'atr', 'atr_prev_close', 'atr_tr_sum', 'atr_tr_count',
+    )
+
+    def __init__(self):
+        self.session_date = None
+        self.session_bar = 0
+        self.or_high = -np.inf
+        self.or_low = np.inf
+        self.or_open = np.nan
+        self.or_close = np.nan
+        self.or_complete = False
+
+        self.vol_buffer = [0.0] * VOLUME_WINDOW
+        self.vol_pos = 0
+        self.vol_nobs = 0
+        self.vol_sum = 0.0
+        self.vol_comp = 0.0
+        self.vol_same_count = 0
+        self.vol_prev = np.nan
+
+        self.atr = np.nan
+        self.atr_prev_close = np.nan
+        self.atr_tr_sum = 0.0
+        self.atr_tr_count = 0
+
+
+class ORBStreamingEngine:
+    """
+    Incremental bar-by-bar ORB signal engine for live trading.
+
+    One engine serves any number of symbols; each symbol keeps its own
+    fixed-size state, so per-bar cost does not grow with history length.
+
+    Attributes:
+        config: ORBConfig shared by all symbols (opening range, multipliers)
+        n_opening_bars: Number of 5-minute bars in the opening range
+        entry_start_time: Earliest bar time allowed to enter
+
+    Example:
+        >>> config = ORBConfig(name="ORB Live", opening_minutes=5)
+        >>> engine = ORBStreamingEngine(config)
+        >>> for symbol, daily in prior_daily_bars.items():
+        ...     engine.update_daily_bar(symbol, daily.High, daily.Low, daily.Close)
+        >>> decisions = engine.on_bars(ts, latest_bars)  # {symbol: decision}
+    """
+
+    def __init__(self, config: ORBConfig):
+        """
+        Initialize streaming engine.
+
+        Args:
+            config: ORBConfig instance (same config used for batch backtests)
+        """
+        self.config = config
+        self.n_opening_bars = config.opening_minutes // BAR_MINUTES
+
+        market_open = datetime.strptime("09:30", "%H:%M")
+        entry_start = market_open + timedelta(minutes=config.opening_minutes)
+        self.entry_start_time = entry_start.time()
+
+        self._states: Dict[str, _SymbolState] = {}
+
+    def _get_state(self, symbol: str) -> _SymbolState:
+        state = self._states.get(symbol)
+        if state is None:
+            state = _SymbolState()
+            self._states[symbol] = state
+        return state
+
+    def update_daily_atr(self, symbol: str, atr: float):
+        """
+        Set the daily ATR directly (e.g., restored from a database on startup).
+
+        Args:
+            symbol: Symbol to update
+            atr: Daily ATR in price units
+        """
+        self._get_state(symbol).atr = float(atr)
+
+    def update_daily_bar(
+        self,
+        symbol: str,
+        high: float,
+        low: float,
+        close: float
+    ) -> float:
+        """
+        Feed one completed daily bar and update the ATR incrementally.
+
+        Uses the TA-Lib ATR recurrence: the first value is the simple mean of
+        the first atr_period true ranges, then Wilder smoothing
+        ATR_t = (ATR_{t-1} * (n - 1) + TR_t) / n.
+
+        Args:
+            symbol: Symbol to update
+            high: Daily high
+            low: Daily low
+            close: Daily close
+
+        Returns:
+            Updated daily ATR (NaN during warm-up)
+        """
+        state = self._get_state(symbol)
+        period = self.config.atr_period
+
+        prev_close = state.atr_prev_close
+        state.atr_prev_close = close
+
+        # First bar has no previous close (TA-Lib skips it)
+        if prev_close != prev_close:
+            return state.atr
+
+        true_range = max(high - low, abs(high - prev_close), abs(low - prev_close))
+
+        if state.atr_tr_count < period:
+            state.atr_tr_sum += true_range
+            state.atr_tr_count += 1
+            if state.atr_tr_count == period:
+                state.atr = state.atr_tr_sum / period
+        else:
+            atr = state.atr * (period - 1)
+            atr += true_range
+            state.atr = atr / period
+
+        return state.atr
+
+    def _update_volume_ma(self, state: _SymbolState, volume: float) -> float:
+        """Push one volume into the ring buffer and return the rolling mean."""
+        buffer = state.vol_buffer
+        pos = state.vol_pos
+
+        # Remove the value leaving the window (pandas removes before adding)
+        if state.vol_nobs == VOLUME_WINDOW:
+            y = -buffer[pos] - state.vol_comp
+            t = state.vol_sum + y
+            state.vol_comp = t - state.vol_sum - y
+            state.vol_sum = t
+            state.vol_nobs -= 1
+
+        # Add the new value
+        y = volume - state.vol_comp
+        t = state.vol_sum + y
+        state.vol_comp = t - state.vol_sum - y
+        state.vol_sum = t
+        state.vol_nobs += 1
+
+        if volume == state.vol_prev:
+            state.vol_same_count += 1
+        else:
+            state.vol_same_count = 1
+        state.vol_prev = volume
+
+        buffer[pos] = volume
+        state.vol_pos = (pos + 1) % VOLUME_WINDOW
+
+        if state.vol_nobs < VOLUME_WINDOW:
+            return np.nan
+
+        # Constant window: pandas returns the value itself (no rounding noise)
+        if state.vol_same_count >= VOLUME_WINDOW:
+            return volume
+
+        return state.vol_sum / VOLUME_WINDOW
+
+    def on_bar(
+        self,
+        symbol: str,
+        timestamp: datetime,
+        open_: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float
+    ) -> Dict[str, float]:
+        """
+        Process one completed 5-minute bar and return trading decisions.
+
+        Bars must arrive in chronological order per symbol. Timestamps must be
+        in exchange local time (America/New_York), like the batch data.
+
+        Args:
+            symbol: Symbol for this bar
+            timestamp: Bar timestamp (datetime or pd.Timestamp)
+            open_: Bar open
+            high: Bar high
+            low: Bar low
+            close: Bar close
+            volume: Bar volume
+
+        Returns:
+            Dict containing (same semantics as generate_signals() per bar):
+            - long_entry: Enter long at this bar's close
+            - long_exit: Exit long (EOD)
+            - short_entry: Enter short at this bar's close (if enabled)
+            - short_exit: Exit short (EOD)
+            - stop_distance: ATR-based stop distance (NaN if ATR not warmed up)
+            - atr, volume_ma, volume_confirmed, opening_high, opening_low
+        """
+        return self._process_bar(
+            self._get_state(symbol), timestamp.date(), timestamp.time(),
+            open_, high, low, close, volume
+        )
+
+    def _process_bar(
+        self,
+        state: _SymbolState,
+        bar_date,
+        bar_time: time,
+        open_: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float
+    ) -> Dict[str, float]:
+        """Core per-bar update (timestamp already split into date/time)."""
+        config = self.config
+
+        # New session: reset opening range
+        if bar_date != state.session_date:
+            state.session_date = bar_date
+            state.session_bar = 0
+            state.or_high = -np.inf
+            state.or_low = np.inf
+            state.or_open = open_
+            state.or_close = np.nan
+            state.or_complete = False
+
+        # Accumulate opening range (first N bars of the session)
+        if state.session_bar < self.n_opening_bars:
+            if high > state.or_high:
+                state.or_high = high
+            if low < state.or_low:
+                state.or_low = low
+            state.or_close = close
+            if state.session_bar == self.n_opening_bars - 1:
+                state.or_complete = True
+        state.session_bar += 1
+
+        # Volume confirmation (rolling window spans sessions, like the batch path)
+        volume_ma = self._update_volume_ma(state, volume)
+        volume_surge = volume > volume_ma * config.volume_multiplier
+
+        can_enter = bar_time >= self.entry_start_time
+        eod_exit = bar_time == EOD_EXIT_TIME
+
+        long_entry = False
+        short_entry = False
+        if state.or_complete:
+            opening_high = state.or_high
+            opening_low = state.or_low
+            if volume_surge and can_enter:
+                long_entry = (
+                    close > opening_high and
+                    state.or_close > state.or_open
+                )
+                short_entry = (
+                    config.enable_shorts and
+                    close < opening_low and
+                    state.or_close < state.or_open
+                )
+        else:
+            opening_high = np.nan
+            opening_low = np.nan
+
+        atr = state.atr
+
+        return {
+            'long_entry': long_entry,
+            'long_exit': eod_exit,
+            'short_entry': short_entry,
+            'short_exit': eod_exit,
+            'stop_distance': atr * config.atr_stop_multiplier,
+            'atr': atr,
+            'volume_ma': volume_ma,
+            'volume_confirmed': volume_surge,
+            'opening_high': opening_high,
+            'opening_low': opening_low
+        }
+
+    def on_bars(
+        self,
+        timestamp: datetime,
+        bars: Dict[str, Tuple[float, float, float, float, float]]
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Process one bar close across many symbols.
+
+        Args:
+            timestamp: Common bar timestamp
+            bars: Dict mapping symbol -> (open, high, low, close, volume)
+
+        Returns:
+            Dict mapping symbol -> decision dict (see on_bar())
+        """
+        # Split the shared timestamp once instead of once per symbol
+        bar_date = timestamp.date()
+        bar_time = timestamp.time()
+        get_state = self._get_state
+        process_bar = self._process_bar
+        return {
+            symbol: process_bar(get_state(symbol), bar_date, bar_time, *ohlcv)
+            for symbol, ohlcv in bars.items()
+        }
+
+    def get_symbols(self) -> Iterable[str]:
+        """Return symbols with streaming state."""
+        return list(self._states.keys())
+
+    def reset_symbol(self, symbol: str):
+        """
+        Drop all state for a symbol (e.g., after a data gap or corporate action).
+
+        Args:
+            symbol: Symbol to reset (silently succeeds if unknown)
+        """
+        self._states.pop(symbol, None)
+
+    def reset(self):
+        """Drop all streaming state for every symbol."""
+        self._states.clear()
@@ -7,10 +7,15 @@ modules from utils/, core/, data/, etc.
 Fixtures:
 - data_5min: Fetches SPY 5-minute data for January 2024 (shared across tests)
 - data_daily: Fetches SPY daily data for January 2024 (shared across tests)
+- random_walk_bars: Three years of synthetic daily OHLCV (no network)
+- crossover_strategy: Real BaseStrategy subclass for engine tests
+  (skipped without vectorbtpro)
 """
 
 import sys
 from pathlib import Path
+import numpy as np
+import pandas as pd
 import pytest
 
 # Add workspace root to Python path
@@ -67,3 +72,65 @@ def data_daily():
     data_5min, data_daily = strategy.fetch_data()
 
     return data_daily
+
+
+@pytest.fixture
+def random_walk_bars():
+    """
+    Three years of synthetic daily OHLCV bars (seeded random walk).
+
+    Returns:
+        pd.DataFrame: Daily OHLCV data with business-day DatetimeIndex
+    """
+    rng = np.random.default_rng(42)
+    index = pd.date_range('2021-01-04', '2023-12-29', freq='B')
+    close = pd.Series(100 * np.exp(np.cumsum(rng.normal(0.0003, 0.012, len(index)))), index=index)
+
+    return pd.DataFrame({
+        'Open': close.shift(1).fillna(close.iloc[0]),
+        'High': close * 1.01,
+        'Low': close * 0.99,
+        'Close': close,
+        'Volume': 1e6
+    }, index=index)
+
+
+@pytest.fixture
+def crossover_strategy():
+    """
+    Moving-average crossover built on the real BaseStrategy.
+
+    Lets engine tests (walk-forward, CPCV, optimizer, BacktestEngine) run
+    real signal generation, the SignalCache and VBT simulation instead of
+    duck-typed stand-ins. fast_window is a config field, so parameter
+    grids and trials change the signal cache key.
+
+    Returns:
+        BaseStrategy: CrossoverStrategy instance (config fast_window=5)
+    """
+    pytest.importorskip('vectorbtpro')
+    from strategies.base_strategy import BaseStrategy, StrategyConfig
+
+    class CrossoverConfig(StrategyConfig):
+        fast_window: int = 5
+        slow_window: int = 20
+
+    class CrossoverStrategy(BaseStrategy):
+        def generate_signals(self, data, regime=None):
+            fast = data['Close'].rolling(self.config.fast_window).mean()
+            slow = data['Close'].rolling(self.config.slow_window).mean()
+            above = fast > slow
+            was_above = above.shift(1, fill_value=False)
+            return {
+                'long_entries': above & ~was_above,
+                'long_exits': ~above & was_above,
+                'stop_distance': data['Close'] * 0.05,
+            }
+
+        def calculate_position_size(self, data, capital, stop_distance):
+            return pd.Series(10.0, index=data.index)
+
+        def get_strategy_name(self):
+            return "MA Crossover"
+
+    return CrossoverStrategy(CrossoverConfig(name="Crossover"))
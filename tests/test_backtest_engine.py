@@ -0,0 +1,174 @@
+"""
+Unit Tests for BacktestEngine
+
+Tests BacktestEngine for:
+- Content-addressed job keys (config, symbol, dates, capital)
+- Deduplication of identical jobs within a batch
+- Result cache hits on reruns (including across engine instances)
+- Per-job error isolation (failed jobs are not cached)
+- Process-pool execution matching in-process results
+- Real BaseStrategy jobs matching a direct backtest_metrics() call
+
+Run: uv run pytest tests/test_backtest_engine.py -v
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from pydantic import BaseModel
+
+from backtesting.backtest_engine import BacktestEngine, BacktestJob, ResultCache
+
+
+LOADS = []
+
+
+class ToyConfig(BaseModel):
+    """Minimal strategy config with symbol/date fields (ORBConfig stand-in)"""
+    name: str = "Toy"
+    symbol: str = "SPY"
+    start_date: str = "2024-01-01"
+    end_date: str = "2024-03-29"
+    lookback: int = 5
+
+
+class ToyStrategy:
+    """Duck-typed strategy: return depends on lookback and first close"""
+
+    def __init__(self, config):
+        self.config = config
+
+    def backtest_metrics(self, data, initial_capital=10000.0):
+        if self.config.symbol == 'BAD':
+            raise RuntimeError("bad symbol")
+        total_return = self.config.lookback / 100 + data['Close'].iloc[0] / 1e4
+        return {
+            'total_return': total_return,
+            'init_cash': initial_capital,
+            'final_value': initial_capital * (1 + total_return),
+        }
+
+
+def toy_loader(strategy, job):
+    """Synthetic daily bars per symbol/date range (records every load)"""
+    LOADS.append(strategy.config.symbol)
+    index = pd.date_range(strategy.config.start_date, strategy.config.end_date, freq='B')
+    close = np.full(len(index), 100.0 + len(strategy.config.symbol))
+    return pd.DataFrame({'Close': close}, index=index)
+
+
+def make_job(symbol='SPY', lookback=5, **kwargs):
+    return BacktestJob(strategy_cls=ToyStrategy, config=ToyConfig(lookback=lookback),
+                       symbol=symbol, **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def clear_loads():
+    LOADS.clear()
+
+
+class TestJobKeys:
+    """Content addressing"""
+
+    def test_key_depends_on_job_content(self):
+        """Same content -> same key; any changed input -> new key"""
+        base = make_job()
+
+        assert base.key() == make_job().key()
+        assert base.key() != make_job(symbol='QQQ').key()
+        assert base.key() != make_job(lookback=6).key()
+        assert base.key() != make_job(end_date='2024-02-29').key()
+        assert base.key() != make_job(initial_capital=5000.0).key()
+        assert base.key() != base.key(data_version='v2')
+
+    def test_overrides_applied_to_config(self):
+        """symbol/start/end are written into configs that have those fields"""
+        config = make_job(symbol='NVDA', start_date='2024-02-01').resolved_config()
+
+        assert config.symbol == 'NVDA'
+        assert config.start_date == '2024-02-01'
+        assert config.end_date == '2024-03-29'
+
+
+class TestScheduling:
+    """Deduplication, caching and error isolation"""
+
+    def test_duplicates_run_once(self):
+        """Identical jobs share one execution and one result"""
+        engine = BacktestEngine(max_workers=1, data_loader=toy_loader)
+        jobs = [make_job('SPY'), make_job('QQQ'), make_job('SPY')]
+
+        results = engine.run(jobs)
+
+        assert len(results) == 3
+        assert engine.executed == 2
+        assert sorted(LOADS) == ['QQQ', 'SPY']
+        assert results['total_return'].iloc[0] == results['total_return'].iloc[2]
+
+    def test_rerun_served_from_cache(self, tmp_path):
+        """A new engine on the same cache directory runs nothing"""
+        jobs = [make_job(s, lookback=lb) for s in ['SPY', 'QQQ'] for lb in [5, 10]]
+        first = BacktestEngine(cache_dir=tmp_path, max_workers=1,
+                               data_loader=toy_loader).run(jobs)
+        LOADS.clear()
+
+        engine = BacktestEngine(cache_dir=tmp_path, max_workers=1, data_loader=toy_loader)
+        second = engine.run(jobs)
+
+        assert LOADS == []
+        assert engine.cache_hits == 4 and engine.executed == 0
+        assert second['cached'].all() and not first['cached'].any()
+        pd.testing.assert_series_equal(first['total_return'], second['total_return'])
+
+    def test_errors_isolated_and_not_cached(self, tmp_path):
+        """A failing job reports its error and is retried on the next run"""
+        engine = BacktestEngine(cache_dir=tmp_path, max_workers=1, data_loader=toy_loader)
+
+        results = engine.run([make_job('SPY'), make_job('BAD')])
+
+        assert pd.isna(results['error'].iloc[0])
+        assert 'bad symbol' in results['error'].iloc[1]
+        assert len(ResultCache(tmp_path)) == 1
+
+        engine.run([make_job('SPY'), make_job('BAD')])
+        assert engine.cache_hits == 1 and engine.executed == 1
+
+    def test_process_pool_matches_in_process(self):
+        """Parallel execution gives the same results as in-process"""
+        jobs = [make_job(s, lookback=lb) for s in ['SPY', 'QQQ', 'IWM'] for lb in [5, 7]]
+
+        serial = BacktestEngine(max_workers=1, data_loader=toy_loader).run(jobs)
+        parallel = BacktestEngine(max_workers=2, data_loader=toy_loader).run(jobs)
+
+        columns = ['key', 'symbol', 'total_return', 'final_value', 'bars']
+        pd.testing.assert_frame_equal(serial[columns], parallel[columns])
+
+
+class TestRealStrategy:
+    """BaseStrategy subclass through the engine"""
+
+    def test_matches_direct_backtest(self, crossover_strategy, random_walk_bars, tmp_path):
+        """Records equal backtest_metrics(); reruns are served from the result cache"""
+        bars = {'SPY': random_walk_bars, 'QQQ': random_walk_bars * 1.5}
+        jobs = [
+            BacktestJob(strategy_cls=type(crossover_strategy),
+                        config=crossover_strategy.config.model_copy(update={'fast_window': w}),
+                        symbol=symbol)
+            for symbol in bars for w in (5, 10)
+        ]
+
+        def loader(strategy, job):
+            return bars[job.symbol]
+
+        first = BacktestEngine(cache_dir=tmp_path, max_workers=1, data_loader=loader).run(jobs)
+        engine = BacktestEngine(cache_dir=tmp_path, max_workers=1, data_loader=loader)
+        second = engine.run(jobs)
+
+        assert first['error'].isna().all()
+        for job, (_, row) in zip(jobs, first.iterrows()):
+            expected = job.strategy_cls(job.config).backtest_metrics(bars[job.symbol])
+            assert row['total_return'] == pytest.approx(expected['total_return'])
+            assert row['total_trades'] == expected['total_trades']
+        assert engine.cache_hits == len(jobs) and engine.executed == 0
+        pd.testing.assert_series_equal(first['total_return'], second['total_return'])
@@ -16,7 +16,7 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from typing import Optional
-from strategies.base_strategy import BaseStrategy, StrategyConfig
+from strategies.base_strategy import BaseStrategy, StrategyConfig, REGIME_CODES
 
 
 # Mock concrete strategy for testing
@@ -363,6 +363,156 @@ class TestPerformanceMetrics:
         assert np.isnan(metrics['avg_trade'])
 
 
+# Test Metrics-Only Backtest Mode
+class TestBacktestMetrics:
+    """Test backtest_metrics() lightweight mode"""
+
+    def test_metrics_match_full_backtest(self, valid_config, sample_data):
+        """Test metrics-only record matches metrics from full Portfolio"""
+        strategy = MockStrategy(valid_config)
+        pf = strategy.backtest(sample_data, initial_capital=10000)
+        expected = strategy.get_performance_metrics(pf)
+
+        record = strategy.backtest_metrics(sample_data, initial_capital=10000)
+
+        for key, value in expected.items():
+            if np.isnan(value):
+                assert np.isnan(record[key])
+            else:
+                assert record[key] == pytest.approx(value)
+        assert record['final_value'] == pytest.approx(pf.value.iloc[-1])
+        assert record['init_cash'] == 10000
+
+    def test_record_holds_no_portfolio(self, valid_config, sample_data):
+        """Test record contains only scalars when no equity curve requested"""
+        strategy = MockStrategy(valid_config)
+        record = strategy.backtest_metrics(sample_data, initial_capital=10000)
+
+        assert 'equity_curve' not in record
+        assert all(np.isscalar(value) for value in record.values())
+
+    def test_downsampled_equity_curve(self, valid_config, sample_data):
+        """Test equity curve is downsampled and keeps first/last bar"""
+        strategy = MockStrategy(valid_config)
+        pf = strategy.backtest(sample_data, initial_capital=10000)
+        record = strategy.backtest_metrics(
+            sample_data, initial_capital=10000, equity_points=10
+        )
+
+        equity = record['equity_curve']
+        assert len(equity) <= 10
+        assert equity.index[0] == sample_data.index[0]
+        assert equity.index[-1] == sample_data.index[-1]
+        assert equity.iloc[-1] == pytest.approx(pf.value.iloc[-1])
+
+
+# Test Transaction-Cost Sweep
+class TestCostSweep:
+    """Test cost_sweep() multi-column cost simulation"""
+
+    def test_matches_separate_backtests(self, sample_data):
+        """Test each cost column equals a backtest configured at that cost"""
+        levels = [0.0, 0.001, 0.002]
+        strategy = MockStrategy(StrategyConfig(name="Sweep", commission_rate=0.001,
+                                               slippage=0.001))
+
+        sweep = strategy.cost_sweep(sample_data, cost_levels=levels)
+
+        for level in levels:
+            single = MockStrategy(StrategyConfig(name="Single", commission_rate=level / 2,
+                                                 slippage=level / 2))
+            record = single.backtest_metrics(sample_data)
+            row = sweep['curve'].loc[level]
+            assert row['total_return'] == pytest.approx(record['total_return'])
+            assert row['net_expectancy'] == pytest.approx(record['expectancy'], nan_ok=True)
+
+        assert sweep['current_cost'] == pytest.approx(0.002)
+        assert sweep['curve']['total_return'].is_monotonic_decreasing
+
+    def test_invalid_levels_raise(self, valid_config, sample_data):
+        """Test unsorted or negative cost levels raise ValueError"""
+        strategy = MockStrategy(valid_config)
+
+        with pytest.raises(ValueError, match="ascending"):
+            strategy.cost_sweep(sample_data, cost_levels=[0.002, 0.001])
+        with pytest.raises(ValueError, match="ascending"):
+            strategy.cost_sweep(sample_data, cost_levels=[-0.001, 0.001])
+
+
+# Test Time-Varying Regime Mask
+class TestRegimeMask:
+    """Test per-bar regime gating in a single simulation"""
+
+    def test_label_and_code_masks_agree(self, valid_config, sample_data):
+        """Test string labels and int codes produce the same entry mask"""
+        strategy = MockStrategy(valid_config)
+        codes = np.arange(len(sample_data)) % 4
+        labels = pd.Series(np.array(REGIME_CODES)[codes], index=sample_data.index)
+
+        from_labels = strategy.regime_entry_mask(labels, sample_data.index)
+        from_codes = strategy.regime_entry_mask(codes, sample_data.index)
+
+        assert from_labels.equals(from_codes)
+        assert from_labels.tolist() == [c == 0 for c in codes]  # Only TREND_BULL
+
+    def test_incompatible_regime_blocks_entries(self, valid_config, sample_data):
+        """Test entries on bars with incompatible regime are dropped"""
+        strategy = MockStrategy(valid_config)
+        bear = pd.Series('TREND_BEAR', index=sample_data.index)
+
+        pf = strategy.backtest(sample_data, initial_capital=10000, regime=bear)
+
+        assert pf.trades.count() == 0
+
+    def test_compatible_regime_matches_unfiltered(self, valid_config, sample_data):
+        """Test all-compatible regime history matches plain backtest"""
+        strategy = MockStrategy(valid_config)
+        bull = np.zeros(len(sample_data), dtype=int)
+
+        pf_masked = strategy.backtest(sample_data, initial_capital=10000, regime=bull)
+        pf_plain = strategy.backtest(sample_data, initial_capital=10000)
+
+        assert pf_masked.value.iloc[-1] == pytest.approx(pf_plain.value.iloc[-1])
+
+    def test_length_mismatch_raises(self, valid_config, sample_data):
+        """Test regime array must match data length"""
+        strategy = MockStrategy(valid_config)
+
+        with pytest.raises(ValueError, match="must match"):
+            strategy.regime_entry_mask(np.zeros(3, dtype=int), sample_data.index)
+
+
+# Test Signal Cache
+class TestSignalCache:
+    """Test memoized signal generation"""
+
+    def test_repeated_backtests_generate_signals_once(self, valid_config, sample_data):
+        """Test capital-only changes reuse cached signals"""
+        strategy = MockStrategy(valid_config)
+        cache = strategy.enable_signal_cache(max_entries=4)
+
+        values = [
+            strategy.backtest(sample_data, initial_capital=capital).value.iloc[-1]
+            for capital in [10000, 20000, 10000]
+        ]
+
+        assert cache.misses == 1
+        assert cache.hits == 2
+        assert values[0] == pytest.approx(values[2])
+
+    def test_config_change_invalidates(self, valid_config, sample_data):
+        """Test changing config produces a new cache entry"""
+        strategy = MockStrategy(valid_config)
+        cache = strategy.enable_signal_cache()
+
+        strategy.get_signals(sample_data)
+        strategy.config.commission_rate = 0.001
+        strategy.get_signals(sample_data)
+
+        assert cache.misses == 2
+        assert len(cache) == 2
+
+
 # Test Edge Cases
 class TestEdgeCases:
     """Test edge cases and error handling"""
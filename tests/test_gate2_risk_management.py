@@ -13,19 +13,26 @@ Gate 2 Requirements:
 Test Coverage:
 - PortfolioHeatManager: 10 tests
 - RiskManager: 8 tests
+- Vectorized circuit breakers: 4 tests
+- Batch equity path evaluation: 4 tests
+- ConcurrentHeatManager: 7 tests
 - Integration: 1 test
-Total: 19 tests
+Total: 34 tests
 """
 
 import pytest
 import sys
+import threading
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from utils.portfolio_heat import PortfolioHeatManager
+from utils.portfolio_heat import PortfolioHeatManager, ConcurrentHeatManager
 from core.risk_manager import RiskManager
 
 
@@ -399,6 +406,355 @@ class TestRiskManager:
         assert "60" in captured.out or "0.6" in captured.out
 
 
+# =============================================================================
+# Vectorized Circuit Breaker Tests (4 tests)
+# =============================================================================
+
+def loop_circuit_breakers(risk_mgr, equity_curve):
+    """Reference: bar-by-bar loop from PortfolioManager.run_single_strategy_with_gates"""
+    triggers = []
+    for date, equity in equity_curve.items():
+        risk_mgr.update_equity(equity)
+        drawdown = risk_mgr.calculate_drawdown()
+
+        if drawdown >= 0.20 and not any(t[1] == 0.20 for t in triggers):
+            triggers.append((date, 0.20, 'STOP_TRADING'))
+        elif drawdown >= 0.15 and not any(t[1] == 0.15 for t in triggers):
+            triggers.append((date, 0.15, 'REDUCE_SIZE'))
+        elif drawdown >= 0.10 and not any(t[1] == 0.10 for t in triggers):
+            triggers.append((date, 0.10, 'WARNING'))
+    return triggers
+
+
+def assert_same_state(vectorized, loop):
+    """Final RiskManager state must be identical"""
+    assert vectorized.peak_equity == loop.peak_equity
+    assert vectorized.current_equity == loop.current_equity
+    assert vectorized.trading_enabled == loop.trading_enabled
+    assert vectorized.risk_multiplier == loop.risk_multiplier
+
+
+class TestVectorizedCircuitBreakers:
+    """Test RiskManager.update_equity_curve() against the bar-by-bar loop"""
+
+    @pytest.mark.parametrize('seed', range(8))
+    def test_matches_loop_on_random_curves(self, seed, capsys):
+        """
+        Test: Vectorized triggers and final state match per-bar updates.
+
+        Given: Random equity curves with deep drawdowns and recoveries
+        When: Evaluated by the loop and by update_equity_curve()
+        Then: Same trigger list and same final RiskManager state
+        """
+        rng = np.random.default_rng(seed)
+        index = pd.date_range('2024-01-02', periods=2000, freq='5min')
+        equity = pd.Series(
+            100000 * np.exp(np.cumsum(rng.normal(0, 0.004, len(index)))),
+            index=index
+        )
+
+        loop_mgr, vec_mgr = RiskManager(), RiskManager()
+        loop_mgr.update_equity(100000)
+        vec_mgr.update_equity(100000)
+
+        expected = loop_circuit_breakers(loop_mgr, equity)
+        result = vec_mgr.update_equity_curve(equity)
+
+        assert result['triggers'] == expected
+        assert_same_state(vec_mgr, loop_mgr)
+
+    def test_gap_through_multiple_levels(self, capsys):
+        """
+        Test: One bar crossing several levels records one trigger per bar.
+
+        Given: Equity drops from 100k to 75k in one bar, then stays there
+        When: Evaluated vectorized
+        Then: 20% on the gap bar, 15% and 10% on the following bars
+        """
+        equity = pd.Series([100000, 75000, 76000, 77000, 78000],
+                           index=pd.date_range('2024-01-01', periods=5))
+
+        loop_mgr, vec_mgr = RiskManager(), RiskManager()
+        expected = loop_circuit_breakers(loop_mgr, equity)
+        result = vec_mgr.update_equity_curve(equity)
+
+        assert [t[1] for t in result['triggers']] == [0.20, 0.15, 0.10]
+        assert result['triggers'] == expected
+        assert_same_state(vec_mgr, loop_mgr)
+
+    def test_reduce_size_persists_through_warning_zone(self, capsys):
+        """
+        Test: 15% DD then partial recovery to 12% keeps 0.5 multiplier.
+
+        Given: Drawdown 16% then 12%
+        When: Evaluated vectorized
+        Then: risk_multiplier stays 0.5 (10-15% band changes nothing)
+        """
+        equity = pd.Series([100000, 84000, 88000],
+                           index=pd.date_range('2024-01-01', periods=3))
+
+        risk_mgr = RiskManager()
+        risk_mgr.update_equity_curve(equity)
+
+        assert risk_mgr.risk_multiplier == 0.5
+        assert risk_mgr.trading_enabled is True
+
+    def test_nan_equity_ignored_for_peak(self, capsys):
+        """
+        Test: NaN equity values neither set a peak nor trigger breakers.
+
+        Given: Curve with a NaN bar
+        When: Evaluated by loop and vectorized
+        Then: Same triggers and state
+        """
+        equity = pd.Series([100000, np.nan, 85000, 110000, np.nan],
+                           index=pd.date_range('2024-01-01', periods=5))
+
+        loop_mgr, vec_mgr = RiskManager(), RiskManager()
+        expected = loop_circuit_breakers(loop_mgr, equity)
+        result = vec_mgr.update_equity_curve(equity)
+
+        assert result['triggers'] == expected
+        assert vec_mgr.peak_equity == loop_mgr.peak_equity == 110000
+        assert vec_mgr.trading_enabled == loop_mgr.trading_enabled
+        assert vec_mgr.risk_multiplier == loop_mgr.risk_multiplier
+
+
+# =============================================================================
+# Batch Equity Path Evaluation Tests (4 tests)
+# =============================================================================
+
+class TestEquityPathEvaluation:
+    """Test RiskManager.evaluate_equity_paths() against update_equity()"""
+
+    def test_matches_per_path_loop(self, capsys):
+        """
+        Test: Timelines match a fresh RiskManager per path.
+
+        Given: 20 random equity paths with deep drawdowns
+        When: Evaluated in one batch call
+        Then: Drawdown, multiplier and trading flag match update_equity() per bar
+        """
+        rng = np.random.default_rng(7)
+        paths = 100000 * np.exp(np.cumsum(rng.normal(0, 0.01, (300, 20)), axis=0))
+
+        result = RiskManager().evaluate_equity_paths(paths)
+
+        for p in range(paths.shape[1]):
+            loop_mgr = RiskManager()
+            for i, equity in enumerate(paths[:, p]):
+                loop_mgr.update_equity(equity)
+                assert result['drawdown'].iat[i, p] == pytest.approx(loop_mgr.calculate_drawdown())
+                assert result['risk_multiplier'].iat[i, p] == loop_mgr.risk_multiplier
+                assert result['trading_enabled'].iat[i, p] == loop_mgr.trading_enabled
+
+    def test_first_crossings_and_probability(self):
+        """
+        Test: First crossing bar per threshold and share of paths crossing.
+
+        Given: One path falling to -22%, one path to -12%
+        When: Evaluated with the default ladder (10/15/20/25%)
+        Then: Crossing bars are reported, -1 where never crossed
+        """
+        paths = pd.DataFrame({
+            'deep': [100000, 95000, 88000, 84000, 78000],
+            'mild': [100000, 99000, 95000, 88000, 90000],
+        }, dtype=float)
+
+        result = RiskManager().evaluate_equity_paths(paths)
+        crossings = result['first_crossing']
+
+        assert crossings['deep'].tolist() == [2, 3, 4, -1]
+        assert crossings['mild'].tolist() == [3, -1, -1, -1]
+        assert result['crossing_probability'].tolist() == [1.0, 0.5, 0.5, 0.0]
+        assert result['trading_enabled']['deep'].tolist() == [True, True, True, True, False]
+
+    def test_custom_ladder_and_no_state_change(self):
+        """
+        Test: Custom drawdown_thresholds are used; manager state is untouched.
+        """
+        risk_mgr = RiskManager(drawdown_thresholds={
+            0.05: 'WARNING', 0.08: 'REDUCE_SIZE', 0.12: 'STOP_TRADING'
+        })
+        risk_mgr.update_equity(50000)
+
+        result = risk_mgr.evaluate_equity_paths(np.array([100000, 91000, 87000]))
+
+        assert result['risk_multiplier'][0].tolist() == [1.0, 0.5, 0.0]
+        assert risk_mgr.peak_equity == 50000
+        assert risk_mgr.risk_multiplier == 1.0
+
+        with pytest.raises(ValueError, match="STOP_TRADING"):
+            RiskManager(drawdown_thresholds={0.10: 'WARNING'}).evaluate_equity_paths(
+                np.ones(3)
+            )
+
+    def test_custom_ladder_consistent_across_paths(self, capsys):
+        """
+        Test: update_equity(), update_equity_curve() and evaluate_equity_paths()
+        all act on the same custom ladder.
+        """
+        ladder = {0.05: 'WARNING', 0.08: 'REDUCE_SIZE', 0.12: 'STOP_TRADING'}
+        equity = pd.Series([100000, 94000, 91000, 87000, 97000],
+                           index=pd.date_range('2024-01-01', periods=5))
+
+        loop_mgr, vec_mgr = RiskManager(drawdown_thresholds=ladder), RiskManager(drawdown_thresholds=ladder)
+        multipliers = []
+        for value in equity:
+            loop_mgr.update_equity(value)
+            multipliers.append(loop_mgr.risk_multiplier)
+        result = vec_mgr.update_equity_curve(equity)
+        paths = RiskManager(drawdown_thresholds=ladder).evaluate_equity_paths(equity.to_frame('p'))
+
+        assert multipliers == [1.0, 1.0, 0.5, 0.0, 1.0]
+        assert paths['risk_multiplier']['p'].tolist() == multipliers
+        assert [t[1:] for t in result['triggers']] == [
+            (0.05, 'WARNING'), (0.08, 'REDUCE_SIZE'), (0.12, 'STOP_TRADING')
+        ]
+        assert vec_mgr.risk_multiplier == loop_mgr.risk_multiplier == 1.0
+
+
+# =============================================================================
+# ConcurrentHeatManager Tests (7 tests)
+# =============================================================================
+
+class TestConcurrentHeatManager:
+    """Test the array-backed, thread-safe heat manager."""
+
+    def test_matches_dict_manager(self):
+        """
+        Test: Same heat as PortfolioHeatManager after add/update/remove.
+
+        Given: Identical position changes applied to both managers
+        When: Heat is calculated after each step
+        Then: Heat values match
+        """
+        capital = 100000
+        reference = PortfolioHeatManager(max_heat=0.08)
+        fast = ConcurrentHeatManager(max_heat=0.08, capacity=2)
+
+        for symbol, risk in [('SPY', 2000), ('QQQ', 2500), ('AAPL', 1500)]:
+            reference.add_position(symbol, risk)
+        fast.add_positions(['SPY', 'QQQ', 'AAPL'], [2000, 2500, 1500])
+        assert fast.calculate_current_heat(capital) == pytest.approx(
+            reference.calculate_current_heat(capital))
+
+        reference.update_position_risk('QQQ', 1000)
+        reference.remove_position('SPY')
+        fast.update_position_risk('QQQ', 1000)
+        fast.remove_positions(['SPY', 'UNKNOWN'])
+
+        assert fast.calculate_current_heat(capital) == pytest.approx(
+            reference.calculate_current_heat(capital))
+        assert fast.get_active_positions() == reference.get_active_positions()
+        assert fast.get_position_count() == 2
+
+    def test_batch_accept_is_greedy_in_order(self):
+        """
+        Test: Cumulative batch check consumes heat in priority order.
+
+        Given: 4.5% heat, 8% limit
+        When: Candidates of 2%, 2%, 1% are checked
+        Then: Cumulative accepts 2% and 1%; independent accepts all three
+        """
+        heat = ConcurrentHeatManager(max_heat=0.08)
+        heat.add_positions(['SPY', 'QQQ'], [2000, 2500])
+
+        cumulative = heat.can_accept_batch([2000, 2000, 1000], 100000)
+        independent = heat.can_accept_batch([2000, 2000, 1000], 100000, cumulative=False)
+
+        assert cumulative.tolist() == [True, False, True]
+        assert independent.tolist() == [True, True, True]
+        assert heat.get_position_count() == 2  # snapshot check only
+
+    def test_reserve_batch_adds_accepted(self):
+        """
+        Test: reserve_batch() accepts, adds, and rejects duplicates.
+
+        Given: SPY already open at 2%
+        When: SPY, AAPL, AAPL, MSFT, NVDA reserved at 2.5% each
+        Then: Only AAPL and MSFT fit (SPY open, AAPL repeated, NVDA over limit)
+        """
+        heat = ConcurrentHeatManager(max_heat=0.08)
+        heat.add_position('SPY', 2000)
+
+        accepted = heat.reserve_batch(
+            ['SPY', 'AAPL', 'AAPL', 'MSFT', 'NVDA'], [2500] * 5, capital=100000
+        )
+
+        assert accepted.tolist() == [False, True, False, True, False]
+        assert heat.calculate_current_heat(100000) == pytest.approx(0.07)
+
+    def test_concurrent_reservations_never_exceed_limit(self):
+        """
+        Test: Concurrent reserve_batch() calls respect the hard limit.
+
+        Given: 8 threads each reserving 20 symbols at 0.5% risk
+        When: All threads run at once
+        Then: Exactly 16 positions accepted (8% / 0.5%), heat == 8%
+        """
+        heat = ConcurrentHeatManager(max_heat=0.08, capacity=4)
+        accepted = []
+
+        def worker(thread_id):
+            symbols = [f"T{thread_id}_{i}" for i in range(20)]
+            accepted.append(heat.reserve_batch(symbols, [500] * 20, 100000).sum())
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sum(accepted) == 16
+        assert heat.get_position_count() == 16
+        assert heat.calculate_current_heat(100000) == pytest.approx(0.08)
+
+    def test_batch_validation(self):
+        """
+        Test: Invalid batches raise ValueError and leave state unchanged.
+        """
+        heat = ConcurrentHeatManager(max_heat=0.08)
+        heat.add_position('SPY', 2000)
+
+        with pytest.raises(ValueError, match="already exists"):
+            heat.add_positions(['QQQ', 'SPY'], [1000, 1000])
+        with pytest.raises(ValueError, match="non-negative"):
+            heat.add_positions(['QQQ'], [-1])
+        with pytest.raises(ValueError, match="not found"):
+            heat.update_position_risks(['QQQ'], [500])
+        with pytest.raises(ValueError, match="same length"):
+            heat.add_positions(['QQQ', 'IWM'], [1000])
+
+        assert heat.get_active_positions() == {'SPY': 2000.0}
+
+    def test_update_rejects_duplicate_symbols(self):
+        """
+        Test: A batch repeating a symbol is rejected and total_risk stays exact.
+        """
+        heat = ConcurrentHeatManager(max_heat=0.08)
+        heat.add_positions(['SPY', 'QQQ'], [1000, 500])
+
+        with pytest.raises(ValueError, match="Duplicate symbols"):
+            heat.update_position_risks(['SPY', 'SPY'], [100, 200])
+
+        assert heat.total_risk == pytest.approx(1500.0)
+        assert heat.get_active_positions() == {'SPY': 1000.0, 'QQQ': 500.0}
+
+    def test_reset_and_invalid_max_heat(self):
+        """
+        Test: reset() clears heat; max_heat range is enforced.
+        """
+        heat = ConcurrentHeatManager(max_heat=0.08)
+        heat.add_positions(['SPY', 'QQQ'], [2000, 2500])
+        heat.reset()
+
+        assert heat.total_risk == 0.0
+        assert heat.get_position_count() == 0
+        with pytest.raises(ValueError):
+            ConcurrentHeatManager(max_heat=0.12)
+
+
 # =============================================================================
 # Integration Test (1 test)
 # =============================================================================
@@ -0,0 +1,119 @@
+"""
+Startup Benchmark for Package Imports
+
+Measures import cost with `python -X importtime` in a fresh interpreter and
+checks:
+- `import strategies, regime` stays within its startup budget
+- Heavy dependencies (vectorbtpro, sklearn, pandas_market_calendars,
+  pydantic) are not loaded until a strategy / model class is accessed
+- Lazy exports resolve on first access
+
+Budgets are wall-clock targets with headroom for slow CI machines; the
+package imports themselves take a few milliseconds once nothing heavy is
+pulled in eagerly.
+
+Run: uv run pytest tests/test_import_time.py -v
+Report: uv run python tests/test_import_time.py "import regime.academic_jump_model"
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Cumulative import time budget per statement (milliseconds)
+IMPORT_BUDGET_MS = {
+    'import strategies, regime': 100,
+    'import regime.academic_jump_model': 1500,
+}
+
+HEAVY_MODULES = ('vectorbtpro', 'sklearn', 'pandas_market_calendars', 'pydantic')
+
+
+def import_profile(statement: str) -> dict:
+    """
+    Run `statement` in a fresh interpreter with -X importtime.
+
+    Args:
+        statement: Python source to execute, e.g. 'import regime'
+
+    Returns:
+        Dictionary mapping module name to cumulative import time (microseconds)
+
+    Raises:
+        RuntimeError: If the statement fails
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=REPO_ROOT, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"'{statement}' failed:\n{proc.stderr[-2000:]}")
+
+    profile = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        profile[name.strip()] = int(cumulative)
+    return profile
+
+
+def total_ms(profile: dict, statement: str) -> float:
+    """Cumulative time of the top-level modules named in an import statement."""
+    names = [n.strip() for n in statement.replace('import ', '', 1).split(',')]
+    return sum(profile.get(n, 0) for n in names) / 1000
+
+
+class TestStartupBudget:
+    """Import time targets"""
+
+    @pytest.mark.parametrize('statement', list(IMPORT_BUDGET_MS))
+    def test_within_budget(self, statement):
+        """Cumulative import time is below the target"""
+        profile = import_profile(statement)
+
+        assert total_ms(profile, statement) < IMPORT_BUDGET_MS[statement]
+
+    @pytest.mark.parametrize('statement', list(IMPORT_BUDGET_MS))
+    def test_heavy_dependencies_deferred(self, statement):
+        """No heavy dependency is imported at package / module load"""
+        profile = import_profile(statement)
+
+        loaded = [m for m in HEAVY_MODULES if m in profile]
+        assert loaded == []
+
+
+class TestLazyExports:
+    """Module-level __getattr__"""
+
+    def test_exports_resolve_on_access(self):
+        """Accessing a lazy export imports and caches it"""
+        import regime
+
+        model_cls = regime.AcademicJumpModel
+
+        assert model_cls.__name__ == 'AcademicJumpModel'
+        assert 'AcademicJumpModel' in vars(regime)
+        assert 'JumpModel' in dir(regime)
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names raise AttributeError, not ImportError"""
+        import strategies
+
+        with pytest.raises(AttributeError):
+            strategies.NotAStrategy
+
+
+if __name__ == '__main__':
+    statement = sys.argv[1] if len(sys.argv) > 1 else 'import strategies, regime'
+    profile = import_profile(statement)
+
+    print(f"{statement}: {total_ms(profile, statement):.1f} ms")
+    print(f"{'Module':<50} {'Cumulative (ms)':>16}")
+    for name, us in sorted(profile.items(), key=lambda item: -item[1])[:20]:
+        print(f"{name:<50} {us / 1000:>16.1f}")
@@ -0,0 +1,96 @@
+"""
+Unit Tests for Monte Carlo Trade Bootstrap
+
+Tests MonteCarloSimulator for:
+- Path statistics matching a direct NumPy recomputation
+- Reproducibility with a seed
+- Block bootstrap keeping consecutive trades together
+- Ruin probability and R-multiple input
+- Feeding paths into RiskManager.evaluate_equity_paths()
+
+Run: uv run pytest tests/test_monte_carlo.py -v
+"""
+
+import pytest
+import numpy as np
+
+from backtesting.monte_carlo import MonteCarloSimulator
+from core.risk_manager import RiskManager
+
+
+@pytest.fixture
+def trade_returns():
+    """100 trades with a small positive edge"""
+    return np.random.default_rng(7).normal(0.004, 0.02, 100)
+
+
+class TestBootstrap:
+    """Path generation and reductions"""
+
+    def test_statistics_match_paths(self, trade_returns):
+        """Final return and max drawdown agree with the stored paths"""
+        result = MonteCarloSimulator(n_paths=500, seed=1).run(
+            trade_returns=trade_returns, initial_capital=1.0, return_paths=True
+        )
+        paths = result['equity_paths']
+        drawdown = 1 - paths / np.maximum.accumulate(paths, axis=0)
+
+        assert paths.shape == (101, 500)
+        np.testing.assert_allclose(result['final_return'], paths[-1] - 1)
+        np.testing.assert_allclose(result['max_drawdown'], drawdown.max(axis=0))
+
+        steps = paths[1:] / paths[:-1] - 1
+        sharpe = steps.mean(axis=0) / steps.std(axis=0, ddof=1)
+        np.testing.assert_allclose(result['sharpe_ratio'], sharpe, rtol=1e-6)
+
+    def test_seed_reproducible(self, trade_returns):
+        """Same seed -> identical distributions"""
+        a = MonteCarloSimulator(n_paths=200, seed=3).run(trade_returns=trade_returns)
+        b = MonteCarloSimulator(n_paths=200, seed=3).run(trade_returns=trade_returns)
+
+        np.testing.assert_array_equal(a['max_drawdown'], b['max_drawdown'])
+
+    def test_block_bootstrap_keeps_runs(self):
+        """With block_size == n trades every path is a rotation of the input"""
+        returns = np.array([0.01, 0.02, -0.03, 0.04])
+        result = MonteCarloSimulator(n_paths=50, block_size=4, seed=0).run(
+            trade_returns=returns, initial_capital=1.0, return_paths=True
+        )
+
+        np.testing.assert_allclose(result['final_return'], np.prod(1 + returns) - 1)
+
+    def test_ruin_and_r_multiples(self):
+        """Losing R-multiples at high risk ruin every path; summary is tabular"""
+        mc = MonteCarloSimulator(n_paths=100, ruin_loss=0.5, seed=0)
+
+        result = mc.run(r_multiples=[-1.0, -1.0, 0.5], risk_pct=0.10, n_trades=50)
+
+        assert result['ruin_probability'] == 1.0
+        assert list(result['summary'].columns) == ['final_return', 'max_drawdown', 'sharpe_ratio']
+
+    def test_invalid_inputs(self, trade_returns):
+        """Ambiguous input and bad settings raise ValueError"""
+        mc = MonteCarloSimulator()
+        with pytest.raises(ValueError, match="exactly one"):
+            mc.run(trade_returns=trade_returns, r_multiples=trade_returns)
+        with pytest.raises(ValueError, match="at least 2"):
+            mc.run(trade_returns=[0.01, np.nan])
+        with pytest.raises(ValueError):
+            MonteCarloSimulator(block_size=0)
+
+
+class TestCircuitBreakerStress:
+    """RiskManager integration"""
+
+    def test_paths_feed_risk_manager(self, trade_returns):
+        """Crossing probabilities agree with the simulated max drawdowns"""
+        mc = MonteCarloSimulator(n_paths=300, seed=5)
+
+        result = mc.stress_test_circuit_breakers(
+            RiskManager(), trade_returns=trade_returns * 3, initial_capital=100000
+        )
+        breakers = result['circuit_breakers']
+
+        assert breakers['drawdown'].shape == (101, 300)
+        expected = (result['max_drawdown'] >= 0.10).mean()
+        assert breakers['crossing_probability'].loc[0.10] == pytest.approx(expected)
@@ -0,0 +1,135 @@
+"""
+Unit Tests for Live Setup Ranking
+
+Tests LiveSetupRanker for:
+- Bounded top-N by score (matches a full sort)
+- One candidate per symbol (better setups replace older ones)
+- Session cutoff and new-session expiry
+- Heat checks against PortfolioHeatManager
+- Feeding ORBStreamingEngine-style decisions
+
+Run: uv run pytest tests/test_orb_live_ranking.py -v
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from strategies.orb_live_ranking import LiveSetupRanker
+from utils.portfolio_heat import PortfolioHeatManager
+
+
+TS = pd.Timestamp('2024-03-01 10:00', tz='America/New_York')
+
+
+def decision(long_entry=False, short_entry=False, stop=2.0):
+    """Minimal on_bar()-style decision dict"""
+    return {'long_entry': long_entry, 'short_entry': short_entry, 'stop_distance': stop}
+
+
+class TestRanking:
+    """Bounded heap behaviour"""
+
+    def test_keeps_best_n_of_random_stream(self):
+        """Top N after a random stream equals the top N of a full sort"""
+        rng = np.random.default_rng(1)
+        scores = rng.uniform(0, 100, 500)
+        ranker = LiveSetupRanker(max_setups=7)
+
+        for i, score in enumerate(scores):
+            ranker.add_candidate(f"S{i}", TS, score, entry_price=50.0, stop_distance=1.0)
+
+        expected = sorted(scores, reverse=True)[:7]
+        assert [s['score'] for s in ranker.top_n()] == pytest.approx(expected)
+        assert len(ranker) == 7
+
+    def test_one_setup_per_symbol(self):
+        """A better setup replaces the symbol's old one; a worse one is ignored"""
+        ranker = LiveSetupRanker(max_setups=2)
+        ranker.add_candidate('NVDA', TS, 50, 100.0, 2.0)
+        ranker.add_candidate('AMD', TS, 60, 100.0, 2.0)
+
+        assert ranker.add_candidate('NVDA', TS, 80, 101.0, 2.0) is True
+        assert ranker.add_candidate('NVDA', TS, 70, 102.0, 2.0) is False
+
+        top = ranker.top_n()
+        assert [(s['symbol'], s['score']) for s in top] == [('NVDA', 80), ('AMD', 60)]
+        assert top[0]['entry_price'] == 101.0
+
+    def test_rejects_weaker_when_full(self):
+        """A full heap rejects candidates at or below its minimum"""
+        ranker = LiveSetupRanker(max_setups=2)
+        ranker.add_candidate('A', TS, 50, 10.0, 1.0)
+        ranker.add_candidate('B', TS, 60, 10.0, 1.0)
+
+        assert ranker.add_candidate('C', TS, 40, 10.0, 1.0) is False
+        assert ranker.add_candidate('D', TS, 55, 10.0, 1.0) is True
+        assert [s['symbol'] for s in ranker.top_n()] == ['B', 'D']
+
+    def test_invalid_stop_ignored(self):
+        """NaN stop (ATR warmup) never enters the ranking"""
+        ranker = LiveSetupRanker()
+        assert ranker.add_candidate('A', TS, 90, 10.0, np.nan) is False
+
+
+class TestSession:
+    """Cutoff and expiry"""
+
+    def test_cutoff_and_new_session(self):
+        """Nothing after the cutoff; the next session starts empty"""
+        ranker = LiveSetupRanker(max_setups=3)
+        ranker.add_candidate('A', TS, 50, 10.0, 1.0)
+
+        late = TS.replace(hour=15, minute=35)
+        assert ranker.add_candidate('B', late, 90, 10.0, 1.0) is False
+        assert ranker.top_n() == []
+
+        next_day = TS + pd.Timedelta(days=1)
+        ranker.add_candidate('C', next_day, 40, 10.0, 1.0)
+        assert [s['symbol'] for s in ranker.top_n()] == ['C']
+
+
+class TestHeatAndDecisions:
+    """Heat checks and streaming decisions"""
+
+    def test_heat_checked_in_rank_order(self):
+        """Setups are accepted greedily until the heat budget is used"""
+        heat_mgr = PortfolioHeatManager(max_heat=0.08)
+        heat_mgr.add_position('SPY', 3000)
+        ranker = LiveSetupRanker(max_setups=5, risk_pct=0.02)
+
+        for symbol, score in [('A', 90), ('B', 80), ('SPY', 75), ('C', 70)]:
+            ranker.add_candidate(symbol, TS, score, entry_price=100.0, stop_distance=5.0)
+
+        top = ranker.top_n(capital=100000, heat_manager=heat_mgr)
+
+        # 3% open + 2% (A) = 5%, +2% (B) = 7%, SPY already open, C would be 9%
+        assert [s['heat_ok'] for s in top] == [True, True, False, False]
+        assert top[0]['risk'] == pytest.approx(2000)
+
+    def test_on_decisions_scores_entries_only(self):
+        """Only entry decisions are scored; short entries keep direction"""
+        ranker = LiveSetupRanker(
+            max_setups=5,
+            score_func=lambda symbol, ts, dec, ohlcv: ohlcv[4] / 1000
+        )
+        bars = {
+            'A': (10, 11, 9, 10.5, 50000),
+            'B': (20, 21, 19, 19.5, 80000),
+            'C': (30, 31, 29, 30.5, 90000),
+        }
+        decisions = {
+            'A': decision(long_entry=True),
+            'B': decision(short_entry=True),
+            'C': decision(),
+        }
+
+        assert ranker.on_decisions(TS, decisions, bars) == 2
+        top = ranker.top_n()
+        assert [(s['symbol'], s['direction']) for s in top] == [('B', 'short'), ('A', 'long')]
+        assert top[1]['entry_price'] == 10.5
+
+    def test_on_decisions_requires_score_func(self):
+        """Missing score_func raises ValueError"""
+        with pytest.raises(ValueError, match="score_func"):
+            LiveSetupRanker().on_decisions(TS, {}, {})
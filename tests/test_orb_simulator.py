@@ -0,0 +1,199 @@
+"""
+Unit Tests for Compiled ORB Simulator
+
+Tests simulate_orb() for:
+- Entry-only sizing (risk-based with capital constraint)
+- Intrabar ATR stops (touch and gap fills)
+- EOD exit signal and forced session-end exit
+- Short trades, conflicting signals, cash accounting
+- Compatibility with trade statistics
+
+Run: uv run pytest tests/test_orb_simulator.py -v
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from strategies.orb_simulator import (
+    simulate_orb,
+    session_end_mask,
+    EXIT_STOP,
+    EXIT_SIGNAL,
+    EXIT_SESSION_END,
+    DIRECTION_SHORT,
+)
+from utils.trade_statistics import compute_trade_statistics
+
+
+def make_bars(closes_by_day, spread=0.5):
+    """Build 5-minute bars from a list of per-day close lists."""
+    index, closes = [], []
+    for day, day_closes in enumerate(closes_by_day):
+        start = pd.Timestamp('2024-01-02 09:30', tz='America/New_York') + pd.Timedelta(days=day)
+        index.extend(pd.date_range(start, periods=len(day_closes), freq='5min'))
+        closes.extend(day_closes)
+
+    close = pd.Series(closes, index=pd.DatetimeIndex(index), dtype=float)
+    return pd.DataFrame({
+        'Open': close, 'High': close + spread, 'Low': close - spread, 'Close': close
+    })
+
+
+def make_signals(data, long_at=(), short_at=(), exit_at=(), stop=2.0):
+    """Signals dict with entries/exits at the given bar positions."""
+    def flags(positions):
+        series = pd.Series(False, index=data.index)
+        series.iloc[list(positions)] = True
+        return series
+
+    return {
+        'long_entries': flags(long_at),
+        'short_entries': flags(short_at),
+        'long_exits': flags(exit_at),
+        'stop_distance': pd.Series(stop, index=data.index),
+    }
+
+
+class TestSizingAndExits:
+    """Entry sizing and exit rules"""
+
+    def test_size_at_entry_with_capital_constraint(self):
+        """Size = min(risk-based, capital-based) at the entry bar"""
+        data = make_bars([[100, 101, 102, 103]])
+        signals = make_signals(data, long_at=[1], stop=2.0)
+
+        trades = simulate_orb(data, signals, init_cash=10000, risk_pct=0.02)['trades']
+
+        # Risk-based 200 / 2 = 100 shares, capital-based 10000 / 101 = 99.01
+        assert trades['size'][0] == pytest.approx(10000 / 101)
+
+    def test_session_end_forces_exit(self):
+        """Open position is flattened on the last bar of the session"""
+        data = make_bars([[100, 101, 102, 103], [103, 104]])
+        signals = make_signals(data, long_at=[1], stop=50.0)
+
+        trades = simulate_orb(data, signals, init_cash=10000, risk_pct=0.02)['trades']
+
+        assert trades['exit_idx'][0] == 3
+        assert trades['exit_type'][0] == EXIT_SESSION_END
+
+    def test_exit_signal_at_close(self):
+        """EOD exit signal exits at the bar close"""
+        data = make_bars([[100, 101, 102, 103]])
+        signals = make_signals(data, long_at=[0], exit_at=[2], stop=50.0)
+
+        trades = simulate_orb(data, signals, init_cash=10000)['trades']
+
+        assert trades['exit_idx'][0] == 2
+        assert trades['exit_price'][0] == pytest.approx(102)
+        assert trades['exit_type'][0] == EXIT_SIGNAL
+
+    def test_stop_touch_fills_at_stop_level(self):
+        """Low touching the stop exits at the stop price"""
+        data = make_bars([[100, 100, 98.4, 100]], spread=0.5)
+        signals = make_signals(data, long_at=[0], stop=2.0)
+
+        trades = simulate_orb(data, signals, init_cash=10000)['trades']
+
+        assert trades['exit_type'][0] == EXIT_STOP
+        assert trades['exit_idx'][0] == 2
+        assert trades['exit_price'][0] == pytest.approx(98.0)
+
+    def test_gap_through_stop_fills_at_open(self):
+        """Open beyond the stop fills at the open, not the stop level"""
+        data = make_bars([[100, 100, 95, 95]])
+        signals = make_signals(data, long_at=[0], stop=2.0)
+
+        trades = simulate_orb(data, signals, init_cash=10000)['trades']
+
+        assert trades['exit_price'][0] == pytest.approx(95.0)
+
+    def test_short_stop_above_entry(self):
+        """Short positions stop out when High reaches entry + stop"""
+        data = make_bars([[100, 100, 101.6, 100]])
+        signals = make_signals(data, short_at=[0], stop=2.0)
+
+        trades = simulate_orb(data, signals, init_cash=10000)['trades']
+
+        assert trades['direction'][0] == DIRECTION_SHORT
+        assert trades['exit_price'][0] == pytest.approx(102.0)
+        assert trades['pnl'][0] < 0
+
+
+class TestSignalHandling:
+    """Ignored and conflicting signals"""
+
+    def test_no_entry_on_exit_bar(self):
+        """Entries on exit bars or the last session bar are ignored"""
+        data = make_bars([[100, 101, 102]])
+        signals = make_signals(data, long_at=[1, 2], exit_at=[1])
+
+        result = simulate_orb(data, signals, init_cash=10000)
+
+        assert len(result['trades']) == 0
+        assert result['final_value'][0] == pytest.approx(10000)
+
+    def test_conflicting_entries_ignored(self):
+        """Simultaneous long and short entries cancel out"""
+        data = make_bars([[100, 101, 102]])
+        signals = make_signals(data, long_at=[0], short_at=[0])
+
+        assert len(simulate_orb(data, signals)['trades']) == 0
+
+    def test_nan_stop_skips_entry(self):
+        """No entry while the ATR stop is still warming up"""
+        data = make_bars([[100, 101, 102]])
+        signals = make_signals(data, long_at=[0], stop=np.nan)
+
+        assert len(simulate_orb(data, signals)['trades']) == 0
+
+
+class TestAccounting:
+    """Cash, fees and downstream compatibility"""
+
+    def test_final_value_equals_cash_plus_pnl(self):
+        """Final value = initial cash + sum of trade PnL (fees included)"""
+        data = make_bars([[100, 101, 99, 103], [103, 101, 104, 106]])
+        signals = make_signals(data, long_at=[0, 4], stop=5.0)
+
+        result = simulate_orb(
+            data, signals, init_cash=10000, risk_pct=0.02, fees=0.001, slippage=0.001
+        )
+
+        assert len(result['trades']) == 2
+        assert result['final_value'][0] == pytest.approx(10000 + result['trades']['pnl'].sum())
+        assert (result['trades']['entry_fees'] > 0).all()
+
+    def test_multi_column_independent(self):
+        """Each column is simulated with its own cash"""
+        data = make_bars([[100, 101, 102, 103]])
+        wide = {field: pd.concat([data[field], data[field]], axis=1, keys=['A', 'B'])
+                for field in data.columns}
+        signals = make_signals(data, long_at=[1])
+        wide_signals = {key: pd.concat([value, value * 0], axis=1, keys=['A', 'B'])
+                        for key, value in signals.items()}
+        wide_signals['stop_distance'] = pd.concat(
+            [signals['stop_distance']] * 2, axis=1, keys=['A', 'B']
+        )
+
+        result = simulate_orb(wide, wide_signals, init_cash=[10000, 5000])
+
+        assert list(result['trades']['col']) == [0]
+        assert result['final_value'][1] == pytest.approx(5000)
+
+    def test_records_feed_trade_statistics(self):
+        """Trade records work with compute_trade_statistics()"""
+        data = make_bars([[100, 101, 102, 103], [103, 101, 98, 97]])
+        signals = make_signals(data, long_at=[0, 4], stop=50.0)
+
+        trades = simulate_orb(data, signals, init_cash=10000)['trades']
+        stats = compute_trade_statistics(trades).iloc[0]
+
+        assert stats['total_trades'] == 2
+        assert stats['win_rate'] == pytest.approx(0.5)
+
+    def test_session_end_mask(self):
+        """Last bar of each day is flagged"""
+        data = make_bars([[1, 2, 3], [4, 5]])
+        assert session_end_mask(data.index).tolist() == [False, False, True, False, True]
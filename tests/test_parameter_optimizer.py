@@ -0,0 +1,252 @@
+"""
+Unit Tests for Optuna Parameter Optimizer
+
+Tests ParameterOptimizer for:
+- Search space sampling and storage selection
+- Finding the best region of a known objective
+- Pruning trials on partial walk-forward windows
+- Non-overlapping scoring slices whatever the validator's step
+- Several worker processes sharing one journal-file study
+- Holdout evaluation of the best parameters
+- Per-symbol daily bars (ORB ATR) and daily bars for regime models
+- Causal (online) academic regime labels
+- Signal cache reuse across trials with a real BaseStrategy
+
+Run: uv run pytest tests/test_parameter_optimizer.py -v
+"""
+
+import pytest
+import numpy as np
+import optuna
+import pandas as pd
+
+from pydantic import BaseModel
+
+from backtesting.walk_forward import WalkForwardValidator
+from backtesting.workers import signal_cache_stats
+from optimization.parameter_optimizer import (
+    ParameterOptimizer,
+    make_storage,
+    split_params,
+    suggest_params,
+)
+
+
+class PeakConfig(BaseModel):
+    """Minimal strategy config (StrategyConfig stand-in)"""
+    name: str = "Peak"
+    lookback: int = 5
+
+
+class PeakStrategy:
+    """Duck-typed strategy: 'sharpe' peaks at lookback == 12 in every window"""
+
+    def __init__(self, config):
+        self.config = config
+
+    def validate_config(self):
+        pass
+
+    def validate_parameters(self):
+        if self.config.lookback == 13:
+            raise AssertionError("lookback 13 not allowed")
+        return True
+
+    def backtest_metrics(self, data, initial_capital=10000.0, regime=None):
+        return {
+            'sharpe_ratio': 2.0 - abs(self.config.lookback - 12) * 0.1,
+            'total_return': len(data) / 1e4,
+            'total_trades': 50,
+        }
+
+
+class DailyBarsStrategy(PeakStrategy):
+    """Reads per-symbol daily bars like ORB's data_daily ATR; 'sharpe' = their first close"""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.data_daily = None
+
+    def backtest_metrics(self, data, initial_capital=10000.0, regime=None):
+        metrics = super().backtest_metrics(data, initial_capital, regime)
+        metrics['sharpe_ratio'] = float(self.data_daily['Close'].iloc[0])
+        return metrics
+
+
+@pytest.fixture
+def daily_data():
+    """Three years of daily bars"""
+    index = pd.date_range('2021-01-04', '2023-12-29', freq='B')
+    close = pd.Series(np.linspace(100, 150, len(index)), index=index)
+    return pd.DataFrame({'Open': close, 'High': close, 'Low': close,
+                         'Close': close, 'Volume': 1e6})
+
+
+def make_optimizer(data, **kwargs):
+    kwargs.setdefault('validator', WalkForwardValidator(train_days=365, test_days=90,
+                                                        step_days=90, min_trades=1))
+    return ParameterOptimizer(
+        PeakStrategy(PeakConfig()), data,
+        search_space={'lookback': ('int', 1, 40)}, seed=0, **kwargs
+    )
+
+
+class TestHelpers:
+    """Search space, parameter split and storage"""
+
+    def test_suggest_and_split(self):
+        """Prefixed regime parameters split back out of the trial params"""
+        trial = optuna.trial.FixedTrial({'lookback': 7, 'regime_lambda_penalty': 20.0})
+
+        strategy_params = suggest_params(trial, {'lookback': ('int', 1, 10)})
+        regime_params = suggest_params(
+            trial, {'lambda_penalty': ('float', 1.0, 100.0, 'log')}, prefix='regime_'
+        )
+
+        assert strategy_params == {'lookback': 7}
+        assert split_params(trial.params) == ({'lookback': 7}, {'lambda_penalty': 20.0})
+        assert regime_params == {'lambda_penalty': 20.0}
+
+    def test_storage_selection(self, tmp_path):
+        """.db paths use SQLite, other paths the journal file, None in-memory"""
+        assert make_storage(None) is None
+        assert make_storage(str(tmp_path / 'a.db')).startswith('sqlite:///')
+        assert isinstance(make_storage(str(tmp_path / 'a.log')), optuna.storages.JournalStorage)
+
+    def test_invalid_settings(self, daily_data):
+        """Unknown pruner / regime model and too little data raise ValueError"""
+        with pytest.raises(ValueError, match="pruner"):
+            make_optimizer(daily_data, pruner='fast')
+        with pytest.raises(ValueError, match="regime_model"):
+            make_optimizer(daily_data, regime_model='hmm')
+        with pytest.raises(ValueError, match="No complete window"):
+            make_optimizer(daily_data.iloc[:100])
+        with pytest.raises(ValueError, match="regime_data"):
+            make_optimizer(daily_data, regime_model='jump')
+
+    def test_scoring_slices_do_not_overlap(self, daily_data):
+        """Test slices are laid end to end even with a shorter validator step"""
+        validator = WalkForwardValidator(train_days=365, test_days=90, step_days=30)
+
+        optimizer = make_optimizer(daily_data, validator=validator)
+
+        bounds = [(train_end, test_end) for _, train_end, test_end in optimizer.windows]
+        assert len(bounds) == 8
+        assert all(prev[1] == nxt[0] for prev, nxt in zip(bounds, bounds[1:]))
+        assert validator.step_days == 30
+
+
+class TestOptimization:
+    """Search, pruning, workers and holdout"""
+
+    def test_finds_peak_and_prunes(self, daily_data):
+        """TPE converges near the peak; bad regions are pruned early"""
+        optimizer = make_optimizer(daily_data, pruner='median')
+
+        result = optimizer.optimize(n_trials=40)
+
+        assert abs(result['best_params']['lookback'] - 12) <= 1
+        assert result['n_pruned'] > 0
+        assert result['n_complete'] + result['n_pruned'] + result['n_failed'] == 40
+
+    def test_invalid_parameters_pruned(self, daily_data):
+        """Configs rejected by validate_parameters() never fail the study"""
+        optimizer = make_optimizer(daily_data, pruner='none')
+        optimizer.search_space = {'lookback': ('categorical', [13])}
+
+        result = optimizer.optimize(n_trials=2)
+
+        assert result['n_pruned'] == 2 and result['n_failed'] == 0
+
+    def test_workers_share_journal_study(self, daily_data, tmp_path):
+        """Worker processes add trials to one persistent study"""
+        storage = str(tmp_path / 'study.log')
+        optimizer = make_optimizer(daily_data, storage=storage, study_name='peak')
+
+        optimizer.optimize(n_trials=6, n_workers=2)
+        result = optimizer.optimize(n_trials=4, n_workers=2)
+
+        assert len(result['study'].trials) == 10
+
+    def test_parallel_requires_storage(self, daily_data):
+        """In-memory studies cannot be shared between processes"""
+        with pytest.raises(ValueError, match="storage"):
+            make_optimizer(daily_data).optimize(n_trials=2, n_workers=2)
+
+    def test_holdout_excluded_and_evaluated(self, daily_data):
+        """Holdout bars are not searched and the best params are scored on them"""
+        optimizer = make_optimizer(daily_data, holdout_start='2023-07-01', pruner='none')
+
+        assert optimizer.data['data'].index[-1] < pd.Timestamp('2023-07-01')
+
+        result = optimizer.optimize(n_trials=3)
+        holdout = result['holdout']['data']
+        assert holdout['total_return'] == pytest.approx(len(optimizer.holdout['data']) / 1e4)
+
+    def test_daily_bars_bound_per_symbol(self, daily_data):
+        """Each symbol is scored with its own daily bars; sharing is rejected"""
+        data = {'AAA': daily_data, 'BBB': daily_data * 2}
+        bars = {'AAA': daily_data * 0 + 1.0, 'BBB': daily_data * 0 + 3.0}
+        validator = WalkForwardValidator(train_days=365, test_days=90, step_days=90, min_trades=1)
+
+        optimizer = ParameterOptimizer(
+            DailyBarsStrategy(PeakConfig()), data, search_space={'lookback': ('int', 1, 40)},
+            daily_data=bars, validator=validator, holdout_start='2023-07-01', pruner='none'
+        )
+        result = optimizer.optimize(n_trials=2)
+
+        assert result['best_value'] == pytest.approx(2.0)  # mean of 1.0 and 3.0
+        assert result['holdout']['AAA']['sharpe_ratio'] == 1.0
+        assert result['holdout']['BBB']['sharpe_ratio'] == 3.0
+
+        with pytest.raises(ValueError, match="daily_data"):
+            ParameterOptimizer(DailyBarsStrategy(PeakConfig()), data, validator=validator)
+
+
+class TestRegime:
+    """Regime labels fed to the strategy"""
+
+    def test_academic_labels_are_causal(self, random_walk_bars):
+        """A bar's label is unchanged when later bars are appended"""
+        optimizer = make_optimizer(random_walk_bars, regime_model='academic',
+                                   regime_data=random_walk_bars)
+        params = {'lambda_penalty': 5.0}
+
+        short = optimizer._regime_series(params, random_walk_bars, 0, 250, 400)
+        full = optimizer._regime_series(params, random_walk_bars, 0, 250, len(random_walk_bars))
+
+        pd.testing.assert_series_equal(full.loc[short.index], short)
+        assert full.index[-1] == random_walk_bars.index[-1]
+
+    def test_online_labels_match_online_inference(self, random_walk_bars):
+        """Each label is the last state of a decode over the bars up to it"""
+        from regime.academic_jump_model import AcademicJumpModel
+
+        model = AcademicJumpModel(lambda_penalty=5.0).fit(random_walk_bars.iloc[:250])
+        online = model.predict_online(random_walk_bars)
+
+        for end in (120, 300, 500, len(random_walk_bars)):
+            prefix = random_walk_bars.iloc[:end]
+            assert online.loc[prefix.index[-1]] == model.predict(prefix).iloc[-1]
+
+
+class TestRealStrategy:
+    """BaseStrategy subclass through the signal cache"""
+
+    def test_signal_cache_across_trials(self, crossover_strategy, random_walk_bars):
+        """Repeated parameters reuse every window's signals for every symbol"""
+        data = {'AAA': random_walk_bars, 'BBB': random_walk_bars * 1.5}
+        validator = WalkForwardValidator(train_days=365, test_days=90, step_days=90, min_trades=0)
+        optimizer = ParameterOptimizer(
+            crossover_strategy, data, search_space={'fast_window': ('categorical', [5, 10])},
+            validator=validator, pruner='none', seed=0
+        )
+
+        result = optimizer.optimize(n_trials=6)
+        stats = signal_cache_stats()
+
+        distinct = len({t.params['fast_window'] for t in result['study'].trials})
+        per_trial = len(optimizer.windows) * len(data)
+        assert result['n_complete'] == 6
+        assert stats['misses'] == distinct * per_trial
+        assert stats['hits'] == (6 - distinct) * per_trial
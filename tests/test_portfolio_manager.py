@@ -15,7 +15,7 @@ Test Coverage:
 - Integration with RiskManager
 - Reset functionality
 
-Total: 18 tests
+Total: 22 tests
 """
 
 import pytest
@@ -419,6 +419,32 @@ class TestCircuitBreakers:
         if triggers_20pct:
             assert results['trading_halted'] is True
 
+    def test_trading_halted_follows_custom_ladder(
+        self,
+        mock_strategy,
+        mock_data_drawdown,
+        heat_manager
+    ):
+        """Test trading_halted uses the configured STOP_TRADING level, not 20%."""
+        ladder = {0.04: 'WARNING', 0.07: 'REDUCE_SIZE', 0.10: 'STOP_TRADING'}
+        pm = PortfolioManager(
+            strategies=[mock_strategy],
+            capital=10000,
+            heat_manager=heat_manager,
+            risk_manager=RiskManager(drawdown_thresholds=ladder)
+        )
+
+        results = pm.run_single_strategy_with_gates(
+            strategy=mock_strategy,
+            data=mock_data_drawdown,
+            initial_capital=10000
+        )
+
+        # Half the capital through a ~27% crash: ~14% drawdown
+        assert -0.20 < results['drawdown_max'] < -0.10
+        assert results['trading_halted'] is True
+        assert results['trading_halted'] == (not pm.risk_manager.trading_enabled)
+
 
 # =============================================================================
 # Status Reporting Tests
@@ -542,16 +568,198 @@ class TestIntegration:
 # Multi-Strategy Tests
 # =============================================================================
 
+class NamedMockStrategy(MockStrategy):
+    """MockStrategy with configurable name (distinct allocation keys)."""
+
+    def get_strategy_name(self) -> str:
+        return self.config.name
+
+
+class WideStopMockStrategy(NamedMockStrategy):
+    """NamedMockStrategy with 20% stops (~5% heat per position)."""
+
+    def generate_signals(self, data: pd.DataFrame, regime: Optional[str] = None) -> dict:
+        signals = super().generate_signals(data, regime)
+        signals['stop_distance'] = data['Close'] * 0.20
+        return signals
+
+
+class ReentryMockStrategy(NamedMockStrategy):
+    """NamedMockStrategy with a second entry at bar 10 carrying a 10x wider stop."""
+
+    def generate_signals(self, data: pd.DataFrame, regime: Optional[str] = None) -> dict:
+        signals = super().generate_signals(data, regime)
+        signals['long_entries'].iloc[10] = True  # Ignored by VBT: already long
+        signals['stop_distance'] = signals['stop_distance'].where(
+            data.index < data.index[10], data['Close'] * 0.20
+        )
+        return signals
+
+
 class TestMultiStrategy:
-    """Test multi-strategy functionality (Phase 5 stub)."""
+    """Test multi-strategy cash-sharing backtest (Phase 5)."""
+
+    def test_shared_cash_single_equity_curve(
+        self,
+        mock_data_profitable,
+        heat_manager,
+        risk_manager
+    ):
+        """Test strategies run in one grouped simulation with shared cash."""
+        strategies = [
+            NamedMockStrategy(StrategyConfig(name="Alpha")),
+            NamedMockStrategy(StrategyConfig(name="Beta")),
+        ]
+        pm = PortfolioManager(
+            strategies=strategies,
+            capital=20000,
+            heat_manager=heat_manager,
+            risk_manager=risk_manager
+        )
+
+        results = pm.run_multi_strategy_backtest(
+            data_dict={
+                'Alpha': mock_data_profitable,
+                'Beta': {'X': mock_data_profitable, 'Y': mock_data_profitable * 1.5},
+            },
+            max_workers=1
+        )
+
+        equity = results['equity_curve']
+        assert isinstance(equity, pd.Series)  # One group -> one equity curve
+        assert equity.iloc[0] <= 20000
+        assert results['portfolio'].wrapper.shape_2d[1] == 3  # Alpha + Beta:X + Beta:Y
+        assert results['capital_allocation'][('Alpha', 'Alpha')] == pytest.approx(10000)
+        assert results['capital_allocation'][('Beta', 'X')] == pytest.approx(5000)
+        assert results['metrics']['total_trades'] == 3
+        assert results['final_equity'] > 20000  # Upward trending data
+
+    def test_heat_and_circuit_breakers_on_combined_equity(
+        self,
+        mock_data_drawdown,
+        heat_manager,
+        risk_manager
+    ):
+        """Test heat series and circuit breakers use combined equity."""
+        strategies = [
+            NamedMockStrategy(StrategyConfig(name="Alpha")),
+            NamedMockStrategy(StrategyConfig(name="Beta")),
+        ]
+        pm = PortfolioManager(
+            strategies=strategies,
+            capital=10000,
+            heat_manager=heat_manager,
+            risk_manager=risk_manager
+        )
+
+        results = pm.run_multi_strategy_backtest(
+            data_dict={'Alpha': mock_data_drawdown, 'Beta': mock_data_drawdown},
+            max_workers=1
+        )
+
+        heat = results['portfolio_heat']
+        assert heat.index.equals(results['equity_curve'].index)
+        assert (heat >= 0).all()
+        assert results['max_heat'] > 0  # Positions open with 2% stops
+        assert len(results['circuit_breaker_triggers']) > 0
+        assert pm.get_portfolio_status()['current_equity'] == pytest.approx(
+            results['final_equity']
+        )
+
+    def test_process_pool_matches_in_process(self, mock_data_profitable):
+        """Test signal building in worker processes gives the in-process result."""
+        data_dict = {
+            'Alpha': mock_data_profitable,
+            'Beta': {'X': mock_data_profitable, 'Y': mock_data_profitable * 1.5},
+        }
+
+        results = {}
+        for max_workers in (1, 2):
+            pm = PortfolioManager(
+                strategies=[
+                    NamedMockStrategy(StrategyConfig(name="Alpha")),
+                    NamedMockStrategy(StrategyConfig(name="Beta")),
+                ],
+                capital=20000,
+                heat_manager=PortfolioHeatManager(max_heat=0.08),
+                risk_manager=RiskManager(max_portfolio_heat=0.08, max_position_risk=0.02)
+            )
+            results[max_workers] = pm.run_multi_strategy_backtest(
+                data_dict=data_dict, max_workers=max_workers
+            )
+
+        serial, parallel = results[1], results[2]
+        pd.testing.assert_series_equal(serial['equity_curve'], parallel['equity_curve'])
+        pd.testing.assert_series_equal(serial['portfolio_heat'], parallel['portfolio_heat'])
+        pd.testing.assert_series_equal(pd.Series(serial['metrics']), pd.Series(parallel['metrics']))
+        assert serial['capital_allocation'] == parallel['capital_allocation']
+        assert serial['circuit_breaker_triggers'] == parallel['circuit_breaker_triggers']
+
+    @pytest.mark.parametrize('enforce_heat, expected_trades', [(True, 1), (False, 2)])
+    def test_heat_gate_rejects_entries_over_limit(
+        self,
+        mock_data_profitable,
+        heat_manager,
+        risk_manager,
+        enforce_heat,
+        expected_trades
+    ):
+        """Test in-simulation heat gate rejects the entry that breaches 8%."""
+        strategies = [
+            WideStopMockStrategy(StrategyConfig(name="Alpha")),
+            WideStopMockStrategy(StrategyConfig(name="Beta")),
+        ]
+        pm = PortfolioManager(
+            strategies=strategies,
+            capital=10000,
+            heat_manager=heat_manager,
+            risk_manager=risk_manager
+        )
+
+        # Each position risks ~5% of equity (20% stop on 25% of capital)
+        results = pm.run_multi_strategy_backtest(
+            data_dict={'Alpha': mock_data_profitable, 'Beta': mock_data_profitable},
+            max_workers=1,
+            enforce_heat=enforce_heat
+        )
+
+        assert results['metrics']['total_trades'] == expected_trades
+        assert results['rejected_entries'].sum() == 2 - expected_trades
+
+    def test_heat_uses_stop_of_actual_entry(
+        self,
+        mock_data_profitable,
+        heat_manager,
+        risk_manager
+    ):
+        """Test an entry ignored while in a position doesn't replace the open stop."""
+        pm = PortfolioManager(
+            strategies=[ReentryMockStrategy(StrategyConfig(name="Alpha"))],
+            capital=10000,
+            heat_manager=heat_manager,
+            risk_manager=risk_manager
+        )
+
+        results = pm.run_multi_strategy_backtest(
+            data_dict={'Alpha': mock_data_profitable},
+            max_workers=1
+        )
+
+        # Risk stays at the 2% stop taken on bar 0 (~1% heat), not the 20% one
+        entry_stop = mock_data_profitable['Close'].iloc[0] * 0.02
+        assets = results['portfolio'].assets.iloc[:, 0].abs()
+        expected = assets * entry_stop / results['equity_curve']
+        assert results['metrics']['total_trades'] == 1
+        np.testing.assert_allclose(results['portfolio_heat'].to_numpy(), expected.to_numpy())
+        assert results['heat_limit_bars'] == 0
 
-    def test_multi_strategy_not_implemented(
+    def test_missing_strategy_data_raises(
         self,
         mock_strategy,
         heat_manager,
         risk_manager
     ):
-        """Test multi-strategy backtest raises NotImplementedError."""
+        """Test data_dict must contain every strategy."""
         pm = PortfolioManager(
             strategies=[mock_strategy],
             capital=10000,
@@ -559,9 +767,9 @@ class TestMultiStrategy:
             risk_manager=risk_manager
         )
 
-        with pytest.raises(NotImplementedError, match="Phase 5 feature"):
+        with pytest.raises(ValueError, match="no data for strategy"):
             pm.run_multi_strategy_backtest(
-                data_dict={'MockStrategy': pd.DataFrame()},
+                data_dict={'Other': pd.DataFrame()},
                 initial_capital=10000
             )
 
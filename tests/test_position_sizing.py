@@ -6,12 +6,17 @@ Tests the ATR-based position sizing function for:
 - Capital constraint enforcement
 - Edge case handling
 - VectorBT Pro compatibility (vectorization, index alignment)
+- Compiled 2-D panel path (parity with the Series version)
 """
 
 import pytest
 import numpy as np
 import pandas as pd
-from utils.position_sizing import calculate_position_size_atr, validate_position_size
+from utils.position_sizing import (
+    calculate_position_size_atr,
+    calculate_position_size_atr_panel,
+    validate_position_size,
+)
 
 
 class TestATRPositionSizingMathematics:
@@ -330,5 +335,68 @@ class TestRealWorldScenarios:
         assert mean_risk == pytest.approx(risk_pct, abs=0.005)
 
 
+class TestPanelSizing:
+    """Test compiled 2-D sizing against the Series version"""
+
+    @pytest.fixture
+    def panel(self):
+        """Close/ATR panel with zero, NaN and non-positive values"""
+        rng = np.random.default_rng(3)
+        index = pd.date_range('2024-01-02', periods=200, freq='5min')
+        columns = ['NVDA', 'AMD', 'TSLA', 'SPY']
+        close = pd.DataFrame(rng.uniform(20, 500, (200, 4)), index=index, columns=columns)
+        atr = pd.DataFrame(rng.uniform(0.1, 15, (200, 4)), index=index, columns=columns)
+
+        atr.iloc[:5, 0] = np.nan        # warmup -> backfill
+        atr.iloc[50:60, 1] = 0.0        # zeros -> forward fill
+        atr['SPY'] = np.nan             # no ATR at all -> 1.0
+        close.iloc[10, 2] = -5.0        # bad price
+        close.iloc[11, 2] = np.nan
+        return close, atr
+
+    def test_matches_series_version(self, panel):
+        """Every column matches calculate_position_size_atr()"""
+        close, atr = panel
+        multiplier = np.array([1.0, 0.5, 1.0, 0.0])
+
+        sizes, risks, constrained = calculate_position_size_atr_panel(
+            10000, close, atr, atr_multiplier=2.5, risk_pct=0.02,
+            risk_multiplier=multiplier
+        )
+
+        for col, mult in zip(close.columns, multiplier):
+            exp_size, exp_risk, exp_constrained = calculate_position_size_atr(
+                10000, close[col], atr[col], 2.5, 0.02 * mult
+            )
+            np.testing.assert_allclose(sizes[col], exp_size, rtol=1e-12)
+            np.testing.assert_allclose(risks[col], exp_risk, rtol=1e-12, atol=1e-15)
+            assert (constrained[col] == exp_constrained).all()
+
+    def test_preallocated_outputs_reused(self, panel):
+        """Outputs are written into the provided buffers"""
+        close, atr = panel
+        shape = close.shape
+        out = (np.empty(shape), np.empty(shape), np.empty(shape, dtype=bool))
+
+        result = calculate_position_size_atr_panel(
+            np.array([10000, 20000, 30000, 40000]), close.to_numpy(), atr.to_numpy(), out=out
+        )
+
+        assert all(r is o for r, o in zip(result, out))
+        value = np.nan_to_num(out[0] * close.to_numpy())
+        assert (value <= np.array([10000, 20000, 30000, 40000]) + 1e-6).all()
+
+    def test_invalid_shapes_rejected(self, panel):
+        """Misaligned inputs or bad buffers raise ValueError"""
+        close, atr = panel
+
+        with pytest.raises(ValueError, match="aligned"):
+            calculate_position_size_atr_panel(10000, close, atr.iloc[:-1])
+        with pytest.raises(ValueError, match="out must be"):
+            calculate_position_size_atr_panel(
+                10000, close, atr, out=(np.empty(3), np.empty(3), np.empty(3))
+            )
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,188 @@
+"""
+Unit Tests for Combinatorial Purged Cross-Validation
+
+Tests CombinatorialPurgedCV for:
+- Split and path counts, group boundaries
+- Purging and embargo against a brute-force reference
+- sklearn-style int index arrays
+- Parameter selection on train segments, evaluation per test group
+- Process-pool execution matching in-process results
+- Signal cache reuse with a real BaseStrategy
+- Backtest path assembly and summary
+
+Run: uv run pytest tests/test_purged_cv.py -v
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from pydantic import BaseModel
+
+from backtesting.purged_cv import CombinatorialPurgedCV
+from backtesting.workers import signal_cache_stats
+
+
+class SlopeConfig(BaseModel):
+    """Minimal strategy config (StrategyConfig stand-in)"""
+    name: str = "Slope"
+    lookback: int = 5
+
+
+class SlopeStrategy:
+    """Duck-typed strategy: 'sharpe' = first close / 100 - distance from lookback 10"""
+
+    def __init__(self, config):
+        self.config = config
+
+    def validate_config(self):
+        pass
+
+    def validate_parameters(self):
+        return True
+
+    def backtest_metrics(self, data, initial_capital=10000.0):
+        if data['Close'].iloc[0] < 0:
+            raise RuntimeError("bad data")
+        sharpe = data['Close'].iloc[0] / 100 - abs(self.config.lookback - 10) * 0.1
+        return {'sharpe_ratio': sharpe, 'total_return': sharpe / 10,
+                'total_trades': len(data) // 5}
+
+
+@pytest.fixture
+def data():
+    """120 daily bars with close = 100 + position"""
+    index = pd.date_range('2023-01-02', periods=120, freq='B')
+    close = 100.0 + np.arange(120)
+    return pd.DataFrame({'Open': close, 'High': close, 'Low': close,
+                         'Close': close, 'Volume': 1e6}, index=index)
+
+
+def brute_force_train(n_bars, test_groups, bounds, label_end, embargo):
+    """Reference: bar i trains iff outside test, no label overlap, not embargoed"""
+    test = np.zeros(n_bars, dtype=bool)
+    for g in test_groups:
+        test[bounds[g]:bounds[g + 1]] = True
+    keep = []
+    for i in range(n_bars):
+        if test[i]:
+            continue
+        overlaps = test[i:label_end[i] + 1].any()
+        embargoed = any(test[max(i - e, 0)] and not test[i] for e in range(1, embargo + 1)
+                        if i - e >= 0 and test[i - e])
+        if not overlaps and not embargoed:
+            keep.append(i)
+    return np.array(keep, dtype=np.int64)
+
+
+class TestFolds:
+    """Fold generation"""
+
+    def test_counts_and_bounds(self):
+        """C(N, k) splits, C(N-1, k-1) paths, groups cover every bar"""
+        cv = CombinatorialPurgedCV(n_groups=6, n_test_groups=2)
+
+        assert (cv.n_splits, cv.n_paths) == (15, 5)
+        assert cv.test_combinations().shape == (15, 2)
+        bounds = cv.group_bounds(100)
+        assert bounds[0] == 0 and bounds[-1] == 100 and len(bounds) == 7
+
+    def test_purge_and_embargo_match_brute_force(self):
+        """Train indices equal the per-bar reference for every split"""
+        n_bars = 97
+        cv = CombinatorialPurgedCV(n_groups=5, n_test_groups=2, label_horizon=3,
+                                   embargo_pct=0.04)
+        bounds = cv.group_bounds(n_bars)
+        label_end = np.arange(n_bars) + 3
+        embargo = int(np.ceil(0.04 * n_bars))
+
+        for (train_idx, test_idx), groups in zip(cv.split(n_bars), cv.test_combinations()):
+            expected = brute_force_train(n_bars, groups, bounds, label_end, embargo)
+            np.testing.assert_array_equal(train_idx, expected)
+            assert train_idx.dtype == np.int64
+            assert len(np.intersect1d(train_idx, test_idx)) == 0
+
+    def test_label_end_array(self):
+        """Irregular label horizons purge exactly the overlapping bars"""
+        cv = CombinatorialPurgedCV(n_groups=4, n_test_groups=1, embargo_pct=0.0)
+        label_end = np.arange(40)
+        label_end[5] = 12   # bar 5's label resolves inside test group 1 [10, 20)
+
+        fold = cv.fold_segments(40, label_end)[1]
+
+        assert fold['test'] == [(10, 20)]
+        assert fold['train'] == [(0, 5), (20, 40)]
+
+    def test_invalid_settings(self):
+        """Inconsistent groups raise ValueError"""
+        with pytest.raises(ValueError):
+            CombinatorialPurgedCV(n_groups=4, n_test_groups=4)
+        with pytest.raises(ValueError):
+            CombinatorialPurgedCV().group_bounds(3)
+
+
+class TestRun:
+    """Strategy evaluation"""
+
+    def test_selects_params_and_builds_paths(self, data):
+        """Best lookback is chosen; each path covers every group once"""
+        cv = CombinatorialPurgedCV(n_groups=6, n_test_groups=2, max_workers=1)
+
+        results = cv.run(SlopeStrategy(SlopeConfig()), data,
+                         param_grid={'lookback': [5, 10, 15]})
+
+        assert len(results) == 15
+        assert results['error'].isna().all()
+        assert (results['param_lookback'] == 10).all()
+
+        paths = cv.backtest_paths(results)
+        assert paths.shape == (5, 6)
+        assert not paths.isna().any().any()
+        # Group g's score depends only on its first close: identical in every path
+        assert (paths.nunique() == 1).all()
+
+        summary = cv.summarize(results)
+        assert summary['splits'] == 15
+        assert summary['prob_non_positive'] == 0.0
+
+    def test_process_pool_matches_in_process(self, data):
+        """Parallel splits give the same table as in-process execution"""
+        grid = {'lookback': [8, 10]}
+        serial = CombinatorialPurgedCV(max_workers=1).run(SlopeStrategy(SlopeConfig()), data, grid)
+        parallel = CombinatorialPurgedCV(max_workers=2).run(SlopeStrategy(SlopeConfig()), data, grid)
+
+        pd.testing.assert_frame_equal(serial, parallel)
+
+    def test_errors_isolated_per_split(self, data):
+        """Splits touching bad bars report errors; the rest succeed"""
+        bad = data.copy()
+        bad.iloc[100:, bad.columns.get_loc('Close')] = -1.0
+        cv = CombinatorialPurgedCV(n_groups=6, n_test_groups=1, max_workers=1)
+
+        results = cv.run(SlopeStrategy(SlopeConfig()), bad)
+
+        assert results['error'].notna().any()
+        assert results['error'].isna().any()
+
+
+class TestRealStrategy:
+    """BaseStrategy subclass through the signal cache"""
+
+    def test_signal_cache_across_splits(self, crossover_strategy, random_walk_bars, tmp_path):
+        """Segments shared by splits run once; a rerun is served from disk"""
+        grid = {'fast_window': [5, 10]}
+
+        def run():
+            cv = CombinatorialPurgedCV(n_groups=6, n_test_groups=2, max_workers=1,
+                                       cache_dir=str(tmp_path))
+            return cv.run(crossover_strategy, random_walk_bars, grid), signal_cache_stats()
+
+        first, cold = run()
+        second, warm = run()
+
+        assert first['error'].isna().all()
+        # Every (params, segment) is simulated once per run (memo), so no memory hits
+        assert cold['misses'] > 0 and cold['hits'] == 0 and cold['disk_hits'] == 0
+        assert warm == {'hits': 0, 'disk_hits': cold['misses'], 'misses': 0}
+        columns = ['split', 'param_fast_window', 'train_sharpe_ratio', 'test_return', 'test_trades']
+        pd.testing.assert_frame_equal(first[columns], second[columns])
@@ -0,0 +1,141 @@
+"""
+Unit Tests for Heat-Budgeted Setup Selection
+
+Tests select_setups() and setup_risk() for:
+- Greedy selection (score order, heat budget, position limit)
+- Exact knapsack selection against brute force
+- Many decision times solved in one call
+- Risk from stop distance and ATR sizing
+
+Run: uv run pytest tests/test_setup_selection.py -v
+"""
+
+from itertools import combinations
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from core.setup_selection import select_setups, setup_risk
+
+
+def make_setups(rows):
+    """Setups frame from (date, symbol, score, risk) tuples."""
+    return pd.DataFrame(rows, columns=['date', 'symbol', 'quality_score', 'risk'])
+
+
+def brute_force_best(scores, risks, budget, max_positions):
+    """Best total score over all subsets within the limits."""
+    best = 0.0
+    for k in range(1, max_positions + 1):
+        for subset in combinations(range(len(scores)), k):
+            if sum(risks[i] for i in subset) <= budget + 1e-9:
+                best = max(best, sum(scores[i] for i in subset))
+    return best
+
+
+class TestGreedySelection:
+    """Score-order selection under heat and position limits"""
+
+    def test_equals_top_n_when_heat_not_binding(self):
+        """Small risks: greedy picks the top max_positions by score"""
+        setups = make_setups([
+            ('d1', 'A', 50, 1000), ('d1', 'B', 80, 1000),
+            ('d1', 'C', 70, 1000), ('d1', 'D', 60, 1000),
+        ])
+
+        mask = select_setups(setups, capital=100000, max_heat=0.08, max_positions=3)
+
+        assert sorted(setups[mask]['symbol']) == ['B', 'C', 'D']
+
+    def test_skips_setup_that_breaks_budget(self):
+        """A setup that would exceed heat is skipped, later ones still fit"""
+        setups = make_setups([
+            ('d1', 'A', 90, 5000), ('d1', 'B', 80, 4000), ('d1', 'C', 70, 2000),
+        ])
+
+        mask = select_setups(setups, capital=100000, max_heat=0.08, max_positions=3)
+
+        assert setups[mask]['symbol'].tolist() == ['A', 'C']
+
+    def test_groups_are_independent(self):
+        """Each date has its own budget; result aligns to the input index"""
+        setups = make_setups([
+            ('d2', 'A', 90, 6000), ('d1', 'A', 90, 6000),
+            ('d2', 'B', 80, 6000), ('d1', 'B', 10, 1000),
+        ]).set_index(pd.Index([10, 11, 12, 13]))
+
+        mask = select_setups(setups, capital=100000, max_heat=0.08, max_positions=2)
+
+        assert mask.index.equals(setups.index)
+        assert mask.tolist() == [True, True, False, True]
+
+    def test_nan_risk_never_selected(self):
+        """Setups without a valid risk are not selectable"""
+        setups = make_setups([('d1', 'A', 90, np.nan), ('d1', 'B', 10, 1000)])
+
+        mask = select_setups(setups, capital=100000)
+
+        assert mask.tolist() == [False, True]
+
+
+class TestKnapsackSelection:
+    """Exact best-subset selection"""
+
+    def test_beats_greedy_when_wide_stop_crowds_out(self):
+        """Two good setups beat one slightly better wide-stop setup"""
+        setups = make_setups([
+            ('d1', 'WIDE', 90, 7000), ('d1', 'B', 80, 4000), ('d1', 'C', 75, 4000),
+        ])
+
+        greedy = select_setups(setups, 100000, max_heat=0.08, method='greedy')
+        dp = select_setups(setups, 100000, max_heat=0.08, method='dp')
+
+        assert setups[greedy]['symbol'].tolist() == ['WIDE']
+        assert setups[dp]['symbol'].tolist() == ['B', 'C']
+
+    @pytest.mark.parametrize('seed', range(5))
+    def test_matches_brute_force(self, seed):
+        """DP total score equals brute-force optimum for every day"""
+        rng = np.random.default_rng(seed)
+        rows = [
+            (day, f"S{i}", rng.uniform(10, 100), rng.uniform(500, 5000))
+            for day in range(6) for i in range(rng.integers(1, 9))
+        ]
+        setups = make_setups(rows)
+
+        mask = select_setups(setups, 100000, max_heat=0.08, max_positions=3, method='dp')
+
+        for day, group in setups.groupby('date'):
+            chosen = group[mask[group.index]]
+            assert len(chosen) <= 3
+            assert chosen['risk'].sum() <= 8000 + 1e-6
+            expected = brute_force_best(
+                group['quality_score'].tolist(), group['risk'].tolist(), 8000, 3
+            )
+            # Risk rounding to 1bp can only exclude borderline subsets
+            assert chosen['quality_score'].sum() == pytest.approx(expected, rel=0.05)
+
+    def test_invalid_method(self):
+        """Unknown method raises ValueError"""
+        with pytest.raises(ValueError, match="method"):
+            select_setups(make_setups([('d1', 'A', 1, 1)]), 100000, method='lp')
+
+
+class TestSetupRisk:
+    """Dollar risk per setup"""
+
+    def test_atr_sizing_with_capital_constraint(self):
+        """Risk = stop x min(risk-based, capital-based) size"""
+        setups = pd.DataFrame({'entry_price': [100.0, 100.0], 'stop_distance': [5.0, 1.0]})
+
+        risk = setup_risk(setups, capital=100000, risk_pct=0.02)
+
+        # 2000/5 = 400 shares -> $2,000; 2000/1 = 2000 > 1000 cap -> $1,000
+        assert risk.tolist() == pytest.approx([2000.0, 1000.0])
+
+    def test_explicit_size_column(self):
+        """A 'size' column overrides ATR sizing"""
+        setups = pd.DataFrame({'entry_price': [100.0], 'stop_distance': [2.0], 'size': [50.0]})
+
+        assert setup_risk(setups, capital=100000).iloc[0] == pytest.approx(100.0)
@@ -0,0 +1,131 @@
+"""
+Unit Tests for Signal Cache
+
+Tests the SignalCache used by BaseStrategy.get_signals() for:
+- Data fingerprint stability and sensitivity
+- Cache key sensitivity to config, regime and extras
+- LRU eviction in the memory tier
+- Persistent disk tier
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from pydantic import BaseModel
+
+from utils.signal_cache import SignalCache, fingerprint_data
+
+
+class DummyConfig(BaseModel):
+    """Minimal pydantic config (StrategyConfig stand-in)"""
+    name: str
+    risk_per_trade: float = 0.02
+
+
+@pytest.fixture
+def bars():
+    """Small OHLCV frame with tz-aware index"""
+    index = pd.date_range('2024-01-02 09:30', periods=50, freq='5min', tz='America/New_York')
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, 50))
+    return pd.DataFrame({
+        'Open': close, 'High': close + 1, 'Low': close - 1,
+        'Close': close, 'Volume': rng.integers(1000, 5000, 50)
+    }, index=index)
+
+
+@pytest.fixture
+def signals(bars):
+    """Signals dict like generate_signals() output"""
+    return {
+        'long_entries': bars['Close'] > bars['Open'].shift(1),
+        'long_exits': pd.Series(False, index=bars.index),
+        'stop_distance': bars['Close'] * 0.02,
+    }
+
+
+class TestFingerprint:
+    """Test data fingerprints"""
+
+    def test_equal_data_equal_fingerprint(self, bars):
+        """Copies of the same data share a fingerprint"""
+        assert fingerprint_data(bars) == fingerprint_data(bars.copy())
+
+    def test_value_change_changes_fingerprint(self, bars):
+        """A single changed value produces a new fingerprint"""
+        modified = bars.copy()
+        modified.iloc[25, 3] += 0.01
+        assert fingerprint_data(bars) != fingerprint_data(modified)
+
+    def test_index_change_changes_fingerprint(self, bars):
+        """Shifted index or different timezone produces a new fingerprint"""
+        shifted = bars.copy()
+        shifted.index = shifted.index + pd.Timedelta(minutes=5)
+        utc = bars.tz_convert('UTC')
+
+        assert fingerprint_data(bars) != fingerprint_data(shifted)
+        assert fingerprint_data(bars) != fingerprint_data(utc)
+
+    def test_object_columns_supported(self, bars):
+        """Non-numeric columns are hashed via pandas"""
+        tagged = bars.assign(tag='x')
+        assert fingerprint_data(tagged) == fingerprint_data(tagged.copy())
+        assert fingerprint_data(tagged) != fingerprint_data(bars.assign(tag='y'))
+
+
+class TestSignalCache:
+    """Test cache keys and tiers"""
+
+    def test_key_depends_on_config_and_regime(self, bars):
+        """Config, regime and extras are part of the key"""
+        config = DummyConfig(name="Test")
+        base = SignalCache.make_key(bars, config, 'Mock')
+
+        assert base == SignalCache.make_key(bars, DummyConfig(name="Test"), 'Mock')
+        assert base != SignalCache.make_key(bars, DummyConfig(name="Test", risk_per_trade=0.01), 'Mock')
+        assert base != SignalCache.make_key(bars, config, 'Mock', regime='TREND_BULL')
+        assert base != SignalCache.make_key(bars, config, 'Other')
+        assert base != SignalCache.make_key(bars, config, 'Mock', extra=('daily',))
+
+    def test_lru_eviction(self, signals):
+        """Least recently used entry is evicted first"""
+        cache = SignalCache(max_entries=2)
+        cache.put('a', signals)
+        cache.put('b', signals)
+        cache.get('a')  # 'a' becomes most recent
+        cache.put('c', signals)
+
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert len(cache) == 2
+
+    def test_get_returns_copy_of_dict(self, signals):
+        """Adding keys to a returned dict does not alter the cache"""
+        cache = SignalCache()
+        cache.put('k', signals)
+
+        first = cache.get('k')
+        first['extra'] = None
+
+        assert 'extra' not in cache.get('k')
+        assert cache.hits == 2
+
+    def test_disk_tier_survives_new_instance(self, tmp_path, signals):
+        """Signals written to disk are loaded by a fresh cache"""
+        SignalCache(cache_dir=tmp_path).put('k', signals)
+
+        cache = SignalCache(cache_dir=tmp_path)
+        loaded = cache.get('k')
+
+        assert cache.disk_hits == 1
+        pd.testing.assert_series_equal(loaded['stop_distance'], signals['stop_distance'])
+
+        cache.clear(disk=True)
+        assert cache.get('k') is None
+        assert cache.misses == 1
+
+    def test_invalid_max_entries(self):
+        """max_entries must be positive"""
+        with pytest.raises(ValueError):
+            SignalCache(max_entries=0)
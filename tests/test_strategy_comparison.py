@@ -0,0 +1,153 @@
+"""
+Unit Tests for Strategy Comparison
+
+Tests comparison.strategy_comparison for:
+- Vectorized metric table against per-column reference values
+- Probabilistic / deflated Sharpe ratios
+- Holm and Benjamini-Hochberg p-value adjustment
+- Paired bootstrap Sharpe-difference test (significance, determinism,
+  pairing on common periods only)
+- One-call compare_strategies()
+
+Run: uv run pytest tests/test_strategy_comparison.py -v
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from comparison.strategy_comparison import (
+    adjust_pvalues,
+    bootstrap_sharpe_test,
+    compare_strategies,
+    deflated_sharpe_ratio,
+    metric_table,
+    probabilistic_sharpe_ratio,
+)
+
+
+@pytest.fixture
+def returns():
+    """Four daily return streams over 3 years; 'edge' has a strong drift"""
+    rng = np.random.default_rng(7)
+    index = pd.date_range('2021-01-04', periods=756, freq='B')
+    frame = pd.DataFrame(rng.normal(0.0, 0.01, (756, 4)), index=index,
+                         columns=['base', 'noise_a', 'noise_b', 'edge'])
+    frame['edge'] += 0.004
+    return frame
+
+
+class TestMetricTable:
+    """Vectorized metrics"""
+
+    def test_matches_per_column_reference(self, returns):
+        """Sharpe, total return and drawdown equal a straightforward loop"""
+        table = metric_table(returns)
+
+        for name, r in returns.items():
+            equity = (1 + r).cumprod()
+            assert table.loc[name, 'sharpe_ratio'] == pytest.approx(
+                r.mean() / r.std() * np.sqrt(252))
+            assert table.loc[name, 'total_return'] == pytest.approx(equity.iloc[-1] - 1)
+            assert table.loc[name, 'max_drawdown'] == pytest.approx(
+                (1 - equity / equity.cummax()).max())
+            assert table.loc[name, 'skew'] == pytest.approx(r.skew(), abs=0.01)
+
+    def test_dict_input_with_missing_bars(self, returns):
+        """Dict of Series aligns on the union index; NaN bars are skipped"""
+        table = metric_table({'full': returns['base'], 'late': returns['edge'].iloc[100:]})
+
+        assert table.loc['full', 'n_obs'] == 756
+        assert table.loc['late', 'n_obs'] == 656
+
+    def test_empty_input_raises(self):
+        """No variants raises ValueError"""
+        with pytest.raises(ValueError):
+            metric_table({})
+
+
+class TestSharpeAdjustments:
+    """PSR, DSR and multiple-testing corrections"""
+
+    def test_psr_and_dsr(self):
+        """DSR <= PSR and falls as more trials are assumed"""
+        psr = probabilistic_sharpe_ratio(0.1, 500)
+        few = deflated_sharpe_ratio(0.1, 500, n_trials=2, sharpe_std=0.05)
+        many = deflated_sharpe_ratio(0.1, 500, n_trials=1000, sharpe_std=0.05)
+
+        assert psr > 0.98
+        assert many[0] < few[0] <= psr
+
+    def test_adjust_pvalues(self):
+        """Holm and BH match hand-computed values; NaN passes through"""
+        p = np.array([0.01, 0.04, np.nan, 0.03, 0.2])
+
+        np.testing.assert_allclose(adjust_pvalues(p, 'holm'), [0.04, 0.09, np.nan, 0.09, 0.2])
+        np.testing.assert_allclose(adjust_pvalues(p, 'bh'),
+                                   [0.04, 0.0533333, np.nan, 0.0533333, 0.2], rtol=1e-5)
+        with pytest.raises(ValueError):
+            adjust_pvalues(p, 'bonferroni')
+
+
+class TestBootstrap:
+    """Sharpe-difference test"""
+
+    def test_detects_edge_only(self, returns):
+        """The drifted stream beats base after Holm adjustment"""
+        test = bootstrap_sharpe_test(returns, benchmark='base', n_boot=2000, seed=1)
+
+        assert test.loc['edge', 'p_value_holm'] < 0.01
+        assert test.loc['edge', 'ci_low'] > 0
+        assert np.isnan(test.loc['base', 'p_value'])
+        assert test.loc['base', 'sharpe_diff'] == 0.0
+
+    def test_deterministic_across_workers(self, returns):
+        """Same seed gives identical results in-process and in a pool"""
+        serial = bootstrap_sharpe_test(returns, n_boot=600, chunk_size=200, seed=3, max_workers=1)
+        parallel = bootstrap_sharpe_test(returns, n_boot=600, chunk_size=200, seed=3, max_workers=2)
+
+        pd.testing.assert_frame_equal(serial, parallel)
+
+    def test_pairs_on_common_rows(self, returns):
+        """A late-starting stream is tested only on the rows it shares with the benchmark"""
+        frame = returns.copy()
+        frame['late'] = frame['edge'].where(frame.index >= frame.index[300])
+
+        test = bootstrap_sharpe_test(frame, benchmark='base', n_boot=500, seed=2)
+        common = bootstrap_sharpe_test(frame[['base', 'late']].iloc[300:],
+                                       benchmark='base', n_boot=500, seed=2)
+
+        assert test.loc['late', 'n_paired'] == 456
+        assert test.loc['noise_a', 'n_paired'] == 756
+        pd.testing.assert_series_equal(test.loc['late'], common.loc['late'])
+        late = frame.iloc[300:]
+        expected = (late['late'].mean() / late['late'].std()
+                    - late['base'].mean() / late['base'].std()) * np.sqrt(252)
+        assert test.loc['late', 'sharpe_diff'] == pytest.approx(expected)
+
+    def test_disjoint_periods_raise(self, returns):
+        """In-sample vs out-of-sample streams have no rows to pair"""
+        streams = {'IS': returns['base'].iloc[:500], 'OOS': returns['edge'].iloc[500:]}
+
+        with pytest.raises(ValueError, match="OOS"):
+            bootstrap_sharpe_test(streams, benchmark='IS', n_boot=10)
+
+    def test_unknown_benchmark_raises(self, returns):
+        """Benchmark must be a column"""
+        with pytest.raises(ValueError, match="benchmark"):
+            bootstrap_sharpe_test(returns, benchmark='missing', n_boot=10)
+
+
+class TestCompareStrategies:
+    """One-call comparison"""
+
+    def test_combined_table(self, returns):
+        """Metrics, DSR and bootstrap columns for every variant, best first"""
+        table = compare_strategies(returns, benchmark='base', n_boot=500, seed=0)
+
+        assert list(table.index[:1]) == ['edge']
+        assert {'sharpe_ratio', 'psr', 'deflated_sharpe', 'p_value_bh'} <= set(table.columns)
+        assert table['deflated_sharpe'].le(table['psr'] + 1e-12).all()
+
+        no_boot = compare_strategies(returns, n_boot=0)
+        assert 'p_value' not in no_boot.columns
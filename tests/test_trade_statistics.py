@@ -0,0 +1,162 @@
+"""
+Unit Tests for Single-Pass Trade Statistics
+
+Tests the trade statistics kernel for:
+- Agreement with straightforward per-metric NumPy calculations
+- Multi-column output in one call
+- Edge cases (no trades, no losers, NaN PnL)
+- R-multiples from stop distances
+- Breakeven cost interpolation
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from utils.trade_statistics import (
+    TRADE_STAT_FIELDS,
+    breakeven_cost,
+    compute_trade_statistics,
+    trade_risk_from_stops,
+)
+
+
+TRADE_DTYPE = np.dtype([
+    ('col', np.int64),
+    ('size', np.float64),
+    ('entry_idx', np.int64),
+    ('pnl', np.float64),
+    ('return', np.float64),
+])
+
+
+def make_records(pnl, returns, cols=None, sizes=None, entry_idx=None):
+    """Build structured trade records like pf.trades.records_arr."""
+    n = len(pnl)
+    records = np.zeros(n, dtype=TRADE_DTYPE)
+    records['pnl'] = pnl
+    records['return'] = returns
+    records['col'] = cols if cols is not None else 0
+    records['size'] = sizes if sizes is not None else 1.0
+    records['entry_idx'] = entry_idx if entry_idx is not None else np.arange(n)
+    return records
+
+
+class TestTradeStatisticsMathematics:
+    """Test single-pass statistics against per-metric calculations"""
+
+    def test_matches_reference_calculations(self):
+        """All statistics match separate NumPy reductions"""
+        rng = np.random.default_rng(42)
+        pnl = rng.normal(10, 100, 500)
+        returns = pnl / 10000
+
+        stats = compute_trade_statistics(make_records(pnl, returns)).iloc[0]
+
+        winners = pnl > 0
+        losers = pnl < 0
+        win_rate = winners.mean()
+        avg_win = returns[winners].mean()
+        avg_loss = returns[losers].mean()
+
+        assert stats['total_trades'] == 500
+        assert stats['winning_trades'] == winners.sum()
+        assert stats['losing_trades'] == losers.sum()
+        assert stats['win_rate'] == pytest.approx(win_rate)
+        assert stats['profit_factor'] == pytest.approx(pnl[winners].sum() / -pnl[losers].sum())
+        assert stats['avg_trade'] == pytest.approx(returns.mean())
+        assert stats['avg_winner'] == pytest.approx(avg_win)
+        assert stats['avg_loser'] == pytest.approx(avg_loss)
+        assert stats['expectancy'] == pytest.approx(
+            win_rate * avg_win - (1 - win_rate) * abs(avg_loss)
+        )
+        assert stats['total_pnl'] == pytest.approx(pnl.sum())
+
+    def test_multiple_columns_in_one_call(self):
+        """Each column gets its own statistics from a single pass"""
+        pnl = np.array([100.0, -50.0, 20.0, -10.0, -30.0])
+        returns = pnl / 1000
+        cols = np.array([0, 0, 1, 1, 1])
+
+        stats = compute_trade_statistics(
+            make_records(pnl, returns, cols=cols),
+            n_cols=3,
+            columns=pd.Index(['A', 'B', 'C'])
+        )
+
+        assert list(stats.columns) == list(TRADE_STAT_FIELDS)
+        assert stats.loc['A', 'win_rate'] == pytest.approx(0.5)
+        assert stats.loc['A', 'profit_factor'] == pytest.approx(2.0)
+        assert stats.loc['B', 'win_rate'] == pytest.approx(1 / 3)
+        assert stats.loc['B', 'profit_factor'] == pytest.approx(0.5)
+        assert stats.loc['C', 'total_trades'] == 0
+
+
+class TestTradeStatisticsEdgeCases:
+    """Test edge cases"""
+
+    def test_no_trades_returns_nan(self):
+        """Trade-based metrics are NaN when there are no trades"""
+        stats = compute_trade_statistics(make_records([], [])).iloc[0]
+
+        assert stats['total_trades'] == 0
+        assert np.isnan(stats['win_rate'])
+        assert np.isnan(stats['profit_factor'])
+        assert np.isnan(stats['avg_trade'])
+        assert np.isnan(stats['avg_winner'])
+
+    def test_no_losers_gives_infinite_profit_factor(self):
+        """Profit factor is inf when gross loss is zero"""
+        stats = compute_trade_statistics(make_records([10.0, 20.0], [0.01, 0.02])).iloc[0]
+
+        assert np.isinf(stats['profit_factor'])
+        assert np.isnan(stats['avg_loser'])
+        assert stats['expectancy'] == pytest.approx(0.015)
+
+    def test_nan_pnl_ignored_in_rates(self):
+        """NaN PnL counts as a trade but not in win rate"""
+        stats = compute_trade_statistics(
+            make_records([10.0, np.nan, -5.0], [0.01, np.nan, -0.005])
+        ).iloc[0]
+
+        assert stats['total_trades'] == 3
+        assert stats['win_rate'] == pytest.approx(0.5)
+
+
+class TestRMultiples:
+    """Test R-multiple calculation from stop distances"""
+
+    def test_risk_from_stops(self):
+        """Risk = |size| x stop distance at entry bar"""
+        records = make_records(
+            [200.0, -100.0], [0.02, -0.01],
+            sizes=[10.0, -5.0], entry_idx=[1, 3]
+        )
+        stop_distance = pd.Series([1.0, 4.0, 1.0, 20.0])
+
+        risk = trade_risk_from_stops(records, stop_distance)
+        np.testing.assert_allclose(risk, [40.0, 100.0])
+
+        stats = compute_trade_statistics(records, risk=risk).iloc[0]
+        assert stats['avg_r_multiple'] == pytest.approx((5.0 + -1.0) / 2)
+
+    def test_risk_length_mismatch_raises(self):
+        """Risk array must align with trade records"""
+        records = make_records([1.0, 2.0], [0.1, 0.2])
+
+        with pytest.raises(ValueError, match="one value per trade record"):
+            compute_trade_statistics(records, risk=np.array([1.0]))
+
+
+class TestBreakevenCost:
+    """Test breakeven cost interpolation for cost sweeps"""
+
+    def test_interpolates_first_crossing(self):
+        """Breakeven is the linear zero crossing between grid points"""
+        cost = breakeven_cost([0.0, 0.001, 0.002, 0.003], [0.004, 0.001, -0.002, -0.005])
+        assert cost == pytest.approx(0.001 + 0.001 / 3)
+
+    def test_no_crossing_is_nan(self):
+        """Edge surviving every level, or negative from the start, gives NaN"""
+        assert np.isnan(breakeven_cost([0.0, 0.001], [0.003, 0.001]))
+        assert np.isnan(breakeven_cost([0.0, 0.001], [-0.001, -0.002]))
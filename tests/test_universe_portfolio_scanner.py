@@ -0,0 +1,80 @@
+"""
+Unit Tests for Universe Scanner Setup Scoring
+
+Tests examples/universe_portfolio_scanner.py for:
+- build_setups_table() scores equal calculate_setup_quality_score() row by row
+- NaN ATR / volume MA (indicator warm-up) score 0 points in both versions
+
+Run: uv run pytest tests/test_universe_portfolio_scanner.py -v
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+pytest.importorskip('vectorbtpro')
+
+from examples.universe_portfolio_scanner import (
+    HIGH_VOLATILITY_UNIVERSE,
+    build_setups_table,
+    calculate_setup_quality_score,
+)
+
+
+@pytest.fixture
+def session():
+    """One session of 5-minute bars with entries early, mid-day and late"""
+    index = pd.date_range('2024-03-01 09:30', '2024-03-01 15:55', freq='5min',
+                          tz='America/New_York')
+    rng = np.random.default_rng(3)
+    close = pd.Series(100 + np.cumsum(rng.normal(0, 0.3, len(index))), index=index)
+    data = pd.DataFrame({'Open': close, 'High': close + 0.2, 'Low': close - 0.2,
+                         'Close': close, 'Volume': rng.uniform(1e5, 5e5, len(index))})
+
+    entries = pd.Series(False, index=index)
+    entries.iloc[[6, 8, 10, 30, 50, 70]] = True
+
+    atr = pd.Series(1.5, index=index)
+    atr.iloc[:9] = np.nan                 # ATR warm-up covers the first two entries
+    volume_ma = pd.Series(2e5, index=index)
+    volume_ma.iloc[[8, 30]] = np.nan      # Volume MA missing on two entries
+
+    signals = {
+        'long_entries': entries,
+        'volume_ma': volume_ma,
+        'atr': atr,
+        'opening_high': pd.Series(close.iloc[:6].max(), index=index),
+        'stop_distance': atr * 2.5,
+    }
+    return data, signals
+
+
+class TestSetupScores:
+    """Vectorized table vs scalar score"""
+
+    def test_table_matches_scalar_row_by_row(self, session):
+        """Every row's quality_score equals the scalar function on its inputs"""
+        data, signals = session
+
+        table = build_setups_table('NVDA', data, signals, HIGH_VOLATILITY_UNIVERSE)
+
+        assert len(table) == 6
+        assert table['atr_pct'].isna().sum() == 2
+        assert table['volume_surge'].isna().sum() == 2
+        for _, row in table.iterrows():
+            expected = calculate_setup_quality_score(
+                'NVDA', row['volume_surge'], row['atr_pct'], row['breakout_conviction'],
+                row['datetime'].time(), HIGH_VOLATILITY_UNIVERSE
+            )
+            assert row['quality_score'] == pytest.approx(expected)
+
+    def test_nan_factors_score_zero(self):
+        """Missing ATR / volume MA add nothing instead of the factor cap"""
+        at_ten = pd.Timestamp('2024-03-01 10:00').time()
+
+        base = calculate_setup_quality_score('NVDA', 1.0, 0.0, 0.0, at_ten, HIGH_VOLATILITY_UNIVERSE)
+        missing = calculate_setup_quality_score(
+            'NVDA', np.nan, np.nan, np.nan, at_ten, HIGH_VOLATILITY_UNIVERSE
+        )
+
+        assert base == missing == 20.0  # Time of day (10) + High priority (10)
@@ -0,0 +1,210 @@
+"""
+Unit Tests for Walk-Forward Validation
+
+Tests WalkForwardValidator for:
+- Calendar window generation and positional slices
+- In-sample parameter selection and out-of-sample evaluation
+- Process-pool execution matching in-process results
+- Per-window error isolation
+- Per-symbol daily bars for strategies with per-symbol state (ORB ATR)
+- Signal cache reuse with a real BaseStrategy
+- Degradation, efficiency and parameter-stability summary
+
+Run: uv run pytest tests/test_walk_forward.py -v
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from pydantic import BaseModel
+
+from backtesting.walk_forward import WalkForwardValidator
+from backtesting.workers import signal_cache_stats
+
+
+class DriftConfig(BaseModel):
+    """Minimal strategy config (StrategyConfig stand-in)"""
+    name: str = "Drift"
+    lookback: int = 5
+
+
+class DriftStrategy:
+    """
+    Duck-typed strategy: 'sharpe' peaks at lookback == 10 in-sample and
+    degrades by a fixed 20% out-of-sample (test windows start with index
+    labels >= 2023-07-01 in the fixture).
+    """
+
+    def __init__(self, config):
+        self.config = config
+
+    def validate_config(self):
+        if self.config.lookback <= 0:
+            raise ValueError("lookback must be positive")
+
+    def validate_parameters(self):
+        return True
+
+    def backtest_metrics(self, data, initial_capital=10000.0):
+        if data['Close'].iloc[0] < 0:
+            raise RuntimeError("bad data")
+        base = 2.0 - abs(self.config.lookback - 10) * 0.1
+        late = data.index[0] >= pd.Timestamp('2023-07-01')
+        sharpe = base * (0.8 if late else 1.0)
+        return {
+            'sharpe_ratio': sharpe,
+            'total_return': sharpe / 10,
+            'total_trades': len(data) // 10,
+        }
+
+
+class DailyBarsStrategy(DriftStrategy):
+    """Reads per-symbol daily bars like ORB's data_daily ATR; reports their first close"""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.data_daily = None
+
+    def backtest_metrics(self, data, initial_capital=10000.0):
+        metrics = super().backtest_metrics(data, initial_capital)
+        metrics['total_return'] = float(self.data_daily['Close'].iloc[0])
+        return metrics
+
+
+@pytest.fixture
+def daily_data():
+    """Two years of daily bars for two symbols"""
+    index = pd.date_range('2022-01-03', '2023-12-29', freq='B')
+    close = pd.Series(np.linspace(100, 150, len(index)), index=index)
+    frame = pd.DataFrame({'Open': close, 'High': close, 'Low': close,
+                          'Close': close, 'Volume': 1e6})
+    return {'AAA': frame, 'BBB': frame * 1.5}
+
+
+class TestWindows:
+    """Window generation"""
+
+    def test_window_count_and_bounds(self, daily_data):
+        """Windows step by step_days and never run past the data"""
+        validator = WalkForwardValidator(train_days=365, test_days=90, step_days=30)
+        index = daily_data['AAA'].index
+        windows = validator.generate_windows(index[0], index[-1])
+
+        assert len(windows) == 10
+        assert all(w[2] <= index[-1] + pd.Timedelta(days=1) for w in windows)
+        assert windows[1][0] - windows[0][0] == pd.Timedelta(days=30)
+
+    def test_positions_are_half_open_slices(self, daily_data):
+        """Train and test slices are adjacent and non-overlapping"""
+        validator = WalkForwardValidator()
+        index = daily_data['AAA'].index
+        window = validator.generate_windows(index[0], index[-1])[0]
+
+        tr0, tr1, te0, te1 = validator.window_positions(index, window)
+
+        assert tr1 == te0
+        assert index[tr1 - 1] < window[1] <= index[te0]
+        assert index[te1 - 1] < window[2]
+
+    def test_invalid_periods(self):
+        """Non-positive periods raise ValueError"""
+        with pytest.raises(ValueError):
+            WalkForwardValidator(step_days=0)
+
+
+class TestAnalysis:
+    """Optimization, evaluation and summary"""
+
+    def test_selects_best_params_and_measures_degradation(self, daily_data):
+        """Best in-sample lookback is chosen; late test windows degrade"""
+        validator = WalkForwardValidator(min_trades=1, max_workers=1, cache_entries=0)
+        strategy = DriftStrategy(DriftConfig())
+
+        results = validator.run_analysis(
+            strategy, daily_data, param_grid={'lookback': [5, 10, 20]}
+        )
+
+        assert len(results) == 20
+        assert results['error'].isna().all()
+        assert (results['param_lookback'] == 10).all()
+        assert results['degradation'].iloc[-1] == pytest.approx(0.2)
+
+        summary = validator.summarize(results)
+        assert summary['parameter_stability'] == {'lookback': 0.0}
+        assert summary['efficiency'] == 1.0
+
+    def test_process_pool_matches_in_process(self, daily_data):
+        """Parallel windows give the same table as in-process execution"""
+        strategy = DriftStrategy(DriftConfig())
+        grid = {'lookback': [8, 10]}
+
+        serial = WalkForwardValidator(min_trades=1, max_workers=1).run_analysis(
+            strategy, daily_data, grid)
+        parallel = WalkForwardValidator(min_trades=1, max_workers=2).run_analysis(
+            strategy, daily_data, grid)
+
+        pd.testing.assert_frame_equal(serial, parallel)
+
+    def test_errors_isolated_per_window(self, daily_data):
+        """A failing symbol reports errors without stopping other symbols"""
+        data = dict(daily_data, BAD=daily_data['AAA'] * -1)
+        validator = WalkForwardValidator(min_trades=1, max_workers=1)
+
+        results = validator.run_analysis(DriftStrategy(DriftConfig()), data)
+
+        assert results.loc[results['symbol'] == 'BAD', 'error'].notna().all()
+        assert results.loc[results['symbol'] != 'BAD', 'error'].isna().all()
+
+    def test_min_trades_filters_candidates(self, daily_data):
+        """Parameter sets below min_trades are flagged when none qualify"""
+        validator = WalkForwardValidator(min_trades=10_000, max_workers=1)
+
+        results = validator.run_analysis(DriftStrategy(DriftConfig()), daily_data['AAA'])
+
+        assert not results['min_trades_met'].any()
+
+    def test_daily_bars_bound_per_symbol(self, daily_data):
+        """Each symbol's windows see that symbol's daily bars, in-process and pooled"""
+        bars = {'AAA': daily_data['AAA'] * 0 + 1.0, 'BBB': daily_data['BBB'] * 0 + 2.0}
+
+        for max_workers in (1, 2):
+            results = WalkForwardValidator(min_trades=1, max_workers=max_workers).run_analysis(
+                DailyBarsStrategy(DriftConfig()), daily_data, daily_data=bars
+            )
+            by_symbol = results.groupby('symbol')['test_return'].unique()
+            assert by_symbol['AAA'].tolist() == [1.0]
+            assert by_symbol['BBB'].tolist() == [2.0]
+
+    def test_shared_daily_bars_rejected(self, daily_data):
+        """Several symbols without daily_data would share one data_daily"""
+        validator = WalkForwardValidator(min_trades=1, max_workers=1)
+
+        with pytest.raises(ValueError, match="daily_data"):
+            validator.run_analysis(DailyBarsStrategy(DriftConfig()), daily_data)
+        with pytest.raises(ValueError, match="BBB"):
+            validator.run_analysis(DailyBarsStrategy(DriftConfig()), daily_data,
+                                   daily_data={'AAA': daily_data['AAA']})
+
+
+class TestRealStrategy:
+    """BaseStrategy subclass through the signal cache"""
+
+    def test_signal_cache_across_windows(self, crossover_strategy, random_walk_bars, tmp_path):
+        """Each window generates signals once per candidate plus once out-of-sample"""
+        grid = {'fast_window': [5, 10]}
+
+        def run():
+            validator = WalkForwardValidator(train_days=365, test_days=90, step_days=90,
+                                             min_trades=0, max_workers=1, cache_dir=str(tmp_path))
+            results = validator.run_analysis(crossover_strategy, random_walk_bars, grid)
+            return results, signal_cache_stats()
+
+        first, cold = run()
+        second, warm = run()
+
+        assert first['error'].isna().all()
+        assert cold == {'hits': 0, 'disk_hits': 0, 'misses': 3 * len(first)}
+        assert warm == {'hits': 0, 'disk_hits': 3 * len(first), 'misses': 0}
+        columns = ['window', 'param_fast_window', 'train_sharpe_ratio', 'test_return', 'test_trades']
+        pd.testing.assert_frame_equal(first[columns], second[columns])
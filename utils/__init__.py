@@ -5,6 +5,6 @@ This package provides position sizing, portfolio heat management, and risk
 control functions for VectorBT Pro based trading strategies.
 """
 
-from .position_sizing import calculate_position_size_atr
+from .position_sizing import calculate_position_size_atr, calculate_position_size_atr_panel
 
-__all__ = ['calculate_position_size_atr']
+__all__ = ['calculate_position_size_atr', 'calculate_position_size_atr_panel']
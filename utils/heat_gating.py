@@ -0,0 +1,191 @@
+"""
+In-Simulation Portfolio Heat Gating for VectorBT Pro
+
+Compiled counterpart of PortfolioHeatManager.can_accept_trade() that runs
+INSIDE vbt.Portfolio.from_signals() via signal_func_nb, across all columns
+of a group, without calling back into Python per order.
+
+How it works (per bar, per group):
+1. Open risk = sum(|position| x stop distance at entry) over the group's
+   columns, computed once per bar from c.last_position
+2. Each entry candidate adds size x stop_distance of new risk
+3. Entry is rejected if (open risk + risk already accepted this bar + new
+   risk) > max_heat x group value (previous bar)
+4. Accepted entries record their stop distance for future open-risk sums
+
+Assumptions:
+- size_type='amount' (size is shares)
+- stop_distance in price units (same as generate_signals())
+- Entries while already in a position are passed through untouched
+  (VBT ignores them without accumulation)
+
+Usage:
+    >>> gated_kwargs, rejected = apply_heat_gate(sim_kwargs, max_heat=0.08)
+    >>> pf = vbt.Portfolio.from_signals(**gated_kwargs)
+    >>> print(f"Rejected entries: {rejected.sum()}")
+
+    PortfolioManager.run_multi_strategy_backtest() applies this gate to the
+    combined cash-sharing simulation by default (enforce_heat=True).
+
+Reference: utils/portfolio_heat.py (PortfolioHeatManager)
+"""
+
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import vectorbtpro as vbt
+from numba import njit
+
+
+@njit
+def heat_gate_signal_func_nb(
+    c,
+    entries,
+    exits,
+    short_entries,
+    short_exits,
+    size,
+    stop_distance,
+    max_heat,
+    entry_stop,
+    open_risk,
+    pending_risk,
+    risk_bar,
+    rejected
+):
+    """
+    signal_func_nb that rejects entries exceeding the group heat limit.
+
+    Args:
+        c: VBT SignalContext
+        entries, exits, short_entries, short_exits: Signal arrays (broadcast)
+        size: Order size in shares (broadcast)
+        stop_distance: Stop distance in price units (broadcast)
+        max_heat: Maximum heat as decimal (e.g., 0.08)
+        entry_stop: Per-column stop distance of the open position (state)
+        open_risk: Per-group open risk at the current bar (state)
+        pending_risk: Per-group risk accepted at the current bar (state)
+        risk_bar: Per-group bar index of open_risk/pending_risk (state)
+        rejected: Per-column count of rejected entries (output)
+
+    Returns:
+        (long_entry, long_exit, short_entry, short_exit)
+    """
+    is_long_entry = vbt.pf_nb.select_nb(c, entries)
+    is_long_exit = vbt.pf_nb.select_nb(c, exits)
+    is_short_entry = vbt.pf_nb.select_nb(c, short_entries)
+    is_short_exit = vbt.pf_nb.select_nb(c, short_exits)
+
+    if not (is_long_entry or is_short_entry) or c.last_position[c.col] != 0:
+        return is_long_entry, is_long_exit, is_short_entry, is_short_exit
+
+    # Open risk once per bar per group (positions don't change mid-row)
+    if risk_bar[c.group] != c.i:
+        total = 0.0
+        for col in range(c.from_col, c.to_col):
+            position = c.last_position[col]
+            if position != 0 and not np.isnan(entry_stop[col]):
+                total += abs(position) * entry_stop[col]
+        open_risk[c.group] = total
+        pending_risk[c.group] = 0.0
+        risk_bar[c.group] = c.i
+
+    # Group equity at previous bar
+    if c.cash_sharing:
+        equity = c.last_value[c.group]
+    else:
+        equity = 0.0
+        for col in range(c.from_col, c.to_col):
+            equity += c.last_value[col]
+
+    stop = vbt.pf_nb.select_nb(c, stop_distance)
+    new_risk = abs(vbt.pf_nb.select_nb(c, size)) * stop
+
+    if np.isnan(new_risk) or equity <= 0 or (
+        open_risk[c.group] + pending_risk[c.group] + new_risk > max_heat * equity
+    ):
+        rejected[c.col] += 1
+        return False, is_long_exit, False, is_short_exit
+
+    pending_risk[c.group] += new_risk
+    entry_stop[c.col] = stop
+    return is_long_entry, is_long_exit, is_short_entry, is_short_exit
+
+
+def apply_heat_gate(
+    sim_kwargs: Dict,
+    max_heat: float,
+    stop_distance: Optional[Union[pd.Series, pd.DataFrame, np.ndarray]] = None
+) -> Tuple[Dict, np.ndarray]:
+    """
+    Turn from_signals() kwargs into a heat-gated simulation.
+
+    Moves entries/exits into broadcast named args and installs
+    heat_gate_signal_func_nb. Everything else (size, sl_stop, fees, grouping,
+    cash sharing) is passed through unchanged.
+
+    Args:
+        sim_kwargs: from_signals() kwargs with 'close', 'entries', 'exits',
+            'size' and optionally 'short_entries', 'short_exits', 'group_by'
+            (None/False = per column, True = one group)
+        max_heat: Maximum portfolio heat as decimal (e.g., 0.08)
+        stop_distance: Stop distance for heat (default: sim_kwargs['sl_stop'])
+
+    Returns:
+        (gated kwargs, rejected) where rejected is a per-column int array
+        filled in during the simulation
+
+    Raises:
+        ValueError: If max_heat is not positive or group_by is a custom grouper
+
+    Example:
+        >>> gated_kwargs, rejected = apply_heat_gate(kwargs, max_heat=0.08)
+        >>> pf = vbt.Portfolio.from_signals(**gated_kwargs)
+    """
+    if max_heat <= 0:
+        raise ValueError(f"max_heat must be positive, got {max_heat}")
+
+    kwargs = dict(sim_kwargs)
+    group_by = kwargs.get('group_by')
+    if group_by not in (None, False, True):
+        raise ValueError("apply_heat_gate supports group_by=None/False/True only")
+
+    close = kwargs['close']
+    n_cols = close.shape[1] if np.ndim(close) == 2 else 1
+    n_groups = 1 if group_by is True else n_cols
+
+    if stop_distance is None:
+        stop_distance = kwargs['sl_stop']
+
+    short_entries = kwargs.pop('short_entries', None)
+    short_exits = kwargs.pop('short_exits', None)
+
+    rejected = np.zeros(n_cols, dtype=np.int64)
+
+    kwargs['signal_func_nb'] = heat_gate_signal_func_nb
+    kwargs['signal_args'] = (
+        vbt.Rep('entries'),
+        vbt.Rep('exits'),
+        vbt.Rep('short_entries'),
+        vbt.Rep('short_exits'),
+        vbt.Rep('gate_size'),
+        vbt.Rep('gate_stop'),
+        max_heat,
+        np.full(n_cols, np.nan),           # entry_stop
+        np.zeros(n_groups),                # open_risk
+        np.zeros(n_groups),                # pending_risk
+        np.full(n_groups, -1, dtype=np.int64),  # risk_bar
+        rejected
+    )
+    kwargs['broadcast_named_args'] = dict(
+        kwargs.get('broadcast_named_args') or {},
+        entries=kwargs.pop('entries'),
+        exits=kwargs.pop('exits'),
+        short_entries=short_entries if short_entries is not None else False,
+        short_exits=short_exits if short_exits is not None else False,
+        gate_size=kwargs['size'],
+        gate_stop=stop_distance
+    )
+
+    return kwargs, rejected
@@ -8,10 +8,19 @@ positions and enforces hard limits to prevent excessive total risk.
 CRITICAL: This is a GATING mechanism that sits BEFORE trade execution.
 Trades are REJECTED if they would exceed the portfolio heat limit.
 
+Classes:
+- PortfolioHeatManager: dict-backed reference implementation (backtests)
+- ConcurrentHeatManager: array-backed, running-total, thread-safe variant
+  for live order routing (batched calls, lock-free heat reads)
+
 Reference: System_Architecture_Reference.md lines 1770-1869
 """
 
-from typing import Dict
+import threading
+from typing import Dict, List, Sequence
+
+import numpy as np
+from numba import njit
 
 
 class PortfolioHeatManager:
@@ -272,3 +281,339 @@ class PortfolioHeatManager:
             when they close naturally.
         """
         self.active_positions.clear()
+
+
+@njit(cache=True)
+def _greedy_accept_nb(total_risk: float, risks: np.ndarray, limit: float) -> np.ndarray:
+    """Accept candidates in order while the running total stays within limit."""
+    accepted = np.zeros(risks.shape[0], dtype=np.bool_)
+    for i in range(risks.shape[0]):
+        risk = risks[i]
+        if risk >= 0 and total_risk + risk <= limit:
+            accepted[i] = True
+            total_risk += risk
+    return accepted
+
+
+class ConcurrentHeatManager:
+    """
+    High-throughput portfolio heat tracker for live order routing.
+
+    Same heat definition and limits as PortfolioHeatManager, but:
+    - Running total of open risk (heat checks are O(1), no sum over positions)
+    - Per-symbol risk in preallocated arrays indexed by symbol id
+    - Batched add/remove/update and batch accept/reject in one call
+    - Thread-safe: writers serialize on a lock; heat reads are lock-free
+      (a single float attribute, replaced atomically after each write batch,
+      so readers see either the state before or after a batch, never a mix)
+    - No printing on rejection
+
+    Use reserve_batch() when concurrent order intents must not overshoot the
+    limit: it checks and adds under the lock in one step. can_accept_batch()
+    is a lock-free snapshot check only.
+
+    Usage:
+        >>> heat = ConcurrentHeatManager(max_heat=0.08, capacity=512)
+        >>> heat.add_positions(['SPY', 'QQQ'], [2000, 2500])
+        >>> heat.calculate_current_heat(100000)  # 0.045
+        >>> accepted = heat.reserve_batch(['AAPL', 'MSFT', 'NVDA'],
+        ...                               [2000, 2000, 2000], capital=100000)
+        >>> accepted  # array([ True, False, False]) - 6.5%, then 8.5% rejected
+    """
+
+    def __init__(self, max_heat: float = 0.08, capacity: int = 256):
+        """
+        Initialize concurrent heat manager.
+
+        Args:
+            max_heat: Maximum portfolio heat as decimal (default 8%)
+                     Range: 0.06 to 0.10 (6% to 10%)
+            capacity: Initial number of symbol slots (grows automatically)
+
+        Raises:
+            ValueError: If max_heat outside professional range
+        """
+        if max_heat < 0.06 or max_heat > 0.10:
+            raise ValueError(
+                f"max_heat must be between 0.06 and 0.10 (6%-10%). "
+                f"Got: {max_heat:.1%}"
+            )
+
+        self.max_heat = max_heat
+        self._lock = threading.Lock()
+        self._symbol_ids: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._risk = np.zeros(max(capacity, 1))
+        self._active = np.zeros(max(capacity, 1), dtype=bool)
+        self._count = 0
+        self._total_risk = 0.0  # Lock-free read path
+
+    # ---- Lock-free reads -------------------------------------------------
+
+    @property
+    def total_risk(self) -> float:
+        """Sum of open position risk in dollars (lock-free)."""
+        return self._total_risk
+
+    def calculate_current_heat(self, capital: float) -> float:
+        """
+        Current portfolio heat as decimal (lock-free, O(1)).
+
+        Args:
+            capital: Current account size
+
+        Returns:
+            Heat as decimal, 0.0 if capital is zero or negative
+        """
+        if capital <= 0:
+            return 0.0
+        return self._total_risk / capital
+
+    def can_accept_trade(self, symbol: str, position_risk: float, capital: float) -> bool:
+        """
+        Snapshot check for a single trade (lock-free, no printing).
+
+        Args:
+            symbol: Symbol for new trade (unused, kept for API parity)
+            position_risk: Dollar risk for new trade
+            capital: Current account size
+
+        Returns:
+            True if heat after the trade stays within max_heat
+        """
+        if capital <= 0:
+            return False
+        return (self._total_risk + position_risk) / capital <= self.max_heat
+
+    def can_accept_batch(
+        self,
+        position_risks: Sequence[float],
+        capital: float,
+        cumulative: bool = True
+    ) -> np.ndarray:
+        """
+        Accept/reject a whole batch of candidates against a heat snapshot.
+
+        Args:
+            position_risks: Dollar risk per candidate (in priority order)
+            capital: Current account size
+            cumulative: If True, accepted candidates consume heat for later
+                ones (greedy in order). If False, each is checked alone.
+
+        Returns:
+            Boolean array, True = accepted
+
+        Note:
+            Lock-free snapshot. Use reserve_batch() to check and add atomically.
+        """
+        risks = np.asarray(position_risks, dtype=np.float64)
+        if capital <= 0:
+            return np.zeros(risks.shape[0], dtype=bool)
+
+        limit = self.max_heat * capital
+        total = self._total_risk
+        if not cumulative:
+            return (risks >= 0) & (total + risks <= limit)
+        return _greedy_accept_nb(total, risks, limit)
+
+    # ---- Writes (serialized) ---------------------------------------------
+
+    def reserve_batch(
+        self,
+        symbols: Sequence[str],
+        position_risks: Sequence[float],
+        capital: float
+    ) -> np.ndarray:
+        """
+        Atomically accept candidates (greedy, in order) and add them.
+
+        Candidates for symbols that already have a position are rejected.
+
+        Args:
+            symbols: Candidate symbols (in priority order)
+            position_risks: Dollar risk per candidate
+            capital: Current account size
+
+        Returns:
+            Boolean array, True = accepted and now tracked
+        """
+        risks = np.asarray(position_risks, dtype=np.float64)
+        if len(symbols) != risks.shape[0]:
+            raise ValueError(
+                f"symbols and position_risks must have the same length. "
+                f"Got {len(symbols)} and {risks.shape[0]}"
+            )
+        if capital <= 0:
+            return np.zeros(risks.shape[0], dtype=bool)
+
+        with self._lock:
+            ids = np.array([self._get_or_create_id(s) for s in symbols], dtype=np.int64)
+            blocked = self._active[ids] if len(ids) else np.zeros(0, dtype=bool)
+
+            # Duplicate symbols inside the batch: only the first can be accepted
+            _, first = np.unique(ids, return_index=True)
+            duplicate = np.ones(len(ids), dtype=bool)
+            duplicate[first] = False
+
+            candidate_risks = np.where(blocked | duplicate, -1.0, risks)
+            accepted = _greedy_accept_nb(
+                self._total_risk, candidate_risks, self.max_heat * capital
+            )
+
+            accepted_ids = ids[accepted]
+            self._risk[accepted_ids] = risks[accepted]
+            self._active[accepted_ids] = True
+            self._count += len(accepted_ids)
+            self._total_risk += float(risks[accepted].sum())
+
+        return accepted
+
+    def add_positions(self, symbols: Sequence[str], risk_amounts: Sequence[float]):
+        """
+        Add new positions (batched).
+
+        Args:
+            symbols: Symbols for new positions
+            risk_amounts: Dollar risk per position
+
+        Raises:
+            ValueError: If any symbol already exists (or repeats in the batch)
+            ValueError: If any risk_amount is negative
+        """
+        risks = self._validate_risks(symbols, risk_amounts, 'risk_amount')
+
+        with self._lock:
+            if len(set(symbols)) != len(symbols):
+                raise ValueError("Duplicate symbols in batch")
+            ids = np.array([self._get_or_create_id(s) for s in symbols], dtype=np.int64)
+            if self._active[ids].any():
+                existing = [s for s, i in zip(symbols, ids) if self._active[i]]
+                raise ValueError(
+                    f"Position for {existing[0]} already exists. "
+                    f"Use update_position_risks() to modify."
+                )
+
+            self._risk[ids] = risks
+            self._active[ids] = True
+            self._count += len(ids)
+            self._total_risk += float(risks.sum())
+
+    def remove_positions(self, symbols: Sequence[str]):
+        """
+        Remove closed positions (batched, unknown symbols ignored).
+
+        Args:
+            symbols: Symbols of closed positions
+        """
+        with self._lock:
+            ids = np.array(
+                sorted({self._symbol_ids[s] for s in symbols if s in self._symbol_ids}),
+                dtype=np.int64
+            )
+            ids = ids[self._active[ids]] if len(ids) else ids
+            if len(ids) == 0:
+                return
+
+            released = float(self._risk[ids].sum())
+            self._risk[ids] = 0.0
+            self._active[ids] = False
+            self._count -= len(ids)
+            # Reset exactly at zero positions so rounding never accumulates
+            self._total_risk = 0.0 if self._count == 0 else self._total_risk - released
+
+    def update_position_risks(self, symbols: Sequence[str], new_risks: Sequence[float]):
+        """
+        Update risk for existing positions (batched, e.g., trailing stops).
+
+        Args:
+            symbols: Symbols of existing positions
+            new_risks: New dollar risk per position
+
+        Raises:
+            ValueError: If any symbol is not an active position (or repeats in the batch)
+            ValueError: If any new_risk is negative
+        """
+        risks = self._validate_risks(symbols, new_risks, 'new_risk')
+
+        with self._lock:
+            if len(set(symbols)) != len(symbols):
+                raise ValueError("Duplicate symbols in batch")
+            missing = [s for s in symbols
+                       if s not in self._symbol_ids or not self._active[self._symbol_ids[s]]]
+            if missing:
+                raise ValueError(
+                    f"Position for {missing[0]} not found. "
+                    f"Use add_positions() first."
+                )
+
+            ids = np.array([self._symbol_ids[s] for s in symbols], dtype=np.int64)
+            delta = float(risks.sum() - self._risk[ids].sum())
+            self._risk[ids] = risks
+            self._total_risk += delta
+
+    # Single-symbol conveniences (PortfolioHeatManager API)
+
+    def add_position(self, symbol: str, risk_amount: float):
+        """Add one position (see add_positions())."""
+        self.add_positions([symbol], [risk_amount])
+
+    def remove_position(self, symbol: str):
+        """Remove one position (see remove_positions())."""
+        self.remove_positions([symbol])
+
+    def update_position_risk(self, symbol: str, new_risk: float):
+        """Update one position (see update_position_risks())."""
+        self.update_position_risks([symbol], [new_risk])
+
+    def get_active_positions(self) -> Dict[str, float]:
+        """Dictionary mapping symbol -> risk_amount for open positions."""
+        with self._lock:
+            active_ids = np.flatnonzero(self._active[:len(self._symbols)])
+            return {self._symbols[i]: float(self._risk[i]) for i in active_ids}
+
+    def get_position_count(self) -> int:
+        """Number of active positions."""
+        return self._count
+
+    def reset(self):
+        """
+        Clear all active positions (symbol ids are kept).
+
+        Warning:
+            Only use this in testing or controlled environments.
+        """
+        with self._lock:
+            self._risk[:] = 0.0
+            self._active[:] = False
+            self._count = 0
+            self._total_risk = 0.0
+
+    # ---- Internals -------------------------------------------------------
+
+    @staticmethod
+    def _validate_risks(symbols: Sequence[str], risks: Sequence[float], name: str) -> np.ndarray:
+        """Check lengths and non-negative risk values."""
+        arr = np.asarray(risks, dtype=np.float64)
+        if len(symbols) != arr.shape[0]:
+            raise ValueError(
+                f"symbols and {name} values must have the same length. "
+                f"Got {len(symbols)} and {arr.shape[0]}"
+            )
+        if (arr < 0).any():
+            raise ValueError(
+                f"{name} must be non-negative. Got: {arr[arr < 0][0]}"
+            )
+        return arr
+
+    def _get_or_create_id(self, symbol: str) -> int:
+        """Symbol id lookup, growing the arrays when full (caller holds lock)."""
+        symbol_id = self._symbol_ids.get(symbol)
+        if symbol_id is None:
+            symbol_id = len(self._symbols)
+            if symbol_id >= self._risk.shape[0]:
+                new_capacity = self._risk.shape[0] * 2
+                self._risk = np.concatenate([self._risk, np.zeros(new_capacity - self._risk.shape[0])])
+                self._active = np.concatenate([self._active, np.zeros(new_capacity - self._active.shape[0], dtype=bool)])
+            self._symbol_ids[symbol] = symbol_id
+            self._symbols.append(symbol)
+        return symbol_id
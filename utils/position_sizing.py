@@ -9,12 +9,18 @@ CRITICAL: All functions are designed for VectorBT Pro compatibility.
 - Output: pandas Series with same index (VectorBT Pro requirement)
 - Operations: Fully vectorized (no loops, VectorBT Pro best practice)
 
+Panel fast path:
+- calculate_position_size_atr_panel(): same formula over aligned 2-D
+  (bars x symbols) arrays in one compiled pass, with a per-symbol risk
+  multiplier and optional preallocated outputs (universe backtests)
+
 Reference: VectorBT Pro Official Documentation
 """
 
 import numpy as np
 import pandas as pd
-from typing import Tuple, Union
+from numba import njit
+from typing import Optional, Tuple, Union
 
 
 def calculate_position_size_atr(
@@ -154,6 +160,172 @@ def calculate_position_size_atr(
     return position_size, actual_risk, constrained
 
 
+@njit(cache=True)
+def position_size_atr_nb(
+    init_cash: np.ndarray,
+    close: np.ndarray,
+    atr: np.ndarray,
+    atr_multiplier: float,
+    risk_pct: float,
+    risk_multiplier: np.ndarray,
+    out_size: np.ndarray,
+    out_risk: np.ndarray,
+    out_constrained: np.ndarray
+):
+    """
+    ATR position sizing over (bars x symbols) arrays in a single pass.
+
+    Same rules as calculate_position_size_atr() with Series input:
+    - Zero/NaN ATR filled forward, then backward, then 1.0
+    - size = min(init_cash x risk_pct x risk_multiplier / stop, init_cash / close)
+    - Size: negative/NaN/Inf -> 0; actual risk: NaN -> 0, clipped to [0, 1]
+
+    Args:
+        init_cash: Capital per column, shape (symbols,)
+        close: Prices, shape (bars, symbols)
+        atr: ATR values, shape (bars, symbols)
+        atr_multiplier: Stop distance in ATR units
+        risk_pct: Target risk per trade as decimal
+        risk_multiplier: Risk scale per column, shape (symbols,)
+            (e.g., RiskManager.risk_multiplier or per-symbol tiers)
+        out_size: Output shares, shape (bars, symbols)
+        out_risk: Output actual risk as decimal, shape (bars, symbols)
+        out_constrained: Output capital-constraint flags, shape (bars, symbols)
+    """
+    n_bars, n_cols = close.shape
+
+    for col in range(n_cols):
+        cash = init_cash[col]
+        target_risk = cash * risk_pct * risk_multiplier[col]
+
+        # Backfill value: first valid ATR in the column (1.0 if none)
+        last_atr = 1.0
+        for i in range(n_bars):
+            value = atr[i, col]
+            if value != 0 and not np.isnan(value):
+                last_atr = value
+                break
+
+        for i in range(n_bars):
+            value = atr[i, col]
+            if value != 0 and not np.isnan(value):
+                last_atr = value
+
+            stop = last_atr * atr_multiplier
+            size_risk = target_risk / stop
+            size_capital = cash / close[i, col]
+
+            if np.isnan(size_risk) or np.isnan(size_capital):
+                size = np.nan
+            else:
+                size = min(size_risk, size_capital)
+
+            out_constrained[i, col] = size == size_capital
+
+            risk = size * stop / cash
+            if np.isnan(risk):
+                risk = 0.0
+            out_risk[i, col] = min(max(risk, 0.0), 1.0)
+
+            if not np.isfinite(size) or size < 0:
+                size = 0.0
+            out_size[i, col] = size
+
+
+def calculate_position_size_atr_panel(
+    init_cash: Union[float, np.ndarray],
+    close: Union[pd.DataFrame, np.ndarray],
+    atr: Union[pd.DataFrame, np.ndarray],
+    atr_multiplier: float = 2.5,
+    risk_pct: float = 0.02,
+    risk_multiplier: Optional[Union[float, np.ndarray, pd.Series]] = None,
+    out: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+) -> Tuple:
+    """
+    Calculate ATR position sizes for many symbols at once (compiled).
+
+    Panel version of calculate_position_size_atr(): one Numba pass over
+    aligned (bars x symbols) arrays instead of several pandas passes per
+    symbol. Results match the Series version column by column.
+
+    Args:
+        init_cash: Account capital (scalar or one value per symbol)
+        close: Prices (bars x symbols), DataFrame or 2-D array
+        atr: ATR values aligned with close
+        atr_multiplier: Stop distance in ATR units (2.5 for ORB)
+        risk_pct: Risk per trade as decimal (0.02 = 2%)
+        risk_multiplier: Risk scale per symbol (scalar or one per symbol,
+            default 1.0). Multiplies risk_pct.
+        out: Optional preallocated (size, actual_risk, constrained) arrays
+            of shape (bars, symbols), float64/float64/bool, C-contiguous.
+            Reused across calls to avoid allocation.
+
+    Returns:
+        tuple: (position_size_shares, actual_risk_pct, constrained_flag)
+            DataFrames with close's index/columns if close is a DataFrame,
+            otherwise the output arrays
+
+    Raises:
+        ValueError: If shapes don't match or out buffers are invalid
+
+    Example:
+        >>> sizes, risks, constrained = calculate_position_size_atr_panel(
+        ...     init_cash=100000,
+        ...     close=closes,         # DataFrame, one column per symbol
+        ...     atr=atrs,             # aligned with closes
+        ...     risk_multiplier=np.array([1.0, 0.5, 1.0])
+        ... )
+    """
+    close_arr = np.asarray(close, dtype=np.float64)
+    atr_arr = np.asarray(atr, dtype=np.float64)
+
+    if close_arr.ndim == 1:
+        close_arr = close_arr[:, None]
+    if atr_arr.ndim == 1:
+        atr_arr = atr_arr[:, None]
+    if close_arr.ndim != 2 or close_arr.shape != atr_arr.shape:
+        raise ValueError(
+            f"close and atr must be aligned 2-D arrays. "
+            f"Got {close_arr.shape} and {atr_arr.shape}"
+        )
+
+    shape = close_arr.shape
+    n_cols = shape[1]
+    cash = np.ascontiguousarray(
+        np.broadcast_to(np.asarray(init_cash, dtype=np.float64), (n_cols,))
+    )
+    multiplier = np.ascontiguousarray(np.broadcast_to(
+        np.asarray(1.0 if risk_multiplier is None else risk_multiplier, dtype=np.float64),
+        (n_cols,)
+    ))
+
+    if out is None:
+        out = (np.empty(shape), np.empty(shape), np.empty(shape, dtype=np.bool_))
+    else:
+        expected = (np.float64, np.float64, np.bool_)
+        if len(out) != 3 or any(
+            o.shape != shape or o.dtype != dtype or not o.flags.c_contiguous
+            for o, dtype in zip(out, expected)
+        ):
+            raise ValueError(
+                f"out must be (float64, float64, bool) C-contiguous arrays of shape {shape}"
+            )
+
+    position_size_atr_nb(
+        cash,
+        np.ascontiguousarray(close_arr),
+        np.ascontiguousarray(atr_arr),
+        atr_multiplier,
+        risk_pct,
+        multiplier,
+        *out
+    )
+
+    if isinstance(close, pd.DataFrame):
+        return tuple(pd.DataFrame(o, index=close.index, columns=close.columns) for o in out)
+    return out
+
+
 def validate_position_size(
     position_size: Union[float, pd.Series],
     init_cash: float,
@@ -0,0 +1,246 @@
+"""
+Signal Cache for Strategy Backtests
+
+Memoizes generate_signals() output so repeated backtests over the same bars
+(capital sweeps, cost sweeps, re-running a scan) skip signal generation.
+
+Cache Key:
+- Fingerprint of the input bars: index, column names, and raw column values
+  (blake2b over the underlying buffers - no per-row Python work)
+- Strategy class name and config (config.model_dump_json())
+- Regime argument and any strategy-specific extras (e.g., ORB daily bars)
+
+Tiers:
+- Memory: size-bounded LRU (OrderedDict), always on
+- Disk: optional pickle files under cache_dir (survive process restarts)
+
+Usage:
+    >>> strategy.enable_signal_cache(max_entries=16)
+    >>> for capital in [10000, 25000, 50000]:
+    ...     pf = strategy.backtest(data, initial_capital=capital)  # signals generated once
+
+Note:
+    Cached signal Series are shared between calls. Treat them as read-only.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Hashable, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+def fingerprint_data(data: Union[pd.DataFrame, pd.Series, None]) -> str:
+    """
+    Fast content fingerprint of a DataFrame or Series.
+
+    Hashes index values, column labels, dtypes and raw column buffers.
+    Numeric columns are hashed directly from memory; other dtypes fall back
+    to pd.util.hash_pandas_object().
+
+    Args:
+        data: DataFrame or Series (None gives a fixed fingerprint)
+
+    Returns:
+        Hex digest string (32 chars)
+
+    Example:
+        >>> fingerprint_data(data_5min) == fingerprint_data(data_5min.copy())
+        True
+    """
+    h = hashlib.blake2b(digest_size=16)
+
+    if data is None:
+        h.update(b'None')
+        return h.hexdigest()
+
+    if isinstance(data, pd.Series):
+        data = data.to_frame()
+
+    h.update(str(data.shape).encode())
+    h.update(repr(list(data.columns)).encode())
+    h.update(_array_bytes(data.index))
+
+    for _, column in data.items():
+        h.update(str(column.dtype).encode())
+        h.update(_array_bytes(column))
+
+    return h.hexdigest()
+
+
+def _array_bytes(values: Union[pd.Index, pd.Series]) -> bytes:
+    """Raw bytes for numeric/datetime arrays, hashed values otherwise."""
+    if isinstance(values, pd.DatetimeIndex):
+        return str(values.tz).encode() + values.asi8.tobytes()
+
+    arr = np.asarray(values)
+    if arr.dtype.kind in 'biufcmM':
+        return np.ascontiguousarray(arr).tobytes()
+
+    return pd.util.hash_pandas_object(pd.Series(values), index=False).values.tobytes()
+
+
+class SignalCache:
+    """
+    Two-tier (memory LRU + optional disk) cache for strategy signals.
+
+    Attributes:
+        max_entries: Maximum signal sets held in memory
+        cache_dir: Directory for the disk tier (None = memory only)
+        hits: Memory hits
+        disk_hits: Disk hits (promoted to memory)
+        misses: Lookups that required signal generation
+
+    Example:
+        >>> cache = SignalCache(max_entries=32, cache_dir='.cache/signals')
+        >>> key = cache.make_key(data, strategy.config, 'ORBStrategy')
+        >>> signals = cache.get(key)
+        >>> if signals is None:
+        ...     signals = strategy.generate_signals(data)
+        ...     cache.put(key, signals)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 32,
+        cache_dir: Optional[Union[str, Path]] = None
+    ):
+        """
+        Initialize signal cache.
+
+        Args:
+            max_entries: Maximum entries in the memory tier (LRU eviction)
+            cache_dir: Optional directory for the persistent disk tier
+
+        Raises:
+            ValueError: If max_entries < 1
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._memory: 'OrderedDict[str, Dict[str, pd.Series]]' = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        data: pd.DataFrame,
+        config,
+        strategy_name: str,
+        regime: Optional[Hashable] = None,
+        extra: Tuple = ()
+    ) -> str:
+        """
+        Build a cache key from data fingerprint, config and call arguments.
+
+        Args:
+            data: Input bars passed to generate_signals()
+            config: Pydantic strategy config
+            strategy_name: Strategy class name (different classes never collide)
+            regime: Regime argument passed to generate_signals()
+            extra: Additional hashable state that affects signals
+
+        Returns:
+            Hex digest string
+        """
+        h = hashlib.blake2b(digest_size=16)
+        h.update(strategy_name.encode())
+        h.update(config.model_dump_json().encode())
+        h.update(repr(regime).encode())
+        h.update(repr(extra).encode())
+        h.update(fingerprint_data(data).encode())
+        return h.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, pd.Series]]:
+        """
+        Look up signals by key (memory first, then disk).
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Copy of the cached signals dict, or None on miss
+        """
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return dict(self._memory[key])
+
+        if self.cache_dir is not None:
+            path = self._disk_path(key)
+            if path.exists():
+                try:
+                    with open(path, 'rb') as f:
+                        signals = pickle.load(f)
+                except (OSError, pickle.UnpicklingError, EOFError):
+                    signals = None
+
+                if signals is not None:
+                    self.disk_hits += 1
+                    self._remember(key, signals)
+                    return dict(signals)
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, signals: Dict[str, pd.Series]) -> None:
+        """
+        Store signals in memory (and on disk if enabled).
+
+        Args:
+            key: Key from make_key()
+            signals: Dict returned by generate_signals()
+        """
+        self._remember(key, dict(signals))
+
+        if self.cache_dir is not None:
+            # Write to temp file then rename so readers never see partial files
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(signals, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, self._disk_path(key))
+            except OSError:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+    def clear(self, disk: bool = False) -> None:
+        """
+        Drop all memory entries (and disk entries if disk=True).
+
+        Args:
+            disk: Also delete pickle files in cache_dir
+        """
+        self._memory.clear()
+        if disk and self.cache_dir is not None:
+            for path in self.cache_dir.glob('*.pkl'):
+                path.unlink()
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._memory or (
+            self.cache_dir is not None and self._disk_path(key).exists()
+        )
+
+    def _remember(self, key: str, signals: Dict[str, pd.Series]) -> None:
+        """Insert into memory tier, evicting least recently used entries."""
+        self._memory[key] = signals
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pkl"